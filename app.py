@@ -451,17 +451,26 @@ import re
 import html as _html
 import traceback
 import logging
+import json
+import queue
+import atexit
+import time
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 log = logging.getLogger(__name__)
+# Hot-path diagnostics use lazy log.debug(); enable them with LOG_LEVEL=DEBUG
+log.setLevel(os.environ.get('LOG_LEVEL', 'INFO').upper())
 from dotenv import load_dotenv
 
 from flask import Flask, render_template, request, redirect, url_for, flash, session, jsonify, g, send_file, send_from_directory, Response
+from flask.logging import default_handler
 from flask_wtf.csrf import CSRFProtect, CSRFError, generate_csrf
-from functools import wraps
+from functools import wraps, lru_cache
 from datetime import datetime, date, timedelta, timezone
 from uuid import uuid4
 from decimal import Decimal, InvalidOperation
 from threading import Lock
+from concurrent.futures import ThreadPoolExecutor
 
 load_dotenv()
 from config import Config
@@ -501,7 +510,7 @@ def auto_notify_and_email(cursor, application_id, message, email_subject=None, e
     """
     Automatically create notification and send email for any system event.
     This ensures all events are automatically communicated to users.
-    Prevents duplicate notifications by checking if the same message already exists.
+    Duplicate notifications (same application and message) are skipped via the notifications unique key.
     Also prevents JSON responses from being saved as notifications.
     """
     try:
@@ -519,27 +528,12 @@ def auto_notify_and_email(cursor, application_id, message, email_subject=None, e
         except Exception as col_error:
             print(f"⚠️ Error checking notification columns: {col_error}")
         
-        # Check if notification already exists to prevent duplicates
-            cursor.execute(
-                '''
-                SELECT notification_id FROM notifications
-                WHERE application_id = %s AND message = %s
-                LIMIT 1
-                ''',
-                (application_id, message),
-            )
-        existing_notification = cursor.fetchone()
-        
-        if existing_notification:
-            print(f'⚠️ Duplicate notification detected for application {application_id}. Skipping notification creation and email to prevent duplicates.')
-            # Don't send email if notification already exists (prevents duplicate emails)
-            return
-        
-        # Automatically create notification in system (only if not duplicate)
+        # Create the notification in one statement; the (application_id, message_hash) unique key makes a
+        # repeated message a no-op. INSERT IGNORE reports rowcount 0 for that case, which gates the email.
         if 'sent_at' in notification_columns:
             cursor.execute(
                 '''
-                INSERT INTO notifications (application_id, message, sent_at, is_read)
+                INSERT IGNORE INTO notifications (application_id, message, sent_at, is_read)
                 VALUES (%s, %s, NOW(), 0)
                 ''',
                 (application_id, message),
@@ -547,11 +541,15 @@ def auto_notify_and_email(cursor, application_id, message, email_subject=None, e
         else:
             cursor.execute(
                 '''
-                INSERT INTO notifications (application_id, message, is_read)
+                INSERT IGNORE INTO notifications (application_id, message, is_read)
                 VALUES (%s, %s, 0)
                 ''',
                 (application_id, message),
             )
+        if cursor.rowcount == 0:
+            print(f'⚠️ Duplicate notification detected for application {application_id}. Skipping notification creation and email to prevent duplicates.')
+            # Don't send email if notification already exists (prevents duplicate emails)
+            return
         print(f'✅ Notification created in system for application {application_id}: {message[:50]}...')
         
         # Email notifications are always enabled (system settings removed)
@@ -785,10 +783,39 @@ APPLICATION_STATUS_LABELS = {
     'interview': 'Interviewed',
 }
 APPLICATION_STATUS_FLOW = ('pending', 'scheduled', 'interviewed', 'hired', 'rejected')
+# Applicant-facing status filters as ready-made (WHERE fragment, params) pairs covering legacy values;
+# unknown filters fall back to APPLICANT_STATUS_FILTER_DEFAULT with the raw status as the only param.
+# {status} is the display status expression (see _application_status_expr)
+APPLICANT_STATUS_FILTERS = {
+    'pending': ('{status} IN (%s,%s,%s,%s)', ('pending', 'reviewed', 'applied', 'under_review')),
+    'scheduled': ('{status} = %s', ('scheduled',)),
+    'interviewed': ('{status} IN (%s,%s)', ('interviewed', 'interview')),
+    'hired': ('{status} IN (%s,%s)', ('hired', 'accepted')),
+    'rejected': ('{status} = %s', ('rejected',)),  # display_status already folds legacy 'withdrawn' into 'rejected'
+}
+APPLICANT_STATUS_FILTER_DEFAULT = '{status} = %s'
 
 
 app = Flask(__name__)
 app.config.from_object(Config)
+# `log` is the app logger: hand records to a queue so stream writes happen on a listener thread,
+# not on the request thread (debug records are still dropped by the level check before this)
+_log_queue = queue.SimpleQueue()
+# Failed applications are kept in instance/apply_error.log through one long-lived, rotating handler
+apply_log = log.getChild('apply')
+os.makedirs(app.instance_path, exist_ok=True)
+_apply_error_handler = RotatingFileHandler(
+    os.path.join(app.instance_path, 'apply_error.log'), maxBytes=5_000_000, backupCount=3, encoding='utf-8', delay=True
+)
+_apply_error_handler.setLevel(logging.ERROR)
+_apply_error_handler.addFilter(logging.Filter(apply_log.name))
+_apply_error_handler.setFormatter(logging.Formatter('--- APPLY ERROR %(asctime)s ---\n%(message)s\n--- END APPLY ERROR ---'))
+_log_listener = QueueListener(_log_queue, *(log.handlers or [default_handler]), _apply_error_handler, respect_handler_level=True)
+log.handlers = [QueueHandler(_log_queue)]
+_log_listener.start()
+atexit.register(_log_listener.stop)
+# Outgoing mail runs on a small worker pool so SMTP handshakes never hold up a response
+_email_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='mailer')
 csrf = CSRFProtect(app)
 # Configure CSRF settings - Disable in development to avoid token mismatch issues with rate limiting
 # CSRF configuration: enable by default, allow override via env var
@@ -820,7 +847,66 @@ app.config['UPLOAD_FOLDER'] = _upload_path
 
 _schema_lock = Lock()
 _schema_checked = False
+_schema_last_attempt = 0.0
+SCHEMA_RETRY_SECONDS = 60
 JOB_COLUMNS = set()
+INTERVIEW_STATUS_VALUES = ('scheduled', 'confirmed', 'rescheduled', 'completed', 'cancelled', 'no_show')
+_interview_enum_checked = False
+# Optional interviews columns, detected once by ensure_schema_compatibility()
+HAS_INTERVIEW_NOTES_COLUMN = False
+HAS_INTERVIEW_LOCATION_COLUMN = False
+# notifications.applicant_id is kept in sync by an insert trigger (set by ensure_schema_compatibility());
+# when False, applicant notification queries recover the owner through applications instead
+HAS_NOTIFICATION_APPLICANT_SYNC = False
+# notifications.message_type codes, derived from the message prefix by a stored generated column so
+# every insert site gets the right type without having to set it
+NOTIFICATION_MESSAGE_TYPE_DEFINITION = (
+    "TINYINT AS (CASE"
+    " WHEN message LIKE 'You applied for%' THEN 1"
+    " WHEN message LIKE 'Your application status%' THEN 2"
+    " WHEN message LIKE 'Congratulations! You have been hired%' THEN 3"
+    " ELSE 0 END) STORED"
+)
+APPLICANT_NOTIFICATION_TYPES = (1, 2, 3)
+# applications.display_status shows legacy 'withdrawn' rows as 'rejected' through a stored generated column,
+# so listings can filter on an index while the stored status keeps the distinction for manual review
+APPLICATION_DISPLAY_STATUS_DEFINITION = "VARCHAR(20) AS (IF(status = 'withdrawn', 'rejected', status)) STORED"
+# table name -> frozenset of column names (empty when the table is missing), filled lazily by _table_columns()
+_SCHEMA_CACHE = {}
+# (table name, index name) -> bool, filled lazily by _has_index()
+_INDEX_CACHE = {}
+
+
+def send_email_async(recipient, subject, body, html_body=None):
+    """Queue an email on the background mail pool and return immediately (send_email logs its own failures)."""
+    return _email_executor.submit(send_email, recipient, subject, body, html_body)
+
+
+# Active HR mailboxes change rarely; new-application emails reuse the list for a minute
+HR_RECIPIENTS_TTL_SECONDS = 60
+_hr_recipients_cache = {'emails': (), 'expires': 0.0}
+
+
+def _hr_recipients(cursor, ttl=HR_RECIPIENTS_TTL_SECONDS):
+    """Return the distinct emails of active HR users, querying at most once per ttl seconds."""
+    now = time.monotonic()
+    if _hr_recipients_cache['expires'] <= now:
+        cursor.execute(
+            '''
+            SELECT DISTINCT u.email
+            FROM users u
+            JOIN admins a ON a.user_id = u.user_id
+            WHERE u.user_type = 'hr' AND u.is_active = 1 AND a.is_active = 1
+              AND u.email IS NOT NULL AND u.email <> ''
+            '''
+        )
+        rows = cursor.fetchall() or []
+        # Swap in a complete entry so concurrent requests never see a half-built list
+        _hr_recipients_cache.update(
+            emails=tuple(row.get('email') if isinstance(row, dict) else row[0] for row in rows),
+            expires=now + ttl,
+        )
+    return _hr_recipients_cache['emails']
 
 
 def immediate_redirect(location, code=302):
@@ -836,6 +922,14 @@ def immediate_redirect(location, code=302):
     return response
 
 
+_JSON_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+
+def json_response(payload, code=200):
+    """Serialize a small, plain-typed payload straight into a JSON Response (no jsonify provider lookup)."""
+    return Response(_JSON_ENCODER.encode(payload), status=code, mimetype='application/json')
+
+
 def _update_job_columns(cursor):
     """Refresh the cached set of columns available on the jobs table."""
     global JOB_COLUMNS
@@ -852,6 +946,65 @@ def _update_job_columns(cursor):
     return JOB_COLUMNS
 
 
+def _table_columns(cursor, table_name):
+    """Return the cached column set for a table, running SHOW COLUMNS only on a cache miss."""
+    columns = _SCHEMA_CACHE.get(table_name)
+    if columns is None:
+        try:
+            cursor.execute(f'SHOW COLUMNS FROM `{table_name}`')
+            rows = cursor.fetchall() or []
+            columns = frozenset(
+                row.get('Field') if isinstance(row, dict) else row[0]
+                for row in rows
+            )
+        except Exception as exc:
+            if getattr(exc, 'errno', None) != 1146:
+                # Unknown failure - don't cache, let the next request probe again
+                log.warning('⚠️ Failed to inspect %s table columns: %s', table_name, exc)
+                return frozenset()
+            columns = frozenset()
+        _SCHEMA_CACHE[table_name] = columns
+    return columns
+
+
+def _has_column(cursor, table_name, column_name):
+    """Return True if the table has the given column (cached)."""
+    return column_name in _table_columns(cursor, table_name)
+
+
+def _table_exists(cursor, table_name):
+    """Return True if the table exists (cached)."""
+    return bool(_table_columns(cursor, table_name))
+
+
+def _has_index(cursor, table_name, index_name):
+    """Return True if the table has the named index (cached; a failed probe is not cached)."""
+    key = (table_name, index_name)
+    present = _INDEX_CACHE.get(key)
+    if present is None:
+        try:
+            cursor.execute(f'SHOW INDEX FROM `{table_name}` WHERE Key_name = %s', (index_name,))
+            present = bool(cursor.fetchall())
+        except Exception as exc:
+            log.warning('⚠️ Failed to inspect %s.%s index: %s', table_name, index_name, exc)
+            return False
+        _INDEX_CACHE[key] = present
+    return present
+
+
+def _invalidate_schema_cache(table_name=None, exc=None):
+    """Forget cached columns/indexes after DDL, or when a query hits an unknown column/table error."""
+    if exc is not None and getattr(exc, 'errno', None) not in (1054, 1146):
+        return
+    if table_name is None:
+        _SCHEMA_CACHE.clear()
+        _INDEX_CACHE.clear()
+    else:
+        _SCHEMA_CACHE.pop(table_name, None)
+        for key in [key for key in _INDEX_CACHE if key[0] == table_name]:
+            _INDEX_CACHE.pop(key, None)
+
+
 def job_column(preferred, *alternatives):
     """Return the present column name on jobs table, preferring the modern schema."""
     for candidate in (preferred,) + alternatives:
@@ -880,7 +1033,8 @@ def job_column_name(preferred, alternatives=None, default=None):
 
 def ensure_schema_compatibility():
     """Best-effort guard to align dynamic queries with the current MySQL schema."""
-    global _schema_checked
+    global _schema_checked, _interview_enum_checked, HAS_INTERVIEW_NOTES_COLUMN, HAS_INTERVIEW_LOCATION_COLUMN
+    global HAS_NOTIFICATION_APPLICANT_SYNC
     if _schema_checked:
         return
 
@@ -936,7 +1090,7 @@ def ensure_schema_compatibility():
         def ensure_table(cur, table_name, create_sql):
             """Ensure a table exists, create it if it doesn't."""
             # Whitelist allowed table names
-            ALLOWED_TABLES = {'positions', 'application_attachments', 'activity_log_deletions'}
+            ALLOWED_TABLES = {'positions', 'application_attachments', 'activity_log_deletions', 'saved_jobs'}
             if table_name not in ALLOWED_TABLES:
                 print(f'⚠️ Invalid table name: {table_name}')
                 return False
@@ -944,7 +1098,8 @@ def ensure_schema_compatibility():
                 cur.execute(f"SHOW TABLES LIKE %s", (table_name,))
                 if cur.fetchone():
                     return False
-                dangerous_pattern = re.compile(r'\b(DROP|DELETE|TRUNCATE|EXEC(?:UTE)?)\b', re.IGNORECASE)
+                # Foreign key actions ("ON DELETE CASCADE") are allowed; a bare DELETE is not
+                dangerous_pattern = re.compile(r'\b(DROP|(?<!ON )DELETE|TRUNCATE|EXEC(?:UTE)?)\b', re.IGNORECASE)
                 if dangerous_pattern.search(create_sql or ''):
                     print(f'⚠️ Dangerous keyword in table creation SQL')
                     return False
@@ -954,6 +1109,27 @@ def ensure_schema_compatibility():
                 print(f'⚠️ Failed to ensure table {table_name}: {e}')
                 return False
 
+        def ensure_index(cur, table_name, index_name, columns, unique=False):
+            """Ensure a secondary index exists, create it if it doesn't."""
+            # Whitelist allowed table names
+            ALLOWED_TABLES = {'applications', 'interviews', 'notifications', 'application_attachments', 'saved_jobs'}
+            if table_name not in ALLOWED_TABLES:
+                print(f'⚠️ Invalid table name for index: {table_name}')
+                return False
+            if not index_name.replace('_', '').isalnum() or not all(c.replace('_', '').isalnum() for c in columns):
+                print(f'⚠️ Invalid index definition: {index_name}')
+                return False
+            try:
+                cur.execute(f"SHOW INDEX FROM `{table_name}` WHERE Key_name = %s", (index_name,))
+                if cur.fetchall():
+                    return False
+                column_list = ', '.join(f'`{c}`' for c in columns)
+                cur.execute(f"CREATE {'UNIQUE ' if unique else ''}INDEX `{index_name}` ON `{table_name}` ({column_list})")
+                return True
+            except Exception as e:
+                print(f'⚠️ Failed to ensure index {table_name}.{index_name}: {e}')
+                return False
+
         try:
             cursor = db.cursor()
             _update_job_columns(cursor)
@@ -973,29 +1149,39 @@ def ensure_schema_compatibility():
                 pass
             updates_applied |= ensure_column(cursor, 'interviews', 'interview_mode', "VARCHAR(50) NULL DEFAULT NULL")
             
-            # Ensure interview status column exists
-            # Ensure status column exists with all needed values including 'confirmed' and 'rescheduled'
-            try:
-                cursor.execute("SHOW COLUMNS FROM interviews LIKE 'status'")
-                status_col = cursor.fetchone()
-                if status_col:
-                    # Check if 'confirmed' is in the enum
-                    col_type = status_col.get('Type', '') if isinstance(status_col, dict) else str(status_col[1]) if len(status_col) > 1 else ''
-                    if 'confirmed' not in col_type.lower():
-                        # Modify enum to include 'confirmed' and 'rescheduled'
-                        try:
-                            cursor.execute("ALTER TABLE interviews MODIFY COLUMN status ENUM('scheduled', 'confirmed', 'rescheduled', 'completed', 'cancelled', 'no_show') DEFAULT 'scheduled'")
+            # Ensure interviews.status enum holds every value the applicant/HR actions write.
+            # Verified once per process here so request handlers never issue DDL.
+            if not _interview_enum_checked:
+                status_definition = "ENUM({}) DEFAULT 'scheduled'".format(
+                    ', '.join(f"'{value}'" for value in INTERVIEW_STATUS_VALUES)
+                )
+                try:
+                    cursor.execute("""
+                        SELECT COLUMN_TYPE
+                        FROM INFORMATION_SCHEMA.COLUMNS
+                        WHERE TABLE_SCHEMA = DATABASE()
+                        AND TABLE_NAME = 'interviews'
+                        AND COLUMN_NAME = 'status'
+                    """)
+                    status_col = cursor.fetchone()
+                    if status_col:
+                        col_type = str(status_col[0]).lower()
+                        missing_values = [value for value in INTERVIEW_STATUS_VALUES if f"'{value}'" not in col_type]
+                        if missing_values:
+                            cursor.execute(f"ALTER TABLE interviews MODIFY COLUMN status {status_definition}")
                             updates_applied = True
-                            print('✅ Added "confirmed" and "rescheduled" to interviews.status enum')
-                        except Exception as enum_err:
-                            print(f'⚠️ Could not modify status enum: {enum_err}')
-                else:
-                    # Column doesn't exist, create it
-                    updates_applied |= ensure_column(cursor, 'interviews', 'status', "ENUM('scheduled', 'confirmed', 'rescheduled', 'completed', 'cancelled', 'no_show') DEFAULT 'scheduled'")
-            except Exception as status_check_err:
-                print(f'⚠️ Error checking status column: {status_check_err}')
-                # Fallback: try to ensure column exists
-                updates_applied |= ensure_column(cursor, 'interviews', 'status', "ENUM('scheduled', 'confirmed', 'rescheduled', 'completed', 'cancelled', 'no_show') DEFAULT 'scheduled'")
+                            print(f'✅ Added {missing_values} to interviews.status enum')
+                    else:
+                        updates_applied |= ensure_column(cursor, 'interviews', 'status', status_definition)
+                    _interview_enum_checked = True
+                except Exception as status_check_err:
+                    print(f'⚠️ Error checking interviews.status enum: {status_check_err}')
+
+            # Cache optional interviews columns so request fallbacks don't probe the schema by exception
+            cursor.execute("SHOW COLUMNS FROM interviews")
+            interview_columns = {row[0] for row in cursor.fetchall() or []}
+            HAS_INTERVIEW_NOTES_COLUMN = 'notes' in interview_columns
+            HAS_INTERVIEW_LOCATION_COLUMN = 'location' in interview_columns
             
             # Ensure applicants table has required columns (created_at, last_login, phone_number)
             updates_applied |= ensure_column(cursor, 'applicants', 'created_at', "DATETIME DEFAULT CURRENT_TIMESTAMP")
@@ -1026,6 +1212,21 @@ def ensure_schema_compatibility():
             except Exception as enum_error:
                 print(f'⚠️ Could not update applications.status enum: {enum_error}')
                 # Continue - enum might already be correct or table might not exist yet
+
+            # Legacy 'withdrawn' applications are shown as 'rejected': a generated display_status column does
+            # the folding (stored rows are never rewritten) and the applicant list/analytics queries filter on it
+            try:
+                updates_applied |= ensure_column(
+                    cursor,
+                    'applications',
+                    'display_status',
+                    APPLICATION_DISPLAY_STATUS_DEFINITION
+                )
+                updates_applied |= ensure_index(
+                    cursor, 'applications', 'idx_apps_applicant_display_status', ('applicant_id', 'display_status', 'applied_at')
+                )
+            except Exception as display_status_error:
+                print(f'⚠️ Could not ensure applications display_status: {display_status_error}')
             
             # Ensure viewed_at column exists on applications table
             updates_applied |= ensure_column(cursor, 'applications', 'viewed_at', "DATETIME NULL DEFAULT NULL")
@@ -1056,10 +1257,29 @@ def ensure_schema_compatibility():
                     resume_id INT NOT NULL,
                     created_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
                     INDEX (application_id),
-                    INDEX (resume_id)
+                    INDEX (resume_id),
+                    UNIQUE KEY uniq_app_resume (application_id, resume_id)
                 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
             '''
             updates_applied |= ensure_table(cursor, 'application_attachments', attachments_sql)
+            # One link per (application, resume): apply_to_job links files with INSERT IGNORE instead of
+            # checking for existing rows first
+            try:
+                cursor.execute("SHOW INDEX FROM application_attachments WHERE Key_name = 'uniq_app_resume'")
+                if not cursor.fetchall():
+                    # Drop duplicate links left by the old check-then-insert flow, keeping the oldest row
+                    cursor.execute('''
+                        DELETE aa1 FROM application_attachments aa1
+                        JOIN application_attachments aa2
+                          ON aa1.application_id = aa2.application_id
+                         AND aa1.resume_id = aa2.resume_id
+                         AND aa1.attachment_id > aa2.attachment_id
+                    ''')
+                    updates_applied |= ensure_index(
+                        cursor, 'application_attachments', 'uniq_app_resume', ('application_id', 'resume_id'), unique=True
+                    )
+            except Exception as attach_key_err:
+                print(f'⚠️ Could not ensure application_attachments unique key: {attach_key_err}')
 
             # Ensure activity_log_deletions table exists to record bulk-deletes
             activity_deletions_sql = '''
@@ -1073,6 +1293,49 @@ def ensure_schema_compatibility():
             '''
             updates_applied |= ensure_table(cursor, 'activity_log_deletions', activity_deletions_sql)
 
+            # Ensure saved_jobs table exists (save_job only inserts into it)
+            saved_jobs_sql = '''
+                CREATE TABLE IF NOT EXISTS saved_jobs (
+                    saved_job_id INT AUTO_INCREMENT PRIMARY KEY,
+                    applicant_id INT NOT NULL,
+                    job_id INT NOT NULL,
+                    saved_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE KEY unique_saved_job (applicant_id, job_id),
+                    FOREIGN KEY (applicant_id) REFERENCES applicants(applicant_id) ON DELETE CASCADE,
+                    FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
+            '''
+            updates_applied |= ensure_table(cursor, 'saved_jobs', saved_jobs_sql)
+            # save_job relies on this key for its idempotent INSERT ... ON DUPLICATE KEY UPDATE
+            # (tables created by init_database.py predate it)
+            try:
+                cursor.execute("SHOW INDEX FROM saved_jobs WHERE Key_name = 'unique_saved_job'")
+                if not cursor.fetchall():
+                    # Drop duplicate saves, keeping the oldest row
+                    cursor.execute('''
+                        DELETE sj1 FROM saved_jobs sj1
+                        JOIN saved_jobs sj2
+                          ON sj1.applicant_id = sj2.applicant_id
+                         AND sj1.job_id = sj2.job_id
+                         AND sj1.saved_job_id > sj2.saved_job_id
+                    ''')
+                    updates_applied |= ensure_index(
+                        cursor, 'saved_jobs', 'unique_saved_job', ('applicant_id', 'job_id'), unique=True
+                    )
+            except Exception as saved_key_err:
+                print(f'⚠️ Could not ensure saved_jobs unique key: {saved_key_err}')
+            # Saved jobs page reads one applicant's rows newest first
+            updates_applied |= ensure_index(cursor, 'saved_jobs', 'idx_saved_jobs_applicant_date', ('applicant_id', 'saved_at'))
+
+            # Composite indexes for the applicant applications list (filter by applicant/status, newest first)
+            # and the latest-interview-per-application lookups (seek instead of filesort)
+            updates_applied |= ensure_index(cursor, 'applications', 'idx_apps_applicant_status_date', ('applicant_id', 'status', 'applied_at'))
+            updates_applied |= ensure_index(cursor, 'interviews', 'idx_interviews_app_date', ('application_id', 'scheduled_date'))
+            # One application per applicant and job: apply_to_job inserts optimistically and treats a
+            # duplicate-key error as "already applied" instead of checking with a SELECT first
+            # (creation fails and is logged while historical duplicate rows still exist)
+            updates_applied |= ensure_index(cursor, 'applications', 'uq_applicant_job', ('applicant_id', 'job_id'), unique=True)
+
             updates_applied |= ensure_column(
                 cursor,
                 'notifications',
@@ -1085,6 +1348,81 @@ def ensure_schema_compatibility():
                 'is_read',
                 'TINYINT(1) NOT NULL DEFAULT 0'
             )
+            # Unread counts and mark-all-read join applications -> notifications on application_id and filter is_read;
+            # applications(applicant_id, ...) is already covered by idx_apps_applicant_status_date
+            updates_applied |= ensure_index(cursor, 'notifications', 'idx_notifications_app_read', ('application_id', 'is_read'))
+            # Denormalized owner: applicant notification reads/updates filter notifications alone instead of
+            # joining applications. A BEFORE INSERT trigger fills it for every insert site; existing rows are backfilled.
+            try:
+                updates_applied |= ensure_column(cursor, 'notifications', 'applicant_id', 'INT NULL DEFAULT NULL')
+                updates_applied |= ensure_index(
+                    cursor, 'notifications', 'idx_notifications_applicant_read', ('applicant_id', 'is_read')
+                )
+                cursor.execute(
+                    'SELECT 1 FROM information_schema.TRIGGERS WHERE TRIGGER_SCHEMA = DATABASE() AND TRIGGER_NAME = %s',
+                    ('trg_notifications_applicant',),
+                )
+                if not cursor.fetchall():
+                    cursor.execute('''
+                        CREATE TRIGGER trg_notifications_applicant BEFORE INSERT ON notifications
+                        FOR EACH ROW SET NEW.applicant_id = COALESCE(
+                            NEW.applicant_id,
+                            (SELECT a.applicant_id FROM applications a WHERE a.application_id = NEW.application_id)
+                        )
+                    ''')
+                    updates_applied = True
+                cursor.execute('''
+                    UPDATE notifications n
+                    JOIN applications a ON n.application_id = a.application_id
+                    SET n.applicant_id = a.applicant_id
+                    WHERE n.applicant_id IS NULL
+                ''')
+                if cursor.rowcount:
+                    print(f'✅ Backfilled applicant_id on {cursor.rowcount} notification(s)')
+                HAS_NOTIFICATION_APPLICANT_SYNC = True
+            except Exception as notif_owner_err:
+                HAS_NOTIFICATION_APPLICANT_SYNC = False
+                print(f'⚠️ Could not sync notifications.applicant_id: {notif_owner_err}')
+            # One notification per (application, message): a hashed generated column keeps the unique key
+            # small, and lets inserts dedupe with ON DUPLICATE KEY instead of a SELECT round trip
+            try:
+                updates_applied |= ensure_column(
+                    cursor,
+                    'notifications',
+                    'message_hash',
+                    'BINARY(16) AS (UNHEX(MD5(message))) STORED'
+                )
+                cursor.execute("SHOW INDEX FROM notifications WHERE Key_name = 'uniq_notifications_app_message'")
+                if not cursor.fetchall():
+                    try:
+                        # Drop exact duplicates left by the old check-then-insert race, keeping the oldest row
+                        cursor.execute('''
+                            DELETE n1 FROM notifications n1
+                            JOIN notifications n2
+                              ON n1.application_id = n2.application_id
+                             AND n1.message_hash = n2.message_hash
+                             AND n1.notification_id > n2.notification_id
+                        ''')
+                    except Exception as dedupe_err:
+                        print(f'⚠️ Could not remove duplicate notifications: {dedupe_err}')
+                    updates_applied |= ensure_index(
+                        cursor, 'notifications', 'uniq_notifications_app_message', ('application_id', 'message_hash'), unique=True
+                    )
+            except Exception as notif_key_err:
+                print(f'⚠️ Could not ensure notifications dedupe key: {notif_key_err}')
+            # Applicant notification center filters on message_type instead of three prefix LIKEs over message
+            try:
+                updates_applied |= ensure_column(
+                    cursor,
+                    'notifications',
+                    'message_type',
+                    NOTIFICATION_MESSAGE_TYPE_DEFINITION
+                )
+                updates_applied |= ensure_index(
+                    cursor, 'notifications', 'idx_notifications_app_type_sent', ('application_id', 'message_type', 'sent_at')
+                )
+            except Exception as notif_type_err:
+                print(f'⚠️ Could not ensure notifications message_type: {notif_type_err}')
             # Ensure last login/logout columns exist
             updates_applied |= ensure_column(
                 cursor,
@@ -1171,6 +1509,13 @@ def ensure_schema_compatibility():
                 'file_type',
                 "VARCHAR(50) NOT NULL DEFAULT 'resume'"
             )
+            # Upload size recorded at insert time so resume listings don't stat every file
+            updates_applied |= ensure_column(
+                cursor,
+                'resumes',
+                'file_size_bytes',
+                'BIGINT NULL DEFAULT NULL'
+            )
 
             if updates_applied:
                 try:
@@ -1198,6 +1543,8 @@ def ensure_schema_compatibility():
 
         if success:
             _schema_checked = True
+            # Columns may have been added above; re-probe lazily
+            _invalidate_schema_cache()
     except Exception as outer_err:
         # Handle any errors in lock acquisition or early returns
         if lock_acquired:
@@ -1209,25 +1556,42 @@ def ensure_schema_compatibility():
         log.exception(f'⚠️ Schema compatibility outer error: {outer_err}')
 
 
+@app.before_request
+def ensure_schema_once():
+    """Run the schema compatibility check once per process, ahead of the request handlers.
+
+    Failed attempts (e.g. MySQL not up yet) are retried at most every SCHEMA_RETRY_SECONDS.
+    """
+    global _schema_last_attempt
+    if _schema_checked or request.endpoint == 'static':
+        return
+    now = time.monotonic()
+    if now - _schema_last_attempt < SCHEMA_RETRY_SECONDS:
+        return
+    _schema_last_attempt = now
+    ensure_schema_compatibility()
+
+
+@lru_cache(maxsize=4096)
+def _human_timestamp(value):
+    """Format a datetime/date/ISO string once; list views repeat the same timestamps on every render."""
+    if isinstance(value, (datetime, date)):
+        dt_value = value if isinstance(value, datetime) else datetime.combine(value, datetime.min.time())
+        return dt_value.strftime('%b %d, %Y %I:%M %p')
+    try:
+        # One ISO parse covers 'YYYY-MM-DD', 'YYYY-MM-DD HH:MM[:SS[.ffffff]]' and the 'T' separator
+        return datetime.fromisoformat(value).strftime('%b %d, %Y %I:%M %p')
+    except ValueError:
+        # Not a timestamp - show the raw value
+        return value or ''
+
+
 # Register template filters
 @app.template_filter('format_human_datetime')
 def format_human_datetime_filter(value):
     """Produce a human-readable timestamp in 12-hour format (AM/PM)."""
-    if isinstance(value, (datetime, date)):
-        dt_value = value if isinstance(value, datetime) else datetime.combine(value, datetime.min.time())
-        return dt_value.strftime('%b %d, %Y %I:%M %p')
-    elif isinstance(value, str):
-        try:
-            # Try parsing common datetime formats
-            for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d', '%Y-%m-%d %H:%M']:
-                try:
-                    dt_value = datetime.strptime(value, fmt)
-                    return dt_value.strftime('%b %d, %Y %I:%M %p')
-                except ValueError:
-                    continue
-        except Exception:
-            # Ignore parse errors
-            pass
+    if isinstance(value, (datetime, date, str)):
+        return _human_timestamp(value)
     return value or ''
 
 
@@ -2252,23 +2616,32 @@ def hr_notifications():
         cursor.close()
 
 
+# Archived lists only change on archive/restore/delete; those handlers clear this cache, the TTL
+# bounds staleness from other status changes and from other worker processes
+ARCHIVED_APPLICANTS_TTL_SECONDS = 60
+_archived_applicants_cache = {}
+
+
+def _invalidate_archived_applicants_cache():
+    """Forget every cached archived list (admin and per-branch views overlap)."""
+    _archived_applicants_cache.clear()
+
+
 def fetch_archived_applicants_data():
     """Helper: return (archived_list, branches_list) for archived applicants pages."""
+    branch_id = get_branch_scope(get_current_user())
+    cached = _archived_applicants_cache.get(branch_id)
+    if cached and cached[0] > time.monotonic():
+        return cached[1]
+
     db = get_db()
     if not db:
         return ([], [])
 
     cursor = db.cursor(dictionary=True)
     try:
-        user = get_current_user()
-        branch_id = get_branch_scope(user)
         # Determine archiving strategy (robust): consider status values and archived_at column
-        try:
-            cursor.execute('SHOW COLUMNS FROM applications')
-            cols = {row.get('Field') for row in cursor.fetchall() or []}
-            has_archived_at = 'archived_at' in cols
-        except Exception:
-            has_archived_at = False
+        has_archived_at = _has_column(cursor, 'applications', 'archived_at')
 
         # Build a resilient WHERE clause that handles legacy values and schema differences:
         # - status values (case-insensitive) like 'archived', 'removed', 'deleted'
@@ -2310,6 +2683,7 @@ def fetch_archived_applicants_data():
             row['archived_at'] = format_human_datetime(row.get('archived_at')) if row.get('archived_at') else None
 
         branches = fetch_branches()
+        _archived_applicants_cache[branch_id] = (time.monotonic() + ARCHIVED_APPLICANTS_TTL_SECONDS, (archived, branches))
         return (archived, branches)
     finally:
         try:
@@ -3627,21 +4001,8 @@ def to_iso(value):
 
 def format_human_datetime(value):
     """Produce a human-readable timestamp in 12-hour format (AM/PM)."""
-    if isinstance(value, (datetime, date)):
-        dt_value = value if isinstance(value, datetime) else datetime.combine(value, datetime.min.time())
-        return dt_value.strftime('%b %d, %Y %I:%M %p')
-    elif isinstance(value, str):
-        try:
-            # Try parsing common datetime formats
-            for fmt in ['%Y-%m-%d %H:%M:%S', '%Y-%m-%d %H:%M:%S.%f', '%Y-%m-%d', '%Y-%m-%d %H:%M']:
-                try:
-                    dt_value = datetime.strptime(value, fmt)
-                    return dt_value.strftime('%b %d, %Y %I:%M %p')
-                except ValueError:
-                    continue
-        except Exception:
-            # Ignore parse errors
-            pass
+    if isinstance(value, (datetime, date, str)):
+        return _human_timestamp(value)
     return value or ''
 
 
@@ -3728,21 +4089,6 @@ def create_admin_notification(cursor, message, application_id=None):
         if 'message' not in columns:
             return
         
-        # Check if notification already exists to prevent duplicates
-        if application_id is not None and 'application_id' in columns:
-            cursor.execute(
-                '''
-                SELECT notification_id FROM notifications
-                WHERE application_id = %s AND message = %s
-                LIMIT 1
-                ''',
-                (application_id, message)
-            )
-            existing_notification = cursor.fetchone()
-            if existing_notification:
-                # Notification already exists, skip creation
-                return
-        
         fields = []
         values = []
         params = []
@@ -3763,7 +4109,11 @@ def create_admin_notification(cursor, message, application_id=None):
             fields.append('is_read')
             values.append('0')
         
-        sql = f"INSERT INTO notifications ({', '.join(fields)}) VALUES ({', '.join(values)})"
+        # Duplicates (same application_id + message) are absorbed by the unique notifications key
+        sql = (
+            f"INSERT INTO notifications ({', '.join(fields)}) VALUES ({', '.join(values)}) "
+            "ON DUPLICATE KEY UPDATE notification_id = notification_id"
+        )
         cursor.execute(sql, tuple(params))
     except Exception as notify_err:
         print(f'⚠️ Notification insert error: {notify_err}')
@@ -4278,8 +4628,7 @@ def fetch_open_jobs(filters=None, applicant_id=None):
         if db_check:
             cursor_check = db_check.cursor()
             try:
-                cursor_check.execute("SHOW TABLES LIKE 'saved_jobs'")
-                if cursor_check.fetchone():
+                if _table_exists(cursor_check, 'saved_jobs'):
                     # Table exists, use the join
                     saved_jobs_table_exists = True
                     # Filter by saved jobs only if saved_only filter is set
@@ -5716,6 +6065,67 @@ def applicant_dashboard():
         return render_template('applicant/dashboard.html', dashboard=empty_dashboard)
 
 
+def _application_status_expr(cursor):
+    """Display status of applications `a`: the generated column, or the same fold inline on older schemas."""
+    if _has_column(cursor, 'applications', 'display_status'):
+        return 'a.display_status'
+    return "IF(a.status = 'withdrawn', 'rejected', a.status)"
+
+
+@lru_cache(maxsize=16)
+def _applicant_applications_sql(status_sql, job_title_expr, has_location, status_expr='a.display_status'):
+    """Build the applicant applications SELECT for one filter/schema variant; cached per process."""
+    where_sql = 'a.applicant_id = %s'
+    if status_sql:
+        where_sql += f' AND {status_sql}'
+    location_expr = (
+        '(SELECT location FROM interviews WHERE application_id = a.application_id ORDER BY scheduled_date DESC LIMIT 1)'
+        if has_location else 'NULL'
+    )
+    # Interviews are read through per-application subqueries and jobs/branches are joined on their
+    # primary keys, so the query yields exactly one row per application (no DISTINCT/dedup needed)
+    return f'''
+            SELECT a.application_id,
+                   {status_expr} AS status,
+                   a.applied_at,
+                   a.viewed_at,
+                   j.job_id,
+                   {job_title_expr} AS job_title,
+                   COALESCE(b.branch_name, 'Unassigned') AS branch_name,
+                   {job_title_expr} AS position_title,
+                   (SELECT interview_id FROM interviews WHERE application_id = a.application_id ORDER BY scheduled_date DESC LIMIT 1) AS interview_id,
+                   (SELECT scheduled_date FROM interviews WHERE application_id = a.application_id ORDER BY scheduled_date DESC LIMIT 1) AS scheduled_date,
+                   COALESCE((SELECT interview_mode FROM interviews WHERE application_id = a.application_id ORDER BY scheduled_date DESC LIMIT 1), 'in-person') AS interview_mode,
+                   {location_expr} AS interview_location
+            FROM applications a
+            JOIN jobs j ON a.job_id = j.job_id
+            LEFT JOIN branches b ON j.branch_id = b.branch_id
+            WHERE {where_sql}
+            ORDER BY a.applied_at DESC
+            '''
+
+
+def _format_applicant_application(app):
+    """Shape one applicant_applications row for the template (keys are guaranteed by the SELECT)."""
+    applied = format_human_datetime(app['applied_at'])
+    scheduled = app['scheduled_date']
+    return {
+        'application_id': app['application_id'],
+        'job_id': app['job_id'],
+        'job_title': app['job_title'],
+        'branch_name': app['branch_name'],
+        'position_title': app['position_title'],
+        'status': (app['status'] or 'pending').lower(),
+        'applied_at': applied,
+        'submitted_at': applied,
+        'has_interview': app['interview_id'] is not None,
+        'interview_date': format_human_datetime(scheduled) if scheduled else None,
+        'interview_mode': app['interview_mode'],
+        'interview_location': app['interview_location'],
+        'is_viewed': app['viewed_at'] is not None,  # Check if application has been viewed by HR/Admin
+    }
+
+
 @app.route('/applicant/applications')
 @login_required('applicant')
 def applicant_applications():
@@ -5731,127 +6141,62 @@ def applicant_applications():
     
     cursor = db.cursor(dictionary=True)
     try:
-        # Ensure schema compatibility
-        ensure_schema_compatibility()
-        
-        # Get dynamic job column expressions
-        _update_job_columns(cursor)
+        # Job columns are cached by ensure_schema_compatibility(); only probe if that never ran
+        if not JOB_COLUMNS:
+            _update_job_columns(cursor)
         job_title_expr = job_column_expr('job_title', alternatives=['title'], default="'Untitled Job'")
         
         # Get status filter from request
         status_filter = request.args.get('status', '').strip().lower()
         
-        # Build WHERE clause with status filter
-        where_clauses = ['a.applicant_id = %s']
         params = [applicant_id]
-        
+        status_sql = ''
+        status_expr = _application_status_expr(cursor)
         if status_filter:
             # Map display statuses to database statuses
-            status_map = {
-                'pending': ['pending', 'reviewed', 'applied', 'under_review'],
-                'scheduled': ['scheduled'],
-                'interviewed': ['interviewed', 'interview'],
-                'hired': ['hired', 'accepted'],
-                'rejected': ['rejected', 'withdrawn'],  # Include 'withdrawn' as it's normalized to 'rejected' for display
-            }
-            db_statuses = status_map.get(status_filter, [status_filter])
-            
-            # Build IN clause for multiple status mappings
-            if db_statuses:
-                placeholders = ','.join(['%s'] * len(db_statuses))
-                where_clauses.append(f'a.status IN ({placeholders})')
-                params.extend(db_statuses)
-                print(f"🔍 Applicant status filter: '{status_filter}' -> WHERE a.status IN {db_statuses}")
-        
-        where_sql = ' AND '.join(where_clauses)
+            if status_filter in APPLICANT_STATUS_FILTERS:
+                status_sql, status_params = APPLICANT_STATUS_FILTERS[status_filter]
+            else:
+                status_sql, status_params = APPLICANT_STATUS_FILTER_DEFAULT, (status_filter,)
+            status_sql = status_sql.format(status=status_expr)
+            params.extend(status_params)
+            log.debug("🔍 Applicant status filter: '%s' -> WHERE %s %s", status_filter, status_sql, status_params)
         
-        # Fetch all applications with job details, including viewed_at status
-        # Normalize withdrawn to rejected in SQL query - remove withdrawn status completely
-        # Use subqueries for interviews to prevent duplicates from multiple interviews per application
+        # SQL text is cached per (filter fragment, job schema, location column) so it is identical across requests
         cursor.execute(
-            f'''
-            SELECT DISTINCT a.application_id,
-                   CASE 
-                       WHEN a.status = 'withdrawn' THEN 'rejected'
-                       ELSE a.status
-                   END AS status,
-                   a.applied_at,
-                   a.viewed_at,
-                   j.job_id,
-                   {job_title_expr} AS job_title,
-                   COALESCE(b.branch_name, 'Unassigned') AS branch_name,
-                   {job_title_expr} AS position_title,
-                   (SELECT interview_id FROM interviews WHERE application_id = a.application_id ORDER BY scheduled_date DESC LIMIT 1) AS interview_id,
-                   (SELECT scheduled_date FROM interviews WHERE application_id = a.application_id ORDER BY scheduled_date DESC LIMIT 1) AS scheduled_date,
-                   COALESCE((SELECT interview_mode FROM interviews WHERE application_id = a.application_id ORDER BY scheduled_date DESC LIMIT 1), 'in-person') AS interview_mode,
-                   (IF(
-                       (SELECT COUNT(*) FROM INFORMATION_SCHEMA.COLUMNS WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'interviews' AND COLUMN_NAME = 'location') > 0,
-                       (SELECT location FROM interviews WHERE application_id = a.application_id ORDER BY scheduled_date DESC LIMIT 1),
-                       NULL
-                   )) AS interview_location,
-                   a.viewed_at
-            FROM applications a
-            JOIN jobs j ON a.job_id = j.job_id
-            LEFT JOIN branches b ON j.branch_id = b.branch_id
-            WHERE {where_sql}
-            ORDER BY a.applied_at DESC
-            ''',
+            _applicant_applications_sql(status_sql, job_title_expr, HAS_INTERVIEW_LOCATION_COLUMN, status_expr),
             tuple(params),
         )
-        applications = cursor.fetchall()
+        formatted_apps = [_format_applicant_application(app) for app in cursor.fetchall()]
         
-        # Deduplicate by application_id to prevent any remaining duplicates
-        seen_app_ids = set()
-        unique_applications = []
-        for app in applications:
-            app_id = app.get('application_id')
-            if app_id and app_id not in seen_app_ids:
-                seen_app_ids.add(app_id)
-                unique_applications.append(app)
-        applications = unique_applications
-        
-        # Calculate analytics - fetch all applications for accurate stats
-        # Normalize withdrawn to rejected in SQL query
+        # Calculate analytics - bucket every application by display status in SQL (one row per bucket),
+        # counting applications that have at least one interview in the same pass
+        # Note: legacy statuses fold into their display bucket (withdrawn is already 'rejected' in display_status)
         cursor.execute(
             f'''
-            SELECT CASE 
-                       WHEN a.status = 'withdrawn' THEN 'rejected'
-                       ELSE a.status
-                   END AS status
+            SELECT CASE
+                       WHEN COALESCE({status_expr}, 'pending') IN ('pending', 'reviewed', 'applied', 'under_review') THEN 'pending'
+                       WHEN {status_expr} IN ('interviewed', 'interview') THEN 'interviewed'
+                       WHEN {status_expr} IN ('hired', 'accepted') THEN 'hired'
+                       WHEN {status_expr} = 'rejected' THEN 'rejected'
+                       ELSE 'other'
+                   END AS bucket,
+                   COUNT(*) AS cnt,
+                   SUM(EXISTS(SELECT 1 FROM interviews i WHERE i.application_id = a.application_id)) AS with_interview
             FROM applications a
             WHERE a.applicant_id = %s
+            GROUP BY bucket
             ''',
             (applicant_id,),
         )
-        all_apps = cursor.fetchall()
-        
-        total = len(all_apps)
-        status_counts = {
-            'pending': 0,
-            'reviewed': 0,
-            'interviewed': 0,
-            'hired': 0,
-            'accepted': 0,
-            'rejected': 0,
-            'applied': 0,
-            'under_review': 0,
-            'interview': 0
-        }
-        
-        for app in all_apps:
-            status = (app.get('status') or 'pending').lower()
-            # Status is already normalized to rejected in SQL query (withdrawn -> rejected)
-            if status in status_counts:
-                status_counts[status] += 1
-        
-        # Map for display (combine similar statuses)
-        # Note: withdrawn is already normalized to rejected in SQL query
-        display_counts = {
-            'pending': status_counts.get('pending', 0) + status_counts.get('reviewed', 0) + status_counts.get('applied', 0) + status_counts.get('under_review', 0),
-            'interviewed': status_counts.get('interviewed', 0) + status_counts.get('interview', 0),
-            'hired': status_counts.get('hired', 0) + status_counts.get('accepted', 0),
-            'rejected': status_counts.get('rejected', 0),  # Withdrawn already normalized to rejected in SQL
-        }
+        display_counts = {'pending': 0, 'interviewed': 0, 'hired': 0, 'rejected': 0}
+        total = 0
+        interview_count = 0
+        for row in cursor.fetchall():
+            total += row['cnt']
+            interview_count += int(row['with_interview'] or 0)
+            if row['bucket'] in display_counts:
+                display_counts[row['bucket']] = row['cnt']
         
         analytics = {
             'total_applications': total,
@@ -5866,40 +6211,13 @@ def applicant_applications():
                 * 100,
                 1,
             ) if total > 0 else 0,
-            'interview_count': len([a for a in applications if a.get('interview_id')]),
+            'interview_count': interview_count,
         }
         
-        # Format applications
-        formatted_apps = []
-        for app in applications:
-            # Normalize withdrawn to rejected - remove withdrawn status completely
-            app_status = (app.get('status') or 'pending').lower()
-            if app_status == 'withdrawn':
-                app_status = 'rejected'
-            
-            formatted_apps.append({
-                'application_id': app.get('application_id'),
-                'job_id': app.get('job_id'),
-                'job_title': app.get('job_title'),
-                'branch_name': app.get('branch_name'),
-                'position_title': app.get('position_title'),
-                'status': app_status,  # Use normalized status (withdrawn -> rejected)
-                'applied_at': format_human_datetime(app.get('applied_at')),
-                'submitted_at': format_human_datetime(app.get('applied_at')),
-                'has_interview': app.get('interview_id') is not None,
-                'interview_date': format_human_datetime(app.get('scheduled_date')) if app.get('scheduled_date') else None,
-                'interview_mode': app.get('interview_mode'),
-                'interview_location': app.get('interview_location'),
-                'is_viewed': app.get('viewed_at') is not None,  # Check if application has been viewed by HR/Admin
-            })
-        
         return render_template('applicant/applications.html', applications=formatted_apps, analytics=analytics, status_filter=status_filter)
     except Exception as exc:
         db.rollback()
-        import traceback
-        error_details = traceback.format_exc()
-        print(f'❌ Applicant applications error: {exc}')
-        print(f'Full traceback: {error_details}')
+        log.exception('❌ Applicant applications error: %s', exc)
         flash(f'Unable to load applications: {str(exc)}', 'error')
         return render_template('applicant/applications.html', applications=[], analytics={})
     finally:
@@ -5907,6 +6225,50 @@ def applicant_applications():
             cursor.close()
 
 
+@lru_cache(maxsize=4)
+def _applicant_interviews_sql(has_location, minimal=False):
+    """Build the applicant interviews SELECT once per schema variant so the statement text stays stable."""
+    location_expr = 'i.location' if has_location else "''"
+    if minimal:
+        # Fallback without the jobs/branches joins and COALESCE defaults
+        return f'''
+            SELECT i.interview_id,
+                   i.scheduled_date,
+                   i.interview_mode,
+                   i.notes,
+                   i.status AS interview_status,
+                   a.application_id,
+                   a.status AS application_status,
+                   a.job_id,
+                   {location_expr} AS location,
+                   (i.scheduled_date >= NOW()) AS is_upcoming
+            FROM interviews i
+            INNER JOIN applications a ON i.application_id = a.application_id
+            WHERE a.applicant_id = %s
+            ORDER BY is_upcoming DESC, i.scheduled_date DESC
+        '''
+    return f'''
+        SELECT i.interview_id,
+               i.scheduled_date,
+               COALESCE(i.interview_mode, 'in-person') AS interview_mode,
+               i.notes,
+               COALESCE(i.status, 'scheduled') AS interview_status,
+               a.application_id,
+               COALESCE(a.status, 'pending') AS application_status,
+               a.job_id,
+               COALESCE(j.job_title, 'Untitled Job') AS job_title,
+               COALESCE(b.branch_name, 'Unassigned') AS branch_name,
+               {location_expr} AS location,
+               (i.scheduled_date >= NOW()) AS is_upcoming
+        FROM interviews i
+        INNER JOIN applications a ON i.application_id = a.application_id
+        LEFT JOIN jobs j ON a.job_id = j.job_id
+        LEFT JOIN branches b ON j.branch_id = b.branch_id
+        WHERE a.applicant_id = %s
+        ORDER BY is_upcoming DESC, i.scheduled_date DESC
+    '''
+
+
 @app.route('/applicant/interviews', methods=['GET', 'POST'])
 @login_required('applicant')
 def applicant_interviews():
@@ -5920,485 +6282,261 @@ def applicant_interviews():
     try:
         applicant_id = int(applicant_id)
     except (ValueError, TypeError):
-        print(f'⚠️ Invalid applicant_id in session: {applicant_id}')
+        log.warning('⚠️ Invalid applicant_id in session: %s', applicant_id)
         flash('Unable to identify your account. Please log in again.', 'error')
         return immediate_redirect(url_for('login', _external=True))
     
     db = get_db()
     if not db:
         flash('Database connection error.', 'error')
-        return render_template('applicant/interviews.html', interviews=[], upcoming=[], past=[])
+        return render_template('applicant/interviews.html', interviews=[], upcoming_count=0)
     
     cursor = None
     try:
-        # Ensure schema compatibility - wrap in try-except to prevent crashes
-        try:
-            ensure_schema_compatibility()
-        except Exception as schema_error:
-            print(f'⚠️ Schema compatibility check failed (non-critical): {schema_error}')
-            # Continue anyway - schema might still be compatible
-        
         cursor = db.cursor(dictionary=True)
         # Handle POST actions (confirm/cancel interview)
         if request.method == 'POST':
+            # Parse the Accept header once for every JSON/HTML branch below
+            want_json = request.accept_mimetypes.accept_json
+            back_url = url_for('applicant_interviews', _external=True)
+            
+            def respond(success, message, category, code=200, **extra):
+                """JSON for AJAX callers, otherwise flash and redirect back to the interviews page."""
+                if want_json:
+                    return json_response({'success': success, 'message': message, **extra}, code)
+                flash(message, category)
+                return immediate_redirect(back_url)
             action = request.form.get('action')
             interview_id = request.form.get('interview_id', type=int)
             
             if action == 'confirm_interview' and interview_id:
-                # Verify interview belongs to this applicant and get current status
-                cursor.execute(
-                    '''
-                    SELECT i.interview_id, i.status, i.scheduled_date
-                    FROM interviews i
-                    JOIN applications a ON i.application_id = a.application_id
-                    WHERE i.interview_id = %s AND a.applicant_id = %s
-                    LIMIT 1
-                    ''',
-                    (interview_id, applicant_id),
-                )
-                interview = cursor.fetchone()
-                if not interview:
-                    if request.accept_mimetypes.accept_json:
-                        return jsonify({'success': False, 'message': 'Interview not found.'}), 404
-                    flash('Interview not found.', 'error')
-                    return immediate_redirect(url_for('applicant_interviews', _external=True))
-                
-                current_status = (interview.get('status') or 'scheduled').lower()
-                
-                # Check if already confirmed
-                if current_status == 'confirmed':
-                    if request.accept_mimetypes.accept_json:
-                        return jsonify({'success': False, 'message': 'This interview is already confirmed.'})
-                    flash('This interview is already confirmed.', 'info')
-                    return immediate_redirect(url_for('applicant_interviews', _external=True))
-                
-                # Check if cancelled - cannot confirm a cancelled interview
-                if current_status == 'cancelled':
-                    if request.accept_mimetypes.accept_json:
-                        return jsonify({'success': False, 'message': 'Cannot confirm a cancelled interview. Please contact HR if you need to reschedule.'})
-                    flash('Cannot confirm a cancelled interview. Please contact HR if you need to reschedule.', 'error')
-                    return immediate_redirect(url_for('applicant_interviews', _external=True))
-                
-                # Check if already completed or no_show
-                if current_status in ('completed', 'no_show'):
-                    if request.accept_mimetypes.accept_json:
-                        return jsonify({'success': False, 'message': 'Cannot modify the status of a completed interview.'})
-                    flash('Cannot modify the status of a completed interview.', 'error')
-                    return immediate_redirect(url_for('applicant_interviews', _external=True))
-                
-                # Check if interview is in the past
-                scheduled_date = interview.get('scheduled_date')
-                if scheduled_date and isinstance(scheduled_date, datetime) and scheduled_date < datetime.now():
-                    if request.accept_mimetypes.accept_json:
-                        return jsonify({'success': False, 'message': 'Cannot confirm past interviews.'})
-                    flash('Cannot confirm past interviews.', 'error')
-                    return immediate_redirect(url_for('applicant_interviews', _external=True))
-                
                 # Update interview status to confirmed
                 # IMPORTANT: This action does TWO things:
                 # 1. Updates the interview status in the database to 'confirmed'
                 # 2. Notifies HR users about the confirmation
                 # Both operations are committed together in a single transaction
                 try:
-                    # First, try to update status to 'confirmed'
+                    # Claim the row without waiting: a concurrent double-submit is answered immediately
+                    # instead of blocking on the first request's row lock
+                    claimed = True
                     try:
-                        # First, ensure enum has 'confirmed' value
-                        try:
-                            cursor.execute("ALTER TABLE interviews MODIFY COLUMN status ENUM('scheduled', 'confirmed', 'rescheduled', 'completed', 'cancelled', 'no_show') DEFAULT 'scheduled'")
-                            print('✅ Ensured "confirmed" is in status enum')
-                        except Exception as enum_check_err:
-                            error_msg = str(enum_check_err).lower()
-                            # If enum already has the value or table doesn't exist, that's okay
-                            if 'duplicate' not in error_msg and 'already' not in error_msg:
-                                print(f'⚠️ Could not modify enum (may already be correct): {enum_check_err}')
-                        
-                        # Now update the status - wrap in try-except to catch MySQL enum errors
+                        cursor.execute(
+                            '''
+                            SELECT i.interview_id
+                            FROM interviews i
+                            JOIN applications a ON i.application_id = a.application_id
+                            WHERE i.interview_id = %s AND a.applicant_id = %s
+                            LIMIT 1 FOR UPDATE OF i SKIP LOCKED
+                            ''',
+                            (interview_id, applicant_id),
+                        )
+                        claimed = cursor.fetchone() is not None
+                    except Exception as lock_error:
+                        # OF i keeps the shared applications row unlocked, so actions on sibling interviews of
+                        # one application don't collide; FOR UPDATE OF ... SKIP LOCKED needs MySQL 8.0+,
+                        # other servers simply wait on the UPDATE
+                        log.debug('ℹ️ SKIP LOCKED claim unavailable: %s', lock_error)
+                    
+                    rows_updated = 0
+                    if claimed:
+                        # One guarded UPDATE checks ownership, current status and date in the same statement
+                        # (interviews.status enum is verified once by ensure_schema_compatibility())
                         try:
                             cursor.execute(
-                                'UPDATE interviews SET status = %s WHERE interview_id = %s',
-                                ('confirmed', interview_id),
+                                '''
+                                UPDATE interviews i
+                                JOIN applications a ON i.application_id = a.application_id
+                                SET i.status = %s
+                                WHERE i.interview_id = %s AND a.applicant_id = %s
+                                  AND COALESCE(i.status, 'scheduled') IN ('scheduled', 'rescheduled')
+                                  AND i.scheduled_date >= NOW()
+                                ''',
+                                ('confirmed', interview_id, applicant_id),
                             )
                             rows_updated = cursor.rowcount
-                            
-                            if rows_updated == 0:
-                                # Verify interview exists
-                                cursor.execute('SELECT interview_id FROM interviews WHERE interview_id = %s', (interview_id,))
-                                exists = cursor.fetchone()
-                                if not exists:
-                                    raise Exception(f'Interview {interview_id} does not exist.')
-                                else:
-                                    raise Exception(f'Update returned 0 rows but interview exists.')
-                            
-                            print(f'✅ Interview {interview_id} status updated to confirmed. Rows updated: {rows_updated}')
-                        except Exception as mysql_err:
-                            error_msg = str(mysql_err).lower()
-                            # If it's an enum/invalid value error, the ALTER should have fixed it
-                            # But if it still fails, add note as fallback
-                            if 'enum' in error_msg or 'invalid' in error_msg or 'value' in error_msg:
-                                print(f'⚠️ MySQL enum error (unexpected after ALTER): {mysql_err}')
-                                # Try one more time after ensuring enum
-                                try:
-                                    cursor.execute("ALTER TABLE interviews MODIFY COLUMN status ENUM('scheduled', 'confirmed', 'rescheduled', 'completed', 'cancelled', 'no_show') DEFAULT 'scheduled'")
-                                    cursor.execute(
-                                        'UPDATE interviews SET status = %s WHERE interview_id = %s',
-                                        ('confirmed', interview_id),
-                                    )
-                                    rows_updated = cursor.rowcount
-                                    if rows_updated > 0:
-                                        print(f'✅ Interview {interview_id} status updated after retry. Rows updated: {rows_updated}')
-                                    else:
-                                        raise Exception('Retry also returned 0 rows')
-                                except Exception as retry_err:
-                                    print(f'⚠️ Retry also failed: {retry_err}')
-                                    raise
-                            else:
+                        except Exception as status_update_error:
+                            # Fallback: record the confirmation as a note, under the same status/date guard as the UPDATE above
+                            log.warning('⚠️ Status update error: %s', status_update_error)
+                            if not HAS_INTERVIEW_NOTES_COLUMN:
                                 raise
-                    except Exception as status_update_error:
-                        # Final fallback: add a note
-                        print(f'⚠️ Status update failed: {status_update_error}')
-                        try:
-                            cursor.execute(
-                                'UPDATE interviews SET notes = CONCAT(COALESCE(notes, ""), "\n\n[Applicant Confirmed Attendance on ", NOW(), "]") WHERE interview_id = %s',
-                                (interview_id,),
-                            )
-                            print(f'✅ Added confirmation note to interview {interview_id}')
-                        except Exception as note_err:
-                            if '1054' in str(note_err) or 'Unknown column' in str(note_err):
-                                print(f'⚠️ Note column missing; confirmation recorded without notes')
-                            else:
-                                print(f'❌ Failed to add confirmation note: {note_err}')
-                                raise
-                    # Get interview details for HR notification
-                    cursor.execute(
-                        '''
-                        SELECT i.interview_id, i.scheduled_date, i.interview_mode, i.interview_mode,
-                               a.application_id, a.applicant_id,
-                               ap.full_name AS applicant_name, ap.email AS applicant_email,
-                               j.job_id, COALESCE(j.job_title, 'Untitled Job') AS job_title,
-                               b.branch_id, b.branch_name
-                        FROM interviews i
-                        JOIN applications a ON i.application_id = a.application_id
-                        JOIN applicants ap ON a.applicant_id = ap.applicant_id
-                        LEFT JOIN jobs j ON a.job_id = j.job_id
-                        LEFT JOIN branches b ON j.branch_id = b.branch_id
-                        WHERE i.interview_id = %s
-                        LIMIT 1
-                        ''',
-                        (interview_id,),
-                    )
-                    interview_details = cursor.fetchone()
-                    
-                    # Notify HR about the confirmation - ALWAYS notify HR when status is updated
-                    if interview_details:
-                        try:
-                            branch_id = interview_details.get('branch_id')
-                            applicant_name = interview_details.get('applicant_name') or 'Applicant'
-                            job_title = interview_details.get('job_title') or 'Position'
-                            scheduled_date = interview_details.get('scheduled_date')
-                            scheduled_str = format_human_datetime(scheduled_date) if scheduled_date else 'TBD'
-                            
-                            notification_message = f'Applicant {applicant_name} has confirmed attendance for interview: {job_title} scheduled on {scheduled_str}.'
-                            
-                            # Check if notification already exists to prevent duplicates
                             cursor.execute(
                                 '''
-                                SELECT notification_id FROM notifications
-                                WHERE application_id = %s AND message = %s
-                                LIMIT 1
+                                UPDATE interviews i
+                                JOIN applications a ON i.application_id = a.application_id
+                                SET i.notes = CONCAT(COALESCE(i.notes, ""), "\n\n[Applicant Confirmed Attendance on ", NOW(), "]")
+                                WHERE i.interview_id = %s AND a.applicant_id = %s
+                                  AND COALESCE(i.status, 'scheduled') IN ('scheduled', 'rescheduled')
+                                  AND i.scheduled_date >= NOW()
                                 ''',
-                                (interview_details.get('application_id'), notification_message),
+                                (interview_id, applicant_id),
                             )
-                            existing_notification = cursor.fetchone()
-                            
-                            if not existing_notification:
-                                # Get HR users to notify (for logging purposes)
-                                # HR accounts manage all branches (branch_id column removed from admins table)
-                                hr_users_to_notify = []
-                                cursor.execute(
-                                    '''
-                                    SELECT a.admin_id, u.email, a.full_name
-                                    FROM admins a
-                                    JOIN users u ON u.user_id = a.user_id
-                                    WHERE a.is_active = 1 AND u.user_type = 'hr' AND u.is_active = 1
-                                    '''
-                                )
-                                all_hr = cursor.fetchall() or []
-                                hr_users_to_notify.extend(all_hr)
-                                
-                                # Intentionally do NOT create an admin/HR notification for applicant confirmation
-                                # This notification is applicant-facing only (applicant will be notified via notifications/email)
-                                print(f'ℹ️ Applicant confirmation notification created (no HR notification): {notification_message}')
-                            else:
-                                print(f'⚠️ HR notification already exists for this confirmation - skipping duplicate notification')
-                                print(f'   - Status updated to: confirmed')
-                        except Exception as notify_err:
-                            log.exception('⚠️ Error creating HR notification for interview confirmation: %s', notify_err)
-                            # Don't fail the whole operation if notification fails, but log it
+                            rows_updated = cursor.rowcount
+                            if rows_updated:
+                                log.debug('✅ Added confirmation note to interview %s', interview_id)
+                    
+                    if rows_updated == 0:
+                        # Nothing changed: release the claim lock before answering, then one
+                        # diagnostic SELECT explains why
+                        db.rollback()
+                        cursor.execute(
+                            '''
+                            SELECT i.status, i.scheduled_date
+                            FROM interviews i
+                            JOIN applications a ON i.application_id = a.application_id
+                            WHERE i.interview_id = %s AND a.applicant_id = %s
+                            LIMIT 1
+                            ''',
+                            (interview_id, applicant_id),
+                        )
+                        interview = cursor.fetchone()
+                        if not interview:
+                            return respond(False, 'Interview not found.', 'error', 404)
+                        
+                        if not claimed:
+                            # The row exists but is locked by a concurrent request for the same interview
+                            return respond(False, 'Another request is processing this interview.', 'info')
+                        
+                        current_status = (interview.get('status') or 'scheduled').lower()
+                        if current_status == 'confirmed':
+                            message, category = 'This interview is already confirmed.', 'info'
+                        elif current_status == 'cancelled':
+                            message, category = 'Cannot confirm a cancelled interview. Please contact HR if you need to reschedule.', 'error'
+                        elif current_status in ('completed', 'no_show'):
+                            message, category = 'Cannot modify the status of a completed interview.', 'error'
+                        else:
+                            message, category = 'Cannot confirm past interviews.', 'error'
+                        return respond(False, message, category)
+                    
+                    log.debug('✅ Interview %s status updated to confirmed. Rows updated: %s', interview_id, rows_updated)
+                    # Intentionally no admin/HR notification for applicant confirmations, so no
+                    # recipient or interview-detail lookups are needed before committing
+                    log.debug('ℹ️ Applicant %s confirmed attendance for interview %s (no HR notification)', applicant_id, interview_id)
                     
                     # Commit the transaction
                     db.commit()
-                    print(f'✅ Transaction committed for interview {interview_id} confirmation')
+                    log.debug('✅ Transaction committed for interview %s confirmation', interview_id)
                     
-                    # Verify the update was successful
-                    cursor.execute(
-                        'SELECT status FROM interviews WHERE interview_id = %s LIMIT 1',
-                        (interview_id,)
-                    )
-                    verify_status = cursor.fetchone()
-                    actual_status = (verify_status.get('status') or '').lower() if verify_status else None
-                    print(f'✅ Verified interview {interview_id} status after update: {actual_status}')
-                    
-                    if request.accept_mimetypes.accept_json:
-                        return jsonify({
-                            'success': True, 
-                            'message': 'Interview attendance confirmed successfully.', 
-                            'status': actual_status or 'confirmed'
-                        })
-                    flash('Interview attendance confirmed successfully.', 'success')
+                    return respond(True, 'Interview attendance confirmed successfully.', 'success', status='confirmed')
                 except Exception as update_exc:
                     db.rollback()
-                    print(f'⚠️ Error updating interview status: {update_exc}')
-                    if request.accept_mimetypes.accept_json:
-                        return jsonify({'success': False, 'message': 'Unable to confirm interview. Please contact HR.'}), 500
-                    flash('Unable to confirm interview. Please contact HR.', 'error')
+                    log.exception('⚠️ Error updating interview status: %s', update_exc)
+                    return respond(False, 'Unable to confirm interview. Please contact HR.', 'error', 500)
             
             elif action == 'cancel_interview' and interview_id:
-                # Verify interview belongs to this applicant and get current status
-                cursor.execute(
-                    '''
-                    SELECT i.interview_id, i.status, i.scheduled_date
-                    FROM interviews i
-                    JOIN applications a ON i.application_id = a.application_id
-                    WHERE i.interview_id = %s AND a.applicant_id = %s
-                    LIMIT 1
-                    ''',
-                    (interview_id, applicant_id),
-                )
-                interview = cursor.fetchone()
-                if not interview:
-                    if request.accept_mimetypes.accept_json:
-                        return jsonify({'success': False, 'message': 'Interview not found.'}), 404
-                    flash('Interview not found.', 'error')
-                    return immediate_redirect(url_for('applicant_interviews', _external=True))
-                
-                current_status = (interview.get('status') or 'scheduled').lower()
-                
-                # Check if already cancelled
-                if current_status == 'cancelled':
-                    if request.accept_mimetypes.accept_json:
-                        return jsonify({'success': False, 'message': 'This interview is already cancelled.'})
-                    flash('This interview is already cancelled.', 'info')
-                    return immediate_redirect(url_for('applicant_interviews', _external=True))
-                
-                # Check if already completed or no_show
-                if current_status in ('completed', 'no_show'):
-                    if request.accept_mimetypes.accept_json:
-                        return jsonify({'success': False, 'message': 'Cannot cancel a completed interview.'})
-                    flash('Cannot cancel a completed interview.', 'error')
-                    return immediate_redirect(url_for('applicant_interviews', _external=True))
-                
-                # Check if interview is in the past
-                scheduled_date = interview.get('scheduled_date')
-                if scheduled_date and isinstance(scheduled_date, datetime) and scheduled_date < datetime.now():
-                    if request.accept_mimetypes.accept_json:
-                        return jsonify({'success': False, 'message': 'Cannot cancel past interviews.'})
-                    flash('Cannot cancel past interviews.', 'error')
-                    return immediate_redirect(url_for('applicant_interviews', _external=True))
-                
                 # Update interview status to cancelled
                 # IMPORTANT: This action does TWO things:
                 # 1. Updates the interview status in the database to 'cancelled'
                 # 2. Notifies HR users about the cancellation
                 # Both operations are committed together in a single transaction
                 try:
-                    # Try to update status to 'cancelled' (should be in enum already)
+                    # Claim the row without waiting: a concurrent double-submit is answered immediately
+                    # instead of blocking on the first request's row lock
+                    claimed = True
                     try:
                         cursor.execute(
-                            'UPDATE interviews SET status = %s WHERE interview_id = %s',
-                            ('cancelled', interview_id),
+                            '''
+                            SELECT i.interview_id
+                            FROM interviews i
+                            JOIN applications a ON i.application_id = a.application_id
+                            WHERE i.interview_id = %s AND a.applicant_id = %s
+                            LIMIT 1 FOR UPDATE OF i SKIP LOCKED
+                            ''',
+                            (interview_id, applicant_id),
                         )
-                        rows_updated = cursor.rowcount
-                        
-                        if rows_updated == 0:
-                            # Check if interview exists
-                            cursor.execute('SELECT interview_id FROM interviews WHERE interview_id = %s', (interview_id,))
-                            exists = cursor.fetchone()
-                            if not exists:
-                                raise Exception(f'Interview {interview_id} does not exist.')
-                            else:
-                                raise Exception(f'Update failed but interview exists. Possible enum issue.')
-                        
-                        print(f'✅ Interview {interview_id} status updated to cancelled. Rows updated: {rows_updated}')
-                    except Exception as status_update_error:
-                        error_msg = str(status_update_error).lower()
-                        print(f'⚠️ Status update error: {status_update_error}')
-                        
-                        # If it's an enum error, try to fix it
-                        if 'enum' in error_msg or 'invalid' in error_msg or 'value' in error_msg:
-                            try:
-                                # Ensure 'cancelled' is in enum
-                                cursor.execute("ALTER TABLE interviews MODIFY COLUMN status ENUM('scheduled', 'confirmed', 'rescheduled', 'completed', 'cancelled', 'no_show') DEFAULT 'scheduled'")
-                                # Try update again
-                                cursor.execute(
-                                    'UPDATE interviews SET status = %s WHERE interview_id = %s',
-                                    ('cancelled', interview_id),
-                                )
-                                rows_updated = cursor.rowcount
-                                if rows_updated > 0:
-                                    print(f'✅ Interview {interview_id} status updated to cancelled after enum fix.')
-                                else:
-                                    raise Exception('Update still failed after enum fix')
-                            except Exception as enum_fix_err:
-                                print(f'⚠️ Could not fix enum: {enum_fix_err}')
-                                # Fallback: add a note
-                                try:
-                                    cursor.execute(
-                                        'UPDATE interviews SET notes = CONCAT(COALESCE(notes, ""), "\n\n[Applicant Cancelled on ", NOW(), "]") WHERE interview_id = %s',
-                                        (interview_id,),
-                                    )
-                                    print(f'✅ Added cancellation note to interview {interview_id}')
-                                except Exception as note_err:
-                                    if '1054' in str(note_err) or 'Unknown column' in str(note_err):
-                                        print(f'⚠️ Note column missing; cancellation recorded without notes')
-                                    else:
-                                        raise
-                        else:
-                            # Other error - try adding note
-                            try:
-                                cursor.execute(
-                                    'UPDATE interviews SET notes = CONCAT(COALESCE(notes, ""), "\n\n[Applicant Cancelled on ", NOW(), "]") WHERE interview_id = %s',
-                                    (interview_id,),
-                                )
-                                print(f'✅ Added cancellation note to interview {interview_id}')
-                            except Exception as note_err:
-                                if '1054' in str(note_err) or 'Unknown column' in str(note_err):
-                                    print(f'⚠️ Note column missing; cancellation recorded without notes')
-                                else:
-                                    print(f'❌ Failed to add cancellation note: {note_err}')
-                                    raise
-                    # Get interview details for HR notification
-                    cursor.execute(
-                        '''
-                        SELECT i.interview_id, i.scheduled_date, i.interview_mode, i.interview_mode,
-                               a.application_id, a.applicant_id,
-                               ap.full_name AS applicant_name, ap.email AS applicant_email,
-                               j.job_id, COALESCE(j.job_title, 'Untitled Job') AS job_title,
-                               b.branch_id, b.branch_name
-                        FROM interviews i
-                        JOIN applications a ON i.application_id = a.application_id
-                        JOIN applicants ap ON a.applicant_id = ap.applicant_id
-                        LEFT JOIN jobs j ON a.job_id = j.job_id
-                        LEFT JOIN branches b ON j.branch_id = b.branch_id
-                        WHERE i.interview_id = %s
-                        LIMIT 1
-                        ''',
-                        (interview_id,),
-                    )
-                    interview_details = cursor.fetchone()
+                        claimed = cursor.fetchone() is not None
+                    except Exception as lock_error:
+                        # OF i keeps the shared applications row unlocked, so actions on sibling interviews of
+                        # one application don't collide; FOR UPDATE OF ... SKIP LOCKED needs MySQL 8.0+,
+                        # other servers simply wait on the UPDATE
+                        log.debug('ℹ️ SKIP LOCKED claim unavailable: %s', lock_error)
                     
-                    # Notify HR about the cancellation - ALWAYS notify HR when status is updated
-                    if interview_details:
+                    rows_updated = 0
+                    if claimed:
+                        # One guarded UPDATE checks ownership, current status and date in the same statement
+                        # (interviews.status enum is verified once by ensure_schema_compatibility())
                         try:
-                            branch_id = interview_details.get('branch_id')
-                            applicant_name = interview_details.get('applicant_name') or 'Applicant'
-                            job_title = interview_details.get('job_title') or 'Position'
-                            scheduled_date = interview_details.get('scheduled_date')
-                            scheduled_str = format_human_datetime(scheduled_date) if scheduled_date else 'TBD'
-                            
-                            notification_message = f'Applicant {applicant_name} has cancelled the interview: {job_title} scheduled on {scheduled_str}.'
-                            
-                            # Check if notification already exists to prevent duplicates
                             cursor.execute(
                                 '''
-                                SELECT notification_id FROM notifications
-                                WHERE application_id = %s AND message = %s
-                                LIMIT 1
+                                UPDATE interviews i
+                                JOIN applications a ON i.application_id = a.application_id
+                                SET i.status = %s
+                                WHERE i.interview_id = %s AND a.applicant_id = %s
+                                  AND COALESCE(i.status, 'scheduled') IN ('scheduled', 'rescheduled', 'confirmed')
+                                  AND i.scheduled_date >= NOW()
                                 ''',
-                                (interview_details.get('application_id'), notification_message),
+                                ('cancelled', interview_id, applicant_id),
                             )
-                            existing_notification = cursor.fetchone()
-                            
-                            if not existing_notification:
-                                # Create notification for HR users in the same branch
-                                hr_users_to_notify = []
-                                
-                                if branch_id:
-                                    # HR accounts manage all branches (branch_id column removed from admins table)
-                                    cursor.execute(
-                                        '''
-                                        SELECT a.admin_id, u.email, a.full_name
-                                        FROM admins a
-                                        JOIN users u ON u.user_id = a.user_id
-                                        WHERE a.is_active = 1 AND u.user_type = 'hr' AND u.is_active = 1
-                                        '''
-                                    )
-                                    all_hr = cursor.fetchall() or []
-                                    hr_users_to_notify.extend(all_hr)
-                                
-                                # Intentionally avoid creating an admin/HR notification for applicant cancellations
-                                # Applicant-facing notification already created above; HR need not receive a duplicate.
-                                print(f'ℹ️ Applicant cancellation notification created (no HR notification): {notification_message}')
-                            else:
-                                print(f'⚠️ HR notification already exists for this cancellation - skipping duplicate notification')
-                                print(f'   - Status updated to: cancelled')
-                        except Exception as notify_err:
-                            log.exception('⚠️ Error creating HR notification for interview cancellation: %s', notify_err)
-                            # Don't fail the whole operation if notification fails, but log it
+                            rows_updated = cursor.rowcount
+                        except Exception as status_update_error:
+                            # Fallback: record the cancellation as a note, under the same status/date guard as the UPDATE above
+                            log.warning('⚠️ Status update error: %s', status_update_error)
+                            if not HAS_INTERVIEW_NOTES_COLUMN:
+                                raise
+                            cursor.execute(
+                                '''
+                                UPDATE interviews i
+                                JOIN applications a ON i.application_id = a.application_id
+                                SET i.notes = CONCAT(COALESCE(i.notes, ""), "\n\n[Applicant Cancelled on ", NOW(), "]")
+                                WHERE i.interview_id = %s AND a.applicant_id = %s
+                                  AND COALESCE(i.status, 'scheduled') IN ('scheduled', 'rescheduled', 'confirmed')
+                                  AND i.scheduled_date >= NOW()
+                                ''',
+                                (interview_id, applicant_id),
+                            )
+                            rows_updated = cursor.rowcount
+                            if rows_updated:
+                                log.debug('✅ Added cancellation note to interview %s', interview_id)
+                    
+                    if rows_updated == 0:
+                        # Nothing changed: release the claim lock before answering, then one
+                        # diagnostic SELECT explains why
+                        db.rollback()
+                        cursor.execute(
+                            '''
+                            SELECT i.status, i.scheduled_date
+                            FROM interviews i
+                            JOIN applications a ON i.application_id = a.application_id
+                            WHERE i.interview_id = %s AND a.applicant_id = %s
+                            LIMIT 1
+                            ''',
+                            (interview_id, applicant_id),
+                        )
+                        interview = cursor.fetchone()
+                        if not interview:
+                            return respond(False, 'Interview not found.', 'error', 404)
+                        
+                        if not claimed:
+                            # The row exists but is locked by a concurrent request for the same interview
+                            return respond(False, 'Another request is processing this interview.', 'info')
+                        
+                        current_status = (interview.get('status') or 'scheduled').lower()
+                        if current_status == 'cancelled':
+                            message, category = 'This interview is already cancelled.', 'info'
+                        elif current_status in ('completed', 'no_show'):
+                            message, category = 'Cannot cancel a completed interview.', 'error'
+                        else:
+                            message, category = 'Cannot cancel past interviews.', 'error'
+                        return respond(False, message, category)
+                    
+                    log.debug('✅ Interview %s status updated to cancelled. Rows updated: %s', interview_id, rows_updated)
+                    # Intentionally no admin/HR notification for applicant cancellations, so no
+                    # recipient or interview-detail lookups are needed before committing
+                    log.debug('ℹ️ Applicant %s cancelled for interview %s (no HR notification)', applicant_id, interview_id)
                     
                     # Commit the transaction
                     db.commit()
-                    print(f'✅ Transaction committed for interview {interview_id} cancellation')
+                    log.debug('✅ Transaction committed for interview %s cancellation', interview_id)
                     
-                    # Verify the update was successful
-                    cursor.execute(
-                        'SELECT status FROM interviews WHERE interview_id = %s LIMIT 1',
-                        (interview_id,)
-                    )
-                    verify_status = cursor.fetchone()
-                    actual_status = (verify_status.get('status') or '').lower() if verify_status else None
-                    print(f'✅ Verified interview {interview_id} status after update: {actual_status}')
-                    
-                    if request.accept_mimetypes.accept_json:
-                        return jsonify({
-                            'success': True, 
-                            'message': 'Interview cancellation requested.', 
-                            'status': actual_status or 'cancelled'
-                        })
-                    flash('Interview cancellation requested.', 'success')
+                    return respond(True, 'Interview cancellation requested.', 'success', status='cancelled')
                 except Exception as update_exc:
                     db.rollback()
-                    print(f'⚠️ Error updating interview status: {update_exc}')
-                    if request.accept_mimetypes.accept_json:
-                        return jsonify({'success': False, 'message': 'Unable to cancel interview. Please contact HR.'}), 500
-                    flash('Unable to cancel interview. Please contact HR.', 'error')
+                    log.exception('⚠️ Error updating interview status: %s', update_exc)
+                    return respond(False, 'Unable to cancel interview. Please contact HR.', 'error', 500)
             
             elif action == 'delete_all_interviews':
                 # Delete all interviews for this applicant
                 try:
-                    # Get all interview IDs for this applicant before deletion (for notification)
-                    cursor.execute(
-                        '''
-                        SELECT i.interview_id, i.application_id, i.scheduled_date,
-                               j.job_id, COALESCE(j.job_title, 'Untitled Job') AS job_title,
-                               b.branch_id, b.branch_name
-                        FROM interviews i
-                        JOIN applications a ON i.application_id = a.application_id
-                        LEFT JOIN jobs j ON a.job_id = j.job_id
-                        LEFT JOIN branches b ON j.branch_id = b.branch_id
-                        WHERE a.applicant_id = %s
-                        ''',
-                        (applicant_id,)
-                    )
-                    interviews_to_delete = cursor.fetchall()
-                    deleted_count = len(interviews_to_delete)
-                    
-                    if deleted_count == 0:
-                        if request.accept_mimetypes.accept_json:
-                            return jsonify({'success': False, 'message': 'No interviews found to delete.'})
-                        flash('No interviews found to delete.', 'info')
-                        return immediate_redirect(url_for('applicant_interviews', _external=True))
-                    
-                    # Delete all interviews for this applicant
+                    # Delete all interviews for this applicant; rowcount tells us whether there were any
                     cursor.execute(
                         '''
                         DELETE i FROM interviews i
@@ -6409,194 +6547,53 @@ def applicant_interviews():
                     )
                     deleted_rows = cursor.rowcount
                     
-                    # Notify HR about the deletion
-                    if interviews_to_delete:
-                        try:
-                            # Get unique branch IDs
-                            branch_ids = set()
-                            for interview in interviews_to_delete:
-                                branch_id = interview.get('branch_id')
-                                if branch_id:
-                                    branch_ids.add(branch_id)
-                            
-                            # Get applicant info
-                            cursor.execute(
-                                'SELECT full_name, email FROM applicants WHERE applicant_id = %s LIMIT 1',
-                                (applicant_id,)
-                            )
-                            applicant_data = cursor.fetchone()
-                            applicant_name = applicant_data.get('full_name') if applicant_data else 'Applicant'
-                            
-                            notification_message = f'Applicant {applicant_name} has deleted all {deleted_count} interview(s).'
-                            
-                            # Do NOT create an admin/HR notification for applicant-initiated deletion of all interviews
-                            # Applicant-facing notification has already been recorded; avoid notifying HR.
-                            print(f'ℹ️ Applicant deleted all interviews notification recorded (no HR notification): {notification_message}')
-                        except Exception as notify_err:
-                            print(f'⚠️ Error creating HR notification for deleting all interviews: {notify_err}')
-                            # Don't fail the whole operation if notification fails
+                    if deleted_rows == 0:
+                        return respond(False, 'No interviews found to delete.', 'info')
+                    
+                    # Do NOT create an admin/HR notification for applicant-initiated deletion of all interviews
+                    log.debug('ℹ️ Applicant %s deleted all %s interview(s) (no HR notification)', applicant_id, deleted_rows)
                     
                     db.commit()
-                    print(f'✅ Deleted {deleted_rows} interview(s) for applicant {applicant_id}')
+                    log.debug('✅ Deleted %s interview(s) for applicant %s', deleted_rows, applicant_id)
                     
-                    if request.accept_mimetypes.accept_json:
-                        return jsonify({
-                            'success': True,
-                            'message': f'All {deleted_rows} interview(s) deleted successfully.',
-                            'deleted_count': deleted_rows
-                        })
-                    flash(f'All {deleted_rows} interview(s) deleted successfully.', 'success')
+                    return respond(True, f'All {deleted_rows} interview(s) deleted successfully.', 'success', deleted_count=deleted_rows)
                 except Exception as delete_exc:
                     db.rollback()
                     log.exception('⚠️ Error deleting all interviews: %s', delete_exc)
-                    if request.accept_mimetypes.accept_json:
-                        return jsonify({'success': False, 'message': 'Unable to delete all interviews. Please try again.'}), 500
-                    flash('Unable to delete all interviews. Please try again.', 'error')
+                    return respond(False, 'Unable to delete all interviews. Please try again.', 'error', 500)
             
             if request.method == 'POST':
-                if request.accept_mimetypes.accept_json:
+                if want_json:
                     # Return JSON response for AJAX requests
-                    return jsonify({'success': True, 'redirect': url_for('applicant_interviews')})
-                return immediate_redirect(url_for('applicant_interviews', _external=True))
+                    return json_response({'success': True, 'redirect': url_for('applicant_interviews')})
+                return immediate_redirect(back_url)
         
         # GET request - fetch interviews
         interviews = []
         try:
-            # Check if interviews table exists
-            table_exists = False
-            try:
-                cursor.execute("SHOW TABLES LIKE 'interviews'")
-                if cursor.fetchone():
-                    table_exists = True
-            except Exception as table_check_error:
-                print(f'⚠️ Error checking for interviews table: {table_check_error}')
-                # Assume table exists and try to query anyway
-                table_exists = True
-            
-            # Check if applications table exists
-            applications_table_exists = False
-            try:
-                cursor.execute("SHOW TABLES LIKE 'applications'")
-                if cursor.fetchone():
-                    applications_table_exists = True
-            except Exception as app_table_check_error:
-                print(f'⚠️ Error checking for applications table: {app_table_check_error}')
-                applications_table_exists = True
+            # Table/column probes are cached per process (see _table_columns)
+            table_exists = _table_exists(cursor, 'interviews')
+            applications_table_exists = _table_exists(cursor, 'applications')
             
             if table_exists and applications_table_exists and cursor:
                 # Use the simplest possible query first - no dynamic functions, no complex joins
                 # This query should work regardless of schema variations
-                # Determine if the interviews table has a `location` column
-                try:
-                    cursor.execute("SHOW COLUMNS FROM interviews LIKE 'location'")
-                    has_location = bool(cursor.fetchone())
-                except Exception:
-                    has_location = False
-
-                location_select = 'i.location' if has_location else "'' AS location"
-
-                query = f'''
-                    SELECT DISTINCT i.interview_id,
-                           i.scheduled_date,
-                           COALESCE(i.interview_mode, 'in-person') AS interview_mode,
-                           i.interview_mode,
-                           i.notes,
-                           COALESCE(i.status, 'scheduled') AS interview_status,
-                           a.application_id,
-                           COALESCE(a.status, 'pending') AS application_status,
-                           a.job_id,
-                           'Untitled Job' AS job_title,
-                           'Unassigned' AS branch_name,
-                           {location_select} AS location
-                    FROM interviews i
-                    INNER JOIN applications a ON i.application_id = a.application_id
-                    WHERE a.applicant_id = %s
-                    ORDER BY i.scheduled_date DESC
-                '''
+                has_location = _has_column(cursor, 'interviews', 'location')
                 
                 try:
-                    cursor.execute(query, (applicant_id,))
+                    cursor.execute(_applicant_interviews_sql(has_location), (applicant_id,))
+                    # interview_id is the PK and every join is many-to-one, so rows are already unique
                     interviews = cursor.fetchall() or []
-                    
-                    # Deduplicate by interview_id to prevent duplicates
-                    seen_ids = set()
-                    unique_interviews = []
-                    for interview in interviews:
-                        interview_id = interview.get('interview_id')
-                        if interview_id and interview_id not in seen_ids:
-                            seen_ids.add(interview_id)
-                            unique_interviews.append(interview)
-                    interviews = unique_interviews
-                    
-                    # Try to enrich with job title and branch name if possible
-                    if interviews:
-                        try:
-                            # Get job IDs from interviews
-                            job_ids = [int(i.get('job_id')) for i in interviews if i.get('job_id')]
-                            if job_ids:
-                                # Try to get job titles and branch names
-                                jobs_query = '''
-                                    SELECT j.job_id,
-                                           COALESCE(j.job_title, 'Untitled Job') AS job_title,
-                                           COALESCE(b.branch_name, 'Unassigned') AS branch_name
-                                    FROM jobs j
-                                    LEFT JOIN branches b ON j.branch_id = b.branch_id
-                                    WHERE j.job_id IN (%s)
-                                ''' % ','.join(['%s'] * len(job_ids))
-                                cursor.execute(jobs_query, tuple(job_ids))
-                                jobs_data = {row['job_id']: row for row in cursor.fetchall()}
-                                
-                                # Update interviews with job data
-                                for interview in interviews:
-                                    job_id = interview.get('job_id')
-                                    if job_id and job_id in jobs_data:
-                                        job_data = jobs_data[job_id]
-                                        interview['job_title'] = job_data.get('job_title', 'Untitled Job')
-                                        interview['branch_name'] = job_data.get('branch_name', 'Unassigned')
-                        except Exception as enrich_error:
-                            log.warning('⚠️ Error enriching interview data: %s', enrich_error)
-                            # Continue with default values - not critical
-                            pass
                 except Exception as execute_error:
                     log.exception('⚠️ Error executing interview query: %s', execute_error)
+                    _invalidate_schema_cache('interviews', execute_error)
                     # Last resort: absolute minimal query
                     try:
                         # Minimal query fallback - include location if available
-                        try:
-                            cursor.execute("SHOW COLUMNS FROM interviews LIKE 'location'")
-                            has_location_min = bool(cursor.fetchone())
-                        except Exception:
-                            has_location_min = False
-                        location_select_min = 'i.location' if has_location_min else "'' AS location"
-                        minimal_query = f'''
-                            SELECT DISTINCT i.interview_id,
-                                   i.scheduled_date,
-                                   i.interview_mode,
-                                   i.interview_mode,
-                                   i.notes,
-                                   i.status AS interview_status,
-                                   a.application_id,
-                                   a.status AS application_status,
-                                   a.job_id,
-                                   {location_select_min} AS location
-                            FROM interviews i
-                            INNER JOIN applications a ON i.application_id = a.application_id
-                            WHERE a.applicant_id = %s
-                            ORDER BY i.scheduled_date DESC
-                        '''
-                        cursor.execute(minimal_query, (applicant_id,))
+                        has_location_min = _has_column(cursor, 'interviews', 'location')
+                        cursor.execute(_applicant_interviews_sql(has_location_min, minimal=True), (applicant_id,))
                         interviews = cursor.fetchall() or []
                         
-                        # Deduplicate by interview_id
-                        seen_ids = set()
-                        unique_interviews = []
-                        for interview in interviews:
-                            interview_id = interview.get('interview_id')
-                            if interview_id and interview_id not in seen_ids:
-                                seen_ids.add(interview_id)
-                                unique_interviews.append(interview)
-                        interviews = unique_interviews
-                        
                         # Add default values for missing fields
                         for interview in interviews:
                             interview['job_title'] = 'Untitled Job'
@@ -6608,84 +6605,45 @@ def applicant_interviews():
                         log.exception('⚠️ Error executing minimal interview query: %s', minimal_error)
                         interviews = []
         except Exception as query_error:
-            print(f'⚠️ Error fetching interviews: {query_error}')
-            import traceback
-            traceback.print_exc()
+            log.exception('⚠️ Error fetching interviews: %s', query_error)
             interviews = []
         
-        now = datetime.now()
-        upcoming = []
-        past = []
-        
+        # scheduled_date arrives as DATETIME and MySQL computes is_upcoming; only format for display
+        # Rows are already ordered upcoming-first; the template picks upcoming ones via is_upcoming
+        formatted_interviews = []
+        upcoming_count = 0
         for interview in interviews:
-            try:
-                scheduled = interview.get('scheduled_date')
-                interview_status = interview.get('interview_status') or 'scheduled'
-                
-                if not scheduled:
-                    # Skip interviews without a scheduled date
-                    continue
-                
-                # Handle both datetime objects and date strings
-                scheduled_dt = None
-                if isinstance(scheduled, datetime):
-                    scheduled_dt = scheduled
-                elif isinstance(scheduled, date):
-                    # date but not datetime
-                    scheduled_dt = datetime.combine(scheduled, datetime.min.time())
-                elif isinstance(scheduled, str):
-                    try:
-                        scheduled_dt = datetime.strptime(scheduled, '%Y-%m-%d %H:%M:%S')
-                    except ValueError:
-                        try:
-                            scheduled_dt = datetime.strptime(scheduled, '%Y-%m-%d')
-                        except ValueError:
-                            try:
-                                scheduled_dt = datetime.strptime(scheduled, '%Y-%m-%d %H:%M:%S.%f')
-                            except ValueError:
-                                log.warning('⚠️ Could not parse scheduled_date: %s', scheduled)
-                                continue
-                else:
-                    print(f'⚠️ Unexpected scheduled_date type: {type(scheduled)}')
-                    continue
-                
-                if not scheduled_dt:
-                    continue
-                
-                # Format the date safely
-                try:
-                    formatted_date = format_human_datetime(scheduled_dt)
-                except Exception as format_error:
-                    print(f'⚠️ Error formatting date: {format_error}')
-                    formatted_date = str(scheduled_dt)
-                
-                interview_data = {
-                    'interview_id': interview.get('interview_id'),
-                    'application_id': interview.get('application_id'),
-                    'job_title': interview.get('job_title') or 'Unknown Job Position',
-                    'branch_name': interview.get('branch_name') or 'Unassigned',
-                    'scheduled_date': formatted_date,
-                    'interview_mode': interview.get('interview_mode') or 'in-person',
-                    'location': interview.get('location'),
-                    'notes': interview.get('notes'),
-                    'application_status': interview.get('application_status') or 'pending',
-                    'interview_status': interview_status,
-                }
-                
-                if scheduled_dt >= now:
-                    upcoming.append(interview_data)
-                else:
-                    past.append(interview_data)
-            except Exception as process_error:
-                log.exception('⚠️ Error processing interview %s: %s', interview.get('interview_id'), process_error)
+            scheduled = interview.get('scheduled_date')
+            if not scheduled:
+                # Skip interviews without a scheduled date
                 continue
+            try:
+                formatted_date = format_human_datetime(scheduled)
+            except Exception as format_error:
+                log.warning('⚠️ Error formatting date: %s', format_error)
+                formatted_date = str(scheduled)
+            
+            if interview.get('is_upcoming'):
+                upcoming_count += 1
+            formatted_interviews.append({
+                'interview_id': interview.get('interview_id'),
+                'application_id': interview.get('application_id'),
+                'job_title': interview.get('job_title') or 'Unknown Job Position',
+                'branch_name': interview.get('branch_name') or 'Unassigned',
+                'scheduled_date': formatted_date,
+                'interview_mode': interview.get('interview_mode') or 'in-person',
+                'location': interview.get('location'),
+                'notes': interview.get('notes'),
+                'application_status': interview.get('application_status') or 'pending',
+                'interview_status': interview.get('interview_status') or 'scheduled',
+                'is_upcoming': bool(interview.get('is_upcoming')),
+            })
             
         # Ensure we always return valid data
         return render_template(
             'applicant/interviews.html', 
-            interviews=upcoming + past, 
-            upcoming=upcoming or [], 
-            past=past or []
+            interviews=formatted_interviews, 
+            upcoming_count=upcoming_count
         )
     except Exception as exc:
         if db:
@@ -6724,8 +6682,7 @@ def applicant_interviews():
             return render_template(
                 'applicant/interviews.html', 
                 interviews=[], 
-                upcoming=[], 
-                past=[]
+                upcoming_count=0
             )
         except Exception as template_error:
             # If template rendering fails, return a simple text response
@@ -6750,16 +6707,13 @@ def applicant_notifications():
         flash('Database connection error.', 'error')
         return render_template('applicant/communications.html', notifications=[], unread_count=0, preferences={})
     
-    cursor = db.cursor(dictionary=True)
+    # Plain tuple cursor: listing rows are unpacked positionally (schema probes accept tuple rows too)
+    cursor = db.cursor()
     try:
-        # Fetch notifications
-        # Ensure schema compatibility
-        ensure_schema_compatibility()
-        
-        # Verify notifications table exists before continuing
-        cursor.execute("SHOW TABLES LIKE 'notifications'")
-        table_exists = cursor.fetchone()
-        if not table_exists:
+        # Schema upgrades run once per process from the ensure_schema_once() before_request hook
+        # Verify notifications table exists before continuing (cached column probe)
+        notification_columns = _table_columns(cursor, 'notifications')
+        if not notification_columns:
             return render_template(
                 'applicant/communications.html',
                 notifications=[],
@@ -6771,13 +6725,9 @@ def applicant_notifications():
                 },
             )
         
-        # Check notifications table columns
-        cursor.execute('SHOW COLUMNS FROM notifications')
-        notification_columns = {row.get('Field') for row in (cursor.fetchall() or []) if row}
-        
         has_application_fk = 'application_id' in notification_columns
         if not has_application_fk:
-            print('⚠️ Notifications table missing application_id column; skipping applicant notifications view.')
+            log.warning('⚠️ Notifications table missing application_id column; skipping applicant notifications view.')
             preferences = {
                 'email_enabled': True,
                 'email_frequency': 'immediate',
@@ -6804,18 +6754,32 @@ def applicant_notifications():
         else:
             is_read_expr = '0'
         
-        # Get dynamic job column expressions
-        _update_job_columns(cursor)
+        # Get dynamic job column expressions (jobs columns are introspected once per process)
+        if not JOB_COLUMNS:
+            _update_job_columns(cursor)
         job_title_expr = job_column_expr('job_title', alternatives=['title'], default="'System Notification'")
         
+        # Applicant-facing notifications only (application submitted, status change, hired)
+        if 'message_type' in notification_columns:
+            message_filter = 'n.message_type IN (%s, %s, %s)'
+            message_params = APPLICANT_NOTIFICATION_TYPES
+        else:
+            message_filter = '''(
+                n.message LIKE 'You applied for%'
+                OR n.message LIKE 'Your application status%'
+                OR n.message LIKE 'Congratulations! You have been hired%'
+            )'''
+            message_params = ()
+        
+        # Column order matches the tuple unpacking below
         select_fields = [
             'n.notification_id',
             'n.message',
             f'{sent_at_expr} AS sent_at',
             f'{is_read_expr} AS is_read',
             'n.application_id',
-            'COALESCE(a.status, \'\') AS application_status',
             f'COALESCE({job_title_expr}, \'System Notification\') AS job_title',
+            'COALESCE(a.status, \'\') AS application_status',
         ]
         query = f'''
             SELECT DISTINCT {', '.join(select_fields)}
@@ -6823,18 +6787,25 @@ def applicant_notifications():
             JOIN applications a ON n.application_id = a.application_id
             LEFT JOIN jobs j ON a.job_id = j.job_id
             WHERE a.applicant_id = %s
-            AND (
-                n.message LIKE 'You applied for%'
-                OR n.message LIKE 'Your application status%'
-                OR n.message LIKE 'Congratulations! You have been hired%'
-            )
+            AND {message_filter}
             ORDER BY {sent_at_expr} DESC
             LIMIT 50
         '''
-        cursor.execute(query, (applicant_id,))
-        notifications = cursor.fetchall()
-        
-        unread_count = len([n for n in notifications if not n.get('is_read')])
+        cursor.execute(query, (applicant_id,) + message_params)
+        formatted_notifications = [
+            {
+                'notification_id': notification_id,
+                'message': message,
+                'sent_at': format_human_datetime(sent_at),
+                'is_read': is_read,
+                'application_id': application_id,
+                'job_title': job_title,
+                'application_status': application_status,
+            }
+            for notification_id, message, sent_at, is_read, application_id, job_title, application_status
+            in cursor.fetchall()
+        ]
+        unread_count = sum(1 for notif in formatted_notifications if not notif['is_read'])
         
         # Fetch notification preferences (if table exists)
         preferences = {
@@ -6843,18 +6814,6 @@ def applicant_notifications():
             'categories': ['application_updates', 'interview_alerts', 'system_messages'],
         }
         
-        formatted_notifications = []
-        for notif in notifications:
-            formatted_notifications.append({
-                'notification_id': notif.get('notification_id'),
-                'message': notif.get('message'),
-                'sent_at': format_human_datetime(notif.get('sent_at')),
-                'is_read': notif.get('is_read', False),
-                'application_id': notif.get('application_id'),
-                'job_title': notif.get('job_title'),
-                'application_status': notif.get('application_status'),
-            })
-        
         return render_template(
             'applicant/communications.html',
             notifications=formatted_notifications,
@@ -6862,12 +6821,12 @@ def applicant_notifications():
             preferences=preferences,
         )
     except Exception as exc:
-        if db:
-            db.rollback()
-        import traceback
-        error_details = traceback.format_exc()
-        print(f'❌ Applicant notifications error: {exc}')
-        print(f'Full traceback: {error_details}')
+        # Read-only handler: nothing to roll back
+        _invalidate_schema_cache('notifications', exc)
+        if getattr(exc, 'errno', None) == 1054:
+            # A jobs column may have been renamed; re-inspect on the next request
+            JOB_COLUMNS.clear()
+        log.exception('❌ Applicant notifications error: %s', exc)
         flash('Unable to load notifications. Please try again later.', 'error')
         return render_template('applicant/communications.html', notifications=[], unread_count=0, preferences={})
     finally:
@@ -6875,40 +6834,48 @@ def applicant_notifications():
             cursor.close()
 
 
+@lru_cache(maxsize=4)
+def _notification_read_sql(synced, single):
+    """Build the applicant mark-read UPDATE once per ownership variant so the statement text stays stable."""
+    owner_join = '' if synced else 'JOIN applications a ON n.application_id = a.application_id'
+    owner_where = 'n.applicant_id = %s' if synced else 'a.applicant_id = %s'
+    if single:
+        return f'UPDATE notifications n {owner_join} SET n.is_read = 1 WHERE n.notification_id = %s AND {owner_where}'
+    return f'UPDATE notifications n {owner_join} SET n.is_read = 1 WHERE {owner_where} AND n.is_read = 0'
+
+
 @app.route('/applicant/notifications/read-all', methods=['POST'])
 @login_required('applicant')
 def mark_all_notifications_read():
     """Mark all notifications as read for the applicant."""
     applicant_id = session.get('user_id')
+    # AJAX callers send JSON or X-Requested-With; the Accept header is only parsed as a last resort
+    wants_json = (
+        request.is_json
+        or request.headers.get('X-Requested-With') == 'XMLHttpRequest'
+        or request.accept_mimetypes.accept_json
+    )
     db = get_db()
     if not db:
         # Fallback to HTML flow
-        if request.accept_mimetypes.accept_json:
+        if wants_json:
             return jsonify({'success': False, 'error': 'Database connection error'}), 500
         flash('Database connection error.', 'error')
         return redirect(url_for('applicant_notifications'))
     
-    cursor = db.cursor(dictionary=True)
+    cursor = db.cursor()
     try:
-        cursor.execute(
-            '''
-            UPDATE notifications n
-            JOIN applications a ON n.application_id = a.application_id
-            SET n.is_read = 1
-            WHERE a.applicant_id = %s AND n.is_read = 0
-            ''',
-            (applicant_id,),
-        )
+        cursor.execute(_notification_read_sql(HAS_NOTIFICATION_APPLICANT_SYNC, False), (applicant_id,))
         db.commit()
         # Content negotiation: JSON for AJAX, redirect with flash otherwise
-        if request.is_json or request.headers.get('X-Requested-With') == 'XMLHttpRequest' or request.accept_mimetypes.accept_json:
+        if wants_json:
             return jsonify({'success': True, 'message': 'All notifications marked as read'})
         flash('All notifications marked as read.', 'success')
         return redirect(url_for('applicant_notifications'))
     except Exception as exc:
         db.rollback()
         print(f'❌ Mark all notifications read error: {exc}')
-        if request.is_json or request.headers.get('X-Requested-With') == 'XMLHttpRequest' or request.accept_mimetypes.accept_json:
+        if wants_json:
             return jsonify({'success': False, 'error': str(exc)}), 500
         flash('Failed to mark notifications as read.', 'error')
         return redirect(url_for('applicant_notifications'))
@@ -6921,34 +6888,31 @@ def mark_all_notifications_read():
 def mark_notification_read(notification_id):
     """Mark a notification as read."""
     applicant_id = session.get('user_id')
+    wants_json = (
+        request.is_json
+        or request.headers.get('X-Requested-With') == 'XMLHttpRequest'
+        or request.accept_mimetypes.accept_json
+    )
     db = get_db()
     if not db:
-        if request.accept_mimetypes.accept_json:
+        if wants_json:
             return jsonify({'success': False, 'error': 'Database error'}), 500
         flash('Database connection error.', 'error')
         return redirect(url_for('applicant_notifications'))
     
     cursor = db.cursor()
     try:
-        # Verify ownership
-        cursor.execute(
-            '''
-            UPDATE notifications n
-            JOIN applications a ON n.application_id = a.application_id
-            SET n.is_read = TRUE
-            WHERE n.notification_id = %s AND a.applicant_id = %s
-            ''',
-            (notification_id, applicant_id),
-        )
+        # Ownership is part of the WHERE clause
+        cursor.execute(_notification_read_sql(HAS_NOTIFICATION_APPLICANT_SYNC, True), (notification_id, applicant_id))
         db.commit()
-        if request.is_json or request.headers.get('X-Requested-With') == 'XMLHttpRequest' or request.accept_mimetypes.accept_json:
+        if wants_json:
             return jsonify({'success': True})
         flash('Notification marked as read.', 'success')
         return redirect(url_for('applicant_notifications'))
     except Exception as exc:
         db.rollback()
         print(f'❌ Mark notification read error: {exc}')
-        if request.is_json or request.headers.get('X-Requested-With') == 'XMLHttpRequest' or request.accept_mimetypes.accept_json:
+        if wants_json:
             return jsonify({'success': False, 'error': str(exc)}), 500
         flash('Failed to mark notification as read.', 'error')
         return redirect(url_for('applicant_notifications'))
@@ -6960,12 +6924,10 @@ def mark_notification_read(notification_id):
 @login_required('applicant')
 def update_notification_preferences():
     """Update notification preferences."""
-    applicant_id = session.get('user_id')
-    email_enabled = request.form.get('email_enabled') == 'on'
-    email_frequency = request.form.get('email_frequency', 'immediate')
-    
-    # Store preferences (could be in a separate table)
-    # For now, just flash success
+    # Preferences are not persisted yet (could be in a separate table), so the form isn't parsed.
+    # AJAX callers get an empty 204 instead of a redirect that re-renders the notification center.
+    if request.is_json or request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return '', 204
     flash('Notification preferences updated successfully.', 'success')
     return redirect(url_for('applicant_notifications'))
 
@@ -6982,21 +6944,26 @@ def delete_all_applicant_notifications():
     applicant_id = session.get('user_id')
     cursor = db.cursor()
     try:
-        # Ensure notifications table exists
-        cursor.execute("SHOW TABLES LIKE 'notifications'")
-        if not cursor.fetchone():
+        # Introspect columns to decide deletion strategy (cached; empty when the table is missing)
+        notification_columns = _table_columns(cursor, 'notifications')
+        if not notification_columns:
             flash('No notifications to delete.', 'info')
             return redirect(url_for('applicant_notifications'))
 
-        # Introspect columns to decide deletion strategy
-        cursor.execute('SHOW COLUMNS FROM notifications')
-        notification_columns = {row[0] if isinstance(row, (list, tuple)) else row.get('Field') for row in (cursor.fetchall() or []) if row}
-
-        # Delete notifications explicitly targeted to this applicant
-        if 'applicant_id' in notification_columns:
+        # One DELETE covers notifications addressed to the applicant and those linked through their applications
+        if HAS_NOTIFICATION_APPLICANT_SYNC:
+            # applicant_id is filled for every notification (trigger + backfill), so no join is needed
             cursor.execute('DELETE FROM notifications WHERE applicant_id = %s', (applicant_id,))
-        # Also delete notifications linked via application -> applicant
-        if 'application_id' in notification_columns:
+        elif 'applicant_id' in notification_columns and 'application_id' in notification_columns:
+            cursor.execute(
+                '''
+                DELETE n FROM notifications n
+                LEFT JOIN applications a ON n.application_id = a.application_id
+                WHERE n.applicant_id = %s OR a.applicant_id = %s
+                ''',
+                (applicant_id, applicant_id)
+            )
+        elif 'application_id' in notification_columns:
             cursor.execute(
                 '''
                 DELETE n FROM notifications n
@@ -7005,49 +6972,10 @@ def delete_all_applicant_notifications():
                 ''',
                 (applicant_id,)
             )
-
-        deleted = cursor.rowcount
+        elif 'applicant_id' in notification_columns:
+            cursor.execute('DELETE FROM notifications WHERE applicant_id = %s', (applicant_id,))
         db.commit()
 
-        # Final cleanup: remove any JSON-response notifications or leftover messages related to deletion
-        try:
-            if 'application_id' in notification_columns:
-                cursor.execute(
-                    '''
-                    DELETE n FROM notifications n
-                    LEFT JOIN applications a ON n.application_id = a.application_id
-                    WHERE (n.applicant_id = %s OR a.applicant_id = %s OR n.application_id IS NULL)
-                    AND (
-                        (n.message LIKE '{%' AND (n.message LIKE '%"success"%' OR n.message LIKE '%"message"%' OR n.message LIKE '%"error"%'))
-                        OR n.message = 'Notifications deleted.'
-                        OR n.message LIKE '%Notifications deleted%'
-                        OR n.message LIKE '%All notifications deleted%'
-                        OR n.message LIKE '%Notification deleted successfully%'
-                    )
-                    ''',
-                    (applicant_id, applicant_id),
-                )
-            else:
-                cursor.execute(
-                    '''
-                    DELETE FROM notifications
-                    WHERE applicant_id = %s
-                    AND (
-                        (message LIKE '{%' AND (message LIKE '%"success"%' OR message LIKE '%"message"%' OR message LIKE '%"error"%'))
-                        OR message = 'Notifications deleted.'
-                        OR message LIKE '%Notifications deleted%'
-                        OR message LIKE '%All notifications deleted%'
-                        OR message LIKE '%Notification deleted successfully%'
-                    )
-                    ''',
-                    (applicant_id,)
-                )
-            final_cleaned = cursor.rowcount
-            if final_cleaned > 0:
-                db.commit()
-        except Exception as cleanup_err:
-            print(f'⚠️ Error cleaning up JSON notifications for applicant {applicant_id}: {cleanup_err}')
-
         flash('All notifications deleted.', 'success')
     except Exception as exc:
         db.rollback()
@@ -7060,6 +6988,49 @@ def delete_all_applicant_notifications():
     return redirect(url_for('applicant_notifications'))
 
 
+def _login_history_sql(session_columns):
+    """Build the recent auth_sessions SELECT for the columns present (params: auth user id, applicant id)."""
+    # Some schemas use 'login_time', others 'created_at' or 'last_login'
+    if 'login_time' in session_columns:
+        login_expr = 'login_time'
+    elif 'created_at' in session_columns:
+        login_expr = 'created_at'
+    elif 'last_login' in session_columns:
+        login_expr = 'last_login'
+    else:
+        login_expr = 'NULL'
+    if 'last_activity' in session_columns and 'logout_time' in session_columns:
+        logout_expr = 'COALESCE(last_activity, logout_time)'
+    elif 'logout_time' in session_columns:
+        logout_expr = 'logout_time'
+    elif 'last_activity' in session_columns:
+        logout_expr = 'last_activity'
+    else:
+        logout_expr = 'NULL'
+    ip_expr = "COALESCE(ip_address, 'Unknown')" if 'ip_address' in session_columns else "'Unknown'"
+    agent_expr = "COALESCE(user_agent, 'Unknown')" if 'user_agent' in session_columns else "'Unknown'"
+    return f'''
+        SELECT {login_expr} AS login_time,
+               {logout_expr} AS logout_time,
+               COALESCE(is_active, 1) AS is_active,
+               {ip_expr} AS ip_address,
+               {agent_expr} AS user_agent
+        FROM auth_sessions
+        WHERE user_id = COALESCE(%s, (SELECT user_id FROM applicants WHERE applicant_id = %s LIMIT 1))
+        ORDER BY {login_expr} DESC
+        LIMIT 10
+    '''
+
+
+@lru_cache(maxsize=4)
+def _notification_stats_sql(has_is_read, synced):
+    """Build the applicant notification COUNT/unread query once per schema variant."""
+    owner_join = '' if synced else 'JOIN applications a ON n.application_id = a.application_id'
+    owner_where = 'n.applicant_id = %s' if synced else 'a.applicant_id = %s'
+    unread_expr = 'SUM(CASE WHEN COALESCE(n.is_read, 0) = 0 THEN 1 ELSE 0 END)' if has_is_read else '0'
+    return f'SELECT COUNT(*) AS total, {unread_expr} AS unread FROM notifications n {owner_join} WHERE {owner_where}'
+
+
 @app.route('/applicant/account')
 @login_required('applicant')
 def applicant_account():
@@ -7073,147 +7044,84 @@ def applicant_account():
 
     cursor = db.cursor(dictionary=True)
     try:
-        cursor.execute(
-            '''
-            SELECT full_name,
-                   email,
-                   phone_number,
-                   created_at,
-                   last_login
-            FROM applicants
-            WHERE applicant_id = %s
-            LIMIT 1
-            ''',
+        # Column probes are cached per process, so every statement variant is resolved without a round trip
+        session_columns = _table_columns(cursor, 'auth_sessions')
+        has_notifications = _table_exists(cursor, 'notifications')
+
+        # Profile, login history and notification counts go to the server as one multi-statement batch.
+        # user_id comes back with the profile, and the sessions query resolves it itself when the
+        # session doesn't carry auth_user_id, so no separate lookup is needed.
+        # Each section is (label, SQL, params); only the profile is required for the page to render.
+        sections = [(
+            'profile',
+            'SELECT full_name, email, phone_number, created_at, last_login, user_id '
+            'FROM applicants WHERE applicant_id = %s LIMIT 1',
             (applicant_id,),
-        )
-        account = cursor.fetchone() or {}
+        )]
+        if session_columns:
+            sections.append(('login history', _login_history_sql(session_columns), (auth_user_id, applicant_id)))
+        if has_notifications:
+            has_is_read = _has_column(cursor, 'notifications', 'is_read')
+            sections.append((
+                'notification stats',
+                _notification_stats_sql(has_is_read, HAS_NOTIFICATION_APPLICANT_SYNC),
+                (applicant_id,),
+            ))
+
+        result_sets = []
+        try:
+            for result in cursor.execute(
+                ';\n'.join(sql for _, sql, _ in sections),
+                tuple(param for _, _, section_params in sections for param in section_params),
+                multi=True,
+            ):
+                if result.with_rows:
+                    result_sets.append(result.fetchall() or [])
+        except Exception as batch_error:
+            for table_name in ('auth_sessions', 'notifications'):
+                _invalidate_schema_cache(table_name, batch_error)
+            # An optional section must not take the whole page down: rerun the sections one by one so
+            # a failing login history or notifications query only empties its own part of the page
+            log.warning('⚠️ Account batch failed, loading sections separately: %s', batch_error)
+            result_sets = []
+            for label, sql, section_params in sections:
+                try:
+                    cursor.execute(sql, section_params)
+                    result_sets.append(cursor.fetchall() or [])
+                except Exception as section_error:
+                    if label == 'profile':
+                        raise
+                    log.exception('⚠️ Error fetching %s: %s', label, section_error)
+                    result_sets.append([])
+
+        account = (result_sets[0] or [{}])[0]
+        sessions = result_sets[1] if session_columns else []
+        stats_rows = result_sets[-1] if has_notifications else []
+        communications_stats = (stats_rows or [None])[0] or {'total': 0, 'unread': 0}
 
         for key in ['created_at', 'last_login']:
             if account.get(key):
                 account[key] = format_human_datetime(account.get(key))
 
-        # Ensure schema compatibility
-        ensure_schema_compatibility()
-        
-        # Check auth_sessions table columns
-        cursor.execute('SHOW COLUMNS FROM auth_sessions')
-        session_columns_raw = cursor.fetchall() or []
-        session_columns = {row.get('Field') if isinstance(row, dict) else row[0] for row in session_columns_raw if row}
-        
-        # Build logout_time expression
-        if 'last_activity' in session_columns and 'logout_time' in session_columns:
-            logout_expr = 'COALESCE(last_activity, logout_time)'
-        elif 'logout_time' in session_columns:
-            logout_expr = 'logout_time'
-        elif 'last_activity' in session_columns:
-            logout_expr = 'last_activity'
-        else:
-            logout_expr = 'NULL'
-        
-        # Use auth_user_id (from users table) for auth_sessions query
-        # If auth_user_id is not available, try to get it from applicants table
-        if not auth_user_id:
-            cursor.execute(
-                'SELECT user_id FROM applicants WHERE applicant_id = %s LIMIT 1',
-                (applicant_id,),
-            )
-            user_record = cursor.fetchone()
-            if user_record:
-                auth_user_id = user_record.get('user_id')
-        
         login_history = []
         active_sessions = 0
-        
-        if auth_user_id:
-            try:
-                # Check which columns exist in auth_sessions
-                has_ip_address = 'ip_address' in session_columns
-                has_user_agent = 'user_agent' in session_columns
-                
-                # Determine login_time expression (some schemas use 'login_time', others use 'created_at')
-                if 'login_time' in session_columns:
-                    login_expr = 'login_time'
-                elif 'created_at' in session_columns:
-                    login_expr = 'created_at'
-                elif 'last_login' in session_columns:
-                    login_expr = 'last_login'
-                else:
-                    login_expr = 'NULL'
-
-                # Build SELECT statement dynamically based on available columns
-                select_fields = [f'{login_expr} AS login_time', f'{logout_expr} AS logout_time', 'COALESCE(is_active, 1) AS is_active']
-                if has_ip_address:
-                    select_fields.append("COALESCE(ip_address, 'Unknown') AS ip_address")
-                else:
-                    select_fields.append("'Unknown' AS ip_address")
-                
-                if has_user_agent:
-                    select_fields.append("COALESCE(user_agent, 'Unknown') AS user_agent")
-                else:
-                    select_fields.append("'Unknown' AS user_agent")
-                
-                cursor.execute(
-                    f'''
-                    SELECT {', '.join(select_fields)}
-                    FROM auth_sessions
-                    WHERE user_id = %s
-                    ORDER BY {login_expr} DESC
-                    LIMIT 10
-                    ''',
-                    (auth_user_id,),
-                )
-                sessions = cursor.fetchall() or []
-                
-                for row in sessions:
-                    is_active = bool(row.get('is_active', 1))
-                    if is_active:
-                        active_sessions += 1
-                    logout_value = format_human_datetime(row.get('logout_time')) if row.get('logout_time') else None
-                    if is_active:
-                        logout_value = None
-                    login_history.append(
-                        {
-                            'login_time': format_human_datetime(row.get('login_time')),
-                            'logout_time': logout_value,
-                            'ip_address': row.get('ip_address') or '—',
-                            'user_agent': row.get('user_agent') or 'Unknown device',
-                            'status': 'Active' if is_active else 'Signed out',
-                            'is_active': is_active,
-                        }
-                    )
-            except Exception as session_error:
-                log.exception('⚠️ Error fetching login history: %s', session_error)
-                login_history = []
-                active_sessions = 0
-        
-        # Check notifications table for is_read column
-        try:
-            cursor.execute('SHOW COLUMNS FROM notifications LIKE %s', ('is_read',))
-            has_is_read = cursor.fetchone() is not None
-            
-            if has_is_read:
-                notif_query = '''
-                    SELECT 
-                        COUNT(*) AS total,
-                        SUM(CASE WHEN COALESCE(n.is_read, 0) = 0 THEN 1 ELSE 0 END) AS unread
-                    FROM notifications n
-                    JOIN applications a ON n.application_id = a.application_id
-                    WHERE a.applicant_id = %s
-                '''
-            else:
-                notif_query = '''
-                    SELECT 
-                        COUNT(*) AS total,
-                        0 AS unread
-                    FROM notifications n
-                    JOIN applications a ON n.application_id = a.application_id
-                    WHERE a.applicant_id = %s
-                '''
-            cursor.execute(notif_query, (applicant_id,))
-        except Exception:
-            # If notifications table doesn't exist or query fails, set defaults
-            pass
-        communications_stats = cursor.fetchone() or {'total': 0, 'unread': 0}
+        for row in sessions:
+            is_active = bool(row.get('is_active', 1))
+            if is_active:
+                active_sessions += 1
+            logout_value = format_human_datetime(row.get('logout_time')) if row.get('logout_time') else None
+            if is_active:
+                logout_value = None
+            login_history.append(
+                {
+                    'login_time': format_human_datetime(row.get('login_time')),
+                    'logout_time': logout_value,
+                    'ip_address': row.get('ip_address') or '—',
+                    'user_agent': row.get('user_agent') or 'Unknown device',
+                    'status': 'Active' if is_active else 'Signed out',
+                    'is_active': is_active,
+                }
+            )
 
         account_overview = {
             'full_name': account.get('full_name'),
@@ -7236,7 +7144,7 @@ def applicant_account():
 
         return render_template('applicant/account.html', account=account_overview, preferences=preferences)
     except Exception as exc:
-        db.rollback()
+        # Read-only handler: nothing to roll back
         import traceback
         error_details = traceback.format_exc()
         print(f'❌ Applicant account settings error: {exc}')
@@ -7253,6 +7161,103 @@ def applicant_account():
             cursor.close()
 
 
+_autoinc_step = None
+
+
+def _consecutive_autoinc_step(cursor):
+    """Return the id step when multi-row INSERTs get consecutive ids (lock mode 0/1), else 0; probed once."""
+    global _autoinc_step
+    if _autoinc_step is None:
+        try:
+            cursor.execute('SELECT @@innodb_autoinc_lock_mode, @@auto_increment_increment')
+            row = cursor.fetchone()
+            values = list(row.values()) if isinstance(row, dict) else list(row or ())
+            lock_mode, increment = int(values[0]), int(values[1])
+            # Interleaved mode (2, the MySQL 8 default) may hand out gaps inside a single multi-row INSERT
+            _autoinc_step = increment if lock_mode in (0, 1) else 0
+        except Exception as exc:
+            log.warning('⚠️ Could not read auto-increment settings: %s', exc)
+            _autoinc_step = 0
+    return _autoinc_step
+
+
+def _insert_resumes(cursor, applicant_id, uploads):
+    """Insert resumes rows for saved uploads [(file_info, file_type), ...] in one statement; return ids in order."""
+    if not uploads:
+        return []
+    columns = ['applicant_id', 'file_name', 'file_path', 'file_type']
+    with_size = _has_column(cursor, 'resumes', 'file_size_bytes')
+    if with_size:
+        columns.append('file_size_bytes')
+    rows = []
+    for file_info, file_type in uploads:
+        row = [
+            applicant_id,
+            file_info['original_filename'],
+            file_info.get('storage_path') or file_info.get('file_path', ''),
+            file_type,
+        ]
+        if with_size:
+            row.append(file_info.get('file_size'))
+        rows.append(tuple(row))
+    sql = f"INSERT INTO resumes ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})"
+    if len(rows) == 1:
+        cursor.execute(sql, rows[0])
+        return [cursor.lastrowid]
+    # executemany rewrites this into a single multi-row INSERT; lastrowid is the first new id
+    step = _consecutive_autoinc_step(cursor)
+    cursor.executemany(sql, rows)
+    if step and cursor.lastrowid and cursor.rowcount == len(rows):
+        return list(range(cursor.lastrowid, cursor.lastrowid + step * len(rows), step))
+    # Ids may not be consecutive: stored paths are unique (uuid file names), so read them back by path
+    paths = [row[2] for row in rows]
+    cursor.execute(
+        f"SELECT resume_id, file_path FROM resumes WHERE applicant_id = %s AND file_path IN ({', '.join(['%s'] * len(paths))})",
+        (applicant_id, *paths),
+    )
+    ids_by_path = {}
+    for found in cursor.fetchall() or []:
+        if isinstance(found, dict):
+            ids_by_path[found.get('file_path')] = found.get('resume_id')
+        else:
+            ids_by_path[found[1]] = found[0]
+    return [ids_by_path.get(path) for path in paths]
+
+
+def _insert_resume(cursor, applicant_id, file_info, file_type='resume'):
+    """Insert a resumes row for a saved upload (recording its size when the column exists); return its id."""
+    return _insert_resumes(cursor, applicant_id, [(file_info, file_type)])[0]
+
+
+def _resume_file_size(row):
+    """Return the stored upload size, or a single os.stat() of the file for rows saved before it was recorded."""
+    size = row.get('file_size_bytes')
+    if size is not None:
+        return size
+    fp = (row.get('file_path') or '').replace('\\', '/')
+    if not fp:
+        return 0
+    try:
+        return os.stat(os.path.join(app.instance_path, fp)).st_size
+    except OSError:
+        return 0
+
+
+@lru_cache(maxsize=64)
+def _allowed_extension_set(allowed_raw):
+    """Parse a job's comma-separated allowed_extensions into a frozenset (empty means any type)."""
+    if not allowed_raw:
+        return frozenset()
+    return frozenset(p.strip().lstrip('.').lower() for p in str(allowed_raw).split(',') if p.strip())
+
+
+def _extension_allowed(file_name, allowed_set):
+    """True when file_name's extension is in allowed_set (files without an extension are let through)."""
+    file_name = file_name or ''
+    ext = file_name.rsplit('.', 1)[-1].lower() if '.' in file_name else ''
+    return not allowed_set or not ext or ext in allowed_set
+
+
 @app.route('/applicant/upload-resume', methods=['POST'])
 @login_required('applicant')
 def upload_resume_before_apply():
@@ -7264,8 +7269,9 @@ def upload_resume_before_apply():
     
     cursor = db.cursor(dictionary=True)
     try:
-        resume_file = request.files.get('resume_file')
-        if not resume_file or not resume_file.filename:
+        # Several documents (resume, letter, license) may arrive in one multipart request
+        resume_files = [f for f in request.files.getlist('resume_file') if f and f.filename]
+        if not resume_files:
             return jsonify({'success': False, 'error': 'No file provided.'}), 400
 
         # If job-specific file rules exist, fetch them and pass to the saver
@@ -7274,8 +7280,9 @@ def upload_resume_before_apply():
         max_size_mb = None
         try:
             if job_id:
-                ensure_schema_compatibility()
-                _update_job_columns(cursor)
+                # Schema upgrades run once per process (ensure_schema_once); jobs columns are cached
+                if not JOB_COLUMNS:
+                    _update_job_columns(cursor)
                 # Whitelist allowed column names to prevent SQL injection
                 ALLOWED_JOB_COLUMNS = {'allowed_extensions', 'max_file_size_mb'}
                 sel = []
@@ -7300,35 +7307,33 @@ def upload_resume_before_apply():
             allowed_exts = None
             max_size_mb = None
 
-        file_info, error = save_uploaded_file(resume_file, applicant_id, allowed_extensions=allowed_exts, max_file_size_mb=max_size_mb)
-        if not file_info:
-            return jsonify({'success': False, 'error': error or 'Unable to process the uploaded resume file.'}), 400
-        
-        # Respect file_type provided by the client (resume, letter, license)
-        file_type = (request.form.get('file_type') or 'resume').strip().lower()
-        if file_type not in ('resume', 'letter', 'license'):
-            file_type = 'resume'
+        # Respect file_type provided by the client (resume, letter, license), one per file or one for all
+        file_types = request.form.getlist('file_type') or ['resume']
+        uploads = []
+        for index, resume_file in enumerate(resume_files):
+            file_info, error = save_uploaded_file(resume_file, applicant_id, allowed_extensions=allowed_exts, max_file_size_mb=max_size_mb)
+            if not file_info:
+                # Don't leave earlier files of this request orphaned on disk
+                for saved_info, _ in uploads:
+                    try:
+                        os.remove(os.path.join(app.instance_path, saved_info['storage_path']))
+                    except OSError:
+                        pass
+                return jsonify({'success': False, 'error': error or 'Unable to process the uploaded resume file.'}), 400
+            file_type = (file_types[min(index, len(file_types) - 1)] or 'resume').strip().lower()
+            if file_type not in ('resume', 'letter', 'license'):
+                file_type = 'resume'
+            uploads.append((file_info, file_type))
 
-        cursor.execute(
-            '''
-            INSERT INTO resumes (applicant_id, file_name, file_path, file_type)
-            VALUES (%s, %s, %s, %s)
-            ''',
-            (
-                applicant_id,
-                file_info['original_filename'],
-                file_info.get('storage_path') or file_info.get('file_path', ''),
-                file_type,
-            ),
-        )
-        resume_id = cursor.lastrowid
+        resume_ids = _insert_resumes(cursor, applicant_id, uploads)
         db.commit()
         
         return jsonify({
             'success': True,
-            'resume_id': resume_id,
-            'file_name': file_info['original_filename'],
-            'message': 'Resume uploaded successfully!'
+            'resume_id': resume_ids[0],
+            'resume_ids': resume_ids,
+            'file_name': uploads[0][0]['original_filename'],
+            'message': 'Resume uploaded successfully!' if len(uploads) == 1 else f'{len(uploads)} files uploaded successfully!'
         }), 200
     except Exception as exc:
         db.rollback()
@@ -7351,6 +7356,9 @@ def apply_to_job(job_id=None):
     
     cursor = db.cursor(dictionary=True)
     try:
+        # Stored upload sizes spare the resume listings a filesystem stat per row
+        resume_size_expr = 'r.file_size_bytes' if _has_column(cursor, 'resumes', 'file_size_bytes') else 'NULL'
+
         # Check if editing existing application - accept edit id from querystring OR form POST
         edit_application_id = request.args.get('edit', type=int)
         if not edit_application_id:
@@ -7386,58 +7394,68 @@ def apply_to_job(job_id=None):
             # Force use of existing job_id - ignore any job_id from form
             job_id = existing_app.get('job_id')
         
-        # Check if already applied (for new applications only) - run during GET or when route-enforced job_id is final
-        if request.method == 'GET' and not edit_application_id and job_id:
-            cursor.execute(
-                'SELECT application_id FROM applications WHERE applicant_id = %s AND job_id = %s LIMIT 1',
-                (applicant_id, job_id),
-            )
-            if cursor.fetchone():
-                flash('You have already applied for this position.', 'warning')
-                return redirect(url_for('jobs'))
-        
-        # Get all available jobs for dropdown (when editing)
-        ensure_schema_compatibility()
-        _update_job_columns(cursor)
+        # Resolve job column expressions for the job lookup and the dropdown (schema upgrades run once per
+        # process from ensure_schema_once; jobs columns are cached)
+        if not JOB_COLUMNS:
+            _update_job_columns(cursor)
         job_title_expr = job_column_expr('job_title', alternatives=['title'], default="'Untitled Job'")
         job_description_expr = job_column_expr('job_description', alternatives=['description'])
         job_requirements_expr = job_column_expr('job_requirements', alternatives=['requirements'])
         job_allowed_ext_expr = job_column_expr('allowed_extensions')
         job_max_size_expr = job_column_expr('max_file_size_mb')
         
-        # Fetch all open/active jobs for the job selector
-        status_placeholders = ','.join(['%s'] * len(PUBLISHABLE_JOB_STATUSES))
-        cursor.execute(
-            f'''
-            SELECT 
+        job_columns = f'''
                 j.job_id,
+                j.branch_id,
                 {job_title_expr} AS job_title,
                 {job_description_expr} AS job_description,
                 {job_requirements_expr} AS job_requirements,
                 {job_allowed_ext_expr} AS allowed_extensions,
                 {job_max_size_expr} AS max_file_size_mb,
                 COALESCE(b.branch_name, 'Unassigned') AS branch_name,
-                {job_title_expr} AS position_title
-            FROM jobs j
-            LEFT JOIN branches b ON j.branch_id = b.branch_id
-            WHERE j.status IN ({status_placeholders})
-            ORDER BY j.created_at DESC, j.job_id DESC
-            ''',
-            tuple(PUBLISHABLE_JOB_STATUSES),
-        )
-        all_jobs = cursor.fetchall()
-        
-        # Get specific job details if job_id is provided
+                {job_title_expr} AS position_title'''
+        job_from = 'FROM jobs j LEFT JOIN branches b ON j.branch_id = b.branch_id'
+        status_placeholders = ','.join(['%s'] * len(PUBLISHABLE_JOB_STATUSES))
+
+        # Get specific job details if job_id is provided (editing always carries the existing job_id),
+        # flagging an existing application for this applicant in the same round-trip
         job = None
         if job_id:
-            job = next((j for j in all_jobs if j.get('job_id') == job_id), None)
+            cursor.execute(
+                f'''
+                SELECT {job_columns},
+                    EXISTS(
+                        SELECT 1 FROM applications a WHERE a.applicant_id = %s AND a.job_id = j.job_id
+                    ) AS already_applied
+                {job_from}
+                WHERE j.job_id = %s AND j.status IN ({status_placeholders})
+                LIMIT 1
+                ''',
+                (applicant_id, job_id, *PUBLISHABLE_JOB_STATUSES),
+            )
+            job = cursor.fetchone()
             if not job:
                 flash('Job not found or no longer available.', 'error')
                 return redirect(url_for('jobs'))
-        elif edit_application_id and existing_app:
-            # If editing and no job_id, use the existing job
-            job_id = existing_app.get('job_id')
-            job = next((j for j in all_jobs if j.get('job_id') == job_id), None)
+            # Check if already applied (for new applications only)
+            if request.method == 'GET' and not edit_application_id and job.get('already_applied'):
+                flash('You have already applied for this position.', 'warning')
+                return redirect(url_for('jobs'))
+
+        # Fetch all open/active jobs only when the job selector is rendered, projecting just what the
+        # dropdown shows (descriptions/requirements are only loaded for the selected job above)
+        all_jobs = []
+        if not job:
+            cursor.execute(
+                f'''
+                SELECT j.job_id, {job_title_expr} AS job_title, COALESCE(b.branch_name, 'Unassigned') AS branch_name
+                {job_from}
+                WHERE j.status IN ({status_placeholders})
+                ORDER BY j.created_at DESC, j.job_id DESC
+                ''',
+                tuple(PUBLISHABLE_JOB_STATUSES),
+            )
+            all_jobs = cursor.fetchall()
         
         # If no specific job is provided and not editing, render the form with the dropdown
         if not job and not edit_application_id:
@@ -7446,31 +7464,22 @@ def apply_to_job(job_id=None):
             
             # GET: Show application form with jobs list
             cursor.execute(
-                '''
-                SELECT resume_id, file_name, uploaded_at
-                FROM resumes
-                WHERE applicant_id = %s
-                ORDER BY uploaded_at DESC
+                f'''
+                SELECT r.resume_id, r.file_name, r.file_path, r.uploaded_at, {resume_size_expr} AS file_size_bytes
+                FROM resumes r
+                WHERE r.applicant_id = %s
+                ORDER BY r.uploaded_at DESC
                 ''',
                 (applicant_id,),
             )
             resumes = cursor.fetchall()
             formatted_resumes = []
             for resume in resumes:
-                file_size_bytes = 0
-                try:
-                    fp = (resume.get('file_path') or '').replace('\\', '/')
-                    if fp:
-                        abs_fp = os.path.join(app.root_path, fp)
-                        if os.path.exists(abs_fp):
-                            file_size_bytes = os.path.getsize(abs_fp)
-                except Exception:
-                    file_size_bytes = 0
                 formatted_resumes.append({
                     'resume_id': resume.get('resume_id'),
                     'file_name': resume.get('file_name'),
                     'uploaded_at': format_human_datetime(resume.get('uploaded_at')),
-                    'file_size': format_file_size(file_size_bytes),
+                    'file_size': format_file_size(resume.get('file_size_bytes')),
                 })
 
             return render_template(
@@ -7485,11 +7494,11 @@ def apply_to_job(job_id=None):
         if request.method == 'GET':
             # Get applicant's existing resumes
             cursor.execute(
-                '''
-                SELECT resume_id, file_name, uploaded_at
-                FROM resumes
-                WHERE applicant_id = %s
-                ORDER BY uploaded_at DESC
+                f'''
+                SELECT r.resume_id, r.file_name, r.file_path, r.uploaded_at, {resume_size_expr} AS file_size_bytes
+                FROM resumes r
+                WHERE r.applicant_id = %s
+                ORDER BY r.uploaded_at DESC
                 ''',
                 (applicant_id,),
             )
@@ -7506,22 +7515,11 @@ def apply_to_job(job_id=None):
             # Format resume data
             formatted_resumes = []
             for resume in resumes:
-                # Compute file size from stored file path if available
-                file_size_bytes = 0
-                try:
-                    fp = (resume.get('file_path') or '').replace('\\', '/')
-                    if fp:
-                        abs_fp = os.path.join(app.root_path, fp)
-                        if os.path.exists(abs_fp):
-                            file_size_bytes = os.path.getsize(abs_fp)
-                except Exception:
-                    file_size_bytes = 0
-
                 formatted_resumes.append({
                     'resume_id': resume.get('resume_id'),
                     'file_name': resume.get('file_name'),
                     'uploaded_at': format_human_datetime(resume.get('uploaded_at')),
-                    'file_size': format_file_size(file_size_bytes),
+                    'file_size': format_file_size(resume.get('file_size_bytes')),
                 })
 
             # If editing an application, fetch files already attached to that application
@@ -7529,8 +7527,9 @@ def apply_to_job(job_id=None):
             if edit_application_id and existing_app:
                 try:
                     cursor.execute(
-                        '''
-                        SELECT r.resume_id, r.file_name, r.file_path, r.file_type, r.uploaded_at
+                        f'''
+                        SELECT r.resume_id, r.file_name, r.file_path, r.file_type, r.uploaded_at,
+                               {resume_size_expr} AS file_size_bytes
                         FROM application_attachments aa
                         JOIN resumes r ON aa.resume_id = r.resume_id
                         WHERE aa.application_id = %s
@@ -7540,15 +7539,8 @@ def apply_to_job(job_id=None):
                     )
                     arows = cursor.fetchall() or []
                     for a in arows:
-                        fp = (a.get('file_path') or '').replace('\\', '/')
-                        file_size_bytes = 0
-                        try:
-                            if fp:
-                                abs_fp = os.path.join(app.root_path, fp)
-                                if os.path.exists(abs_fp):
-                                    file_size_bytes = os.path.getsize(abs_fp)
-                        except Exception:
-                            file_size_bytes = 0
+                        # Stored sizes only; the page fetches any missing ones from size_url after render
+                        file_size_bytes = a.get('file_size_bytes')
 
                         attached_files.append({
                             'resume_id': a.get('resume_id'),
@@ -7557,10 +7549,11 @@ def apply_to_job(job_id=None):
                             'file_size_bytes': file_size_bytes,
                             'file_size': format_file_size(file_size_bytes),
                             'file_type': a.get('file_type') or 'resume',
-                                'preview_url': url_for('preview_resume', resume_id=a.get('resume_id'))
+                            'preview_url': url_for('preview_resume', resume_id=a.get('resume_id')),
+                            'size_url': None if file_size_bytes is not None else url_for('resume_size', resume_id=a.get('resume_id')),
                         })
                 except Exception as _e:
-                    print(f'⚠️ Could not fetch attached files for edit application {edit_application_id}: {_e}')
+                    log.warning('⚠️ Could not fetch attached files for edit application %s: %s', edit_application_id, _e)
 
             application_viewed = bool(existing_app.get('viewed_at')) if existing_app else False
             return render_template(
@@ -7575,6 +7568,9 @@ def apply_to_job(job_id=None):
         
         # POST: Submit application
         resume_id = None
+        # Parse the job's upload rules once; every upload and attachment check below reuses them
+        allowed_set = _allowed_extension_set(job.get('allowed_extensions') if job else None)
+        max_size_mb = job.get('max_file_size_mb') if job else None
         # Collect IDs of resumes we create from multi-file upload so they can be linked
         newly_uploaded_ids = []
 
@@ -7585,47 +7581,30 @@ def apply_to_job(job_id=None):
             total_files = 0
 
         if total_files and total_files > 0:
-            # Save each uploaded file and create resume records
+            # Save each uploaded file, then create all resume records in one INSERT
+            uploads = []
             for i in range(total_files):
                 fkey = f'file_{i}'
                 resume_file = request.files.get(fkey)
                 if not resume_file or not getattr(resume_file, 'filename', None):
                     continue
-                try:
-                    allowed_exts = job.get('allowed_extensions') if job else None
-                    max_size_mb = job.get('max_file_size_mb') if job else None
-                except Exception:
-                    allowed_exts = None
-                    max_size_mb = None
-
-                file_info, error = save_uploaded_file(resume_file, applicant_id, allowed_extensions=allowed_exts, max_file_size_mb=max_size_mb)
+                file_info, error = save_uploaded_file(resume_file, applicant_id, allowed_extensions=allowed_set, max_file_size_mb=max_size_mb)
                 if not file_info:
                     # Non-fatal for bulk uploads: show error and continue with others
-                    print(f'⚠️ Error saving uploaded file {resume_file.filename}: {error}')
+                    log.warning('⚠️ Error saving uploaded file %s: %s', resume_file.filename, error)
                     continue
 
                 # Default to 'resume' file_type for multi-file uploads (client may not indicate resume/letter/license)
-                file_type = 'resume'
+                uploads.append((file_info, 'resume'))
+
+            if uploads:
                 try:
-                    cursor.execute(
-                        '''
-                        INSERT INTO resumes (applicant_id, file_name, file_path, file_type)
-                        VALUES (%s, %s, %s, %s)
-                        ''',
-                        (
-                            applicant_id,
-                            file_info['original_filename'],
-                            file_info.get('storage_path') or file_info.get('file_path', ''),
-                            file_type,
-                        ),
-                    )
-                    new_id = cursor.lastrowid
-                    newly_uploaded_ids.append(str(new_id))
-                    # Commit per-file to ensure uploaded_at is set and auto-linking works if needed
+                    newly_uploaded_ids = [str(new_id) for new_id in _insert_resumes(cursor, applicant_id, uploads) if new_id]
+                    # Commit so uploaded_at is set and auto-linking works if needed
                     db.commit()
                 except Exception as exc:
                     db.rollback()
-                    print(f'⚠️ Failed to insert resume record for {resume_file.filename}: {exc}')
+                    log.warning('⚠️ Failed to insert resume records for %s uploaded file(s): %s', len(uploads), exc)
 
             # Use the first newly uploaded file as the primary resume for application.resume_id
             if newly_uploaded_ids:
@@ -7639,32 +7618,14 @@ def apply_to_job(job_id=None):
             resume_file = request.files.get('resume_file')
             if resume_file and getattr(resume_file, 'filename', None):
                 # Use job-specific rules for validation when available
-                try:
-                    allowed_exts = job.get('allowed_extensions') if job else None
-                    max_size_mb = job.get('max_file_size_mb') if job else None
-                except Exception:
-                    allowed_exts = None
-                    max_size_mb = None
-                file_info, error = save_uploaded_file(resume_file, applicant_id, allowed_extensions=allowed_exts, max_file_size_mb=max_size_mb)
+                file_info, error = save_uploaded_file(resume_file, applicant_id, allowed_extensions=allowed_set, max_file_size_mb=max_size_mb)
                 if file_info:
                     # Get file_type from request (resume, letter, license)
                     file_type = request.form.get('file_type', 'resume').strip().lower()
                     if file_type not in ['resume', 'letter', 'license']:
                         file_type = 'resume'
 
-                    cursor.execute(
-                        '''
-                        INSERT INTO resumes (applicant_id, file_name, file_path, file_type)
-                        VALUES (%s, %s, %s, %s)
-                        ''',
-                        (
-                            applicant_id,
-                            file_info['original_filename'],
-                            file_info.get('storage_path') or file_info.get('file_path', ''),
-                            file_type,
-                        ),
-                    )
-                    resume_id = cursor.lastrowid
+                    resume_id = _insert_resume(cursor, applicant_id, file_info, file_type)
                 else:
                     flash(error or 'Unable to process the uploaded resume file.', 'error')
                     return redirect(url_for('apply_to_job', job_id=job_id))
@@ -7684,15 +7645,7 @@ def apply_to_job(job_id=None):
                     return redirect(url_for('apply_to_job', job_id=job_id))
 
                 # Check extension against job rules (if any)
-                allowed_raw = job.get('allowed_extensions') if job else None
-                if allowed_raw:
-                    allowed_set = {p.strip().lstrip('.').lower() for p in str(allowed_raw).split(',') if p.strip()}
-                else:
-                    allowed_set = set()
-
-                file_name = row.get('file_name') or ''
-                file_ext = file_name.rsplit('.', 1)[-1].lower() if '.' in file_name else ''
-                if allowed_set and file_ext and file_ext not in allowed_set:
+                if not _extension_allowed(row.get('file_name'), allowed_set):
                     flash('Selected resume is not an allowed file type for this job.', 'error')
                     return redirect(url_for('apply_to_job', job_id=job_id))
 
@@ -7738,24 +7691,24 @@ def apply_to_job(job_id=None):
 
             # Validate job exists and is available
             try:
-                ensure_schema_compatibility()
-                _update_job_columns(cursor)
-                status_placeholders = ','.join(['%s'] * len(PUBLISHABLE_JOB_STATUSES))
                 cursor.execute(
-                    f'SELECT job_id, allowed_extensions, max_file_size_mb FROM jobs WHERE job_id = %s AND status IN ({status_placeholders}) LIMIT 1',
-                    (job_id, *tuple(PUBLISHABLE_JOB_STATUSES))
+                    f'SELECT {job_columns} {job_from} WHERE j.job_id = %s AND j.status IN ({status_placeholders}) LIMIT 1',
+                    (job_id, *PUBLISHABLE_JOB_STATUSES)
                 )
                 job_row = cursor.fetchone()
                 if not job_row:
                     flash('Selected job is not available.', 'error')
                     return redirect(url_for('apply_to_job'))
-                # Minimal job dict for extension checks later
+                # Same shape as the route job lookup: extension checks and the submission emails read it
                 job = job_row
             except Exception:
                 job = {'job_id': job_id}
+            allowed_set = _allowed_extension_set(job.get('allowed_extensions'))
 
-            # Prevent duplicate applications (for new applications only)
-            if not edit_application_id:
+            # Prevent duplicate applications (for new applications only). Once the uq_applicant_job key
+            # exists the INSERT below rejects duplicates itself (1062); until then (ensure_index cannot add
+            # it while historical duplicate rows remain) keep the pre-check SELECT
+            if not edit_application_id and not _has_index(cursor, 'applications', 'uq_applicant_job'):
                 cursor.execute('SELECT application_id FROM applications WHERE applicant_id = %s AND job_id = %s LIMIT 1', (applicant_id, job_id))
                 if cursor.fetchone():
                     flash('You have already applied for this position.', 'warning')
@@ -7784,15 +7737,23 @@ def apply_to_job(job_id=None):
             application_id = edit_application_id
         else:
             # Create new application - status must be 'pending' (database enum: 'pending', 'scheduled', 'interviewed', 'hired', 'rejected')
-            cursor.execute(
-                '''
-                INSERT INTO applications (applicant_id, job_id, resume_id, status, applied_at)
-                VALUES (%s, %s, %s, 'pending', NOW())
-                ''',
-                (applicant_id, job_id, resume_id),
-            )
+            try:
+                cursor.execute(
+                    '''
+                    INSERT INTO applications (applicant_id, job_id, resume_id, status, applied_at)
+                    VALUES (%s, %s, %s, 'pending', NOW())
+                    ''',
+                    (applicant_id, job_id, resume_id),
+                )
+            except Exception as insert_err:
+                if getattr(insert_err, 'errno', None) != 1062:
+                    raise
+                # Already applied (uq_applicant_job); keep any document uploaded with this request
+                db.commit()
+                flash('You have already applied for this position.', 'warning')
+                return redirect(url_for('jobs'))
             application_id = cursor.lastrowid
-            print(f'✅ Application created - ID: {application_id}, Job ID: {job_id}, Applicant ID: {applicant_id}, Status: pending')
+            log.debug('✅ Application created - ID: %s, Job ID: %s, Applicant ID: %s, Status: pending', application_id, job_id, applicant_id)
 
         # If multiple resumes were provided (multiple hidden inputs named 'resume_id', 'letter_id', 'license_id'),
         # store them in application_attachments for full record keeping.
@@ -7801,29 +7762,25 @@ def apply_to_job(job_id=None):
             resume_ids = request.form.getlist('resume_id') or []
             letter_ids = request.form.getlist('letter_id') or []
             license_ids = request.form.getlist('license_id') or []
-            # Debug: print raw form keys and values to help diagnose missing attachments
-            try:
-                print('--- apply_to_job form keys ---')
-                for k in request.form.keys():
-                    print(f"form[{k}] = {request.form.getlist(k)}")
-            except Exception as _e:
-                print(f'⚠️ Could not print form keys: {_e}')
-            all_ids = resume_ids + letter_ids + license_ids
-            print(f'DEBUG: resume_ids={resume_ids}, letter_ids={letter_ids}, license_ids={license_ids}, combined all_ids={all_ids}')
+            # Debug: dump raw form keys and values to help diagnose missing attachments (LOG_LEVEL=DEBUG)
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug('--- apply_to_job form keys ---')
+                for k, values in request.form.lists():
+                    log.debug('form[%s] = %s', k, values)
             all_ids = resume_ids + letter_ids + license_ids
+            log.debug('resume_ids=%s, letter_ids=%s, license_ids=%s, combined all_ids=%s', resume_ids, letter_ids, license_ids, all_ids)
             
+            seen_ids = {str(r) for r in all_ids}
             # Ensure we include resume_id from earlier single-file upload path if present
-            if resume_id and str(resume_id) not in [str(r) for r in all_ids]:
+            if resume_id and str(resume_id) not in seen_ids:
                 all_ids.insert(0, str(resume_id))
+                seen_ids.add(str(resume_id))
 
             # Include any newly uploaded resume IDs (from multi-file upload) so they get linked
-            try:
-                if newly_uploaded_ids:
-                    for nid in newly_uploaded_ids:
-                        if str(nid) not in [str(x) for x in all_ids]:
-                            all_ids.append(str(nid))
-            except Exception:
-                pass
+            for nid in newly_uploaded_ids:
+                if str(nid) not in seen_ids:
+                    all_ids.append(str(nid))
+                    seen_ids.add(str(nid))
 
             # Insert attachments linking each file to this application
             # If no explicit attachment ids were provided via form, try to auto-link
@@ -7847,85 +7804,67 @@ def apply_to_job(job_id=None):
                     )
                     recent_unlinked = [str(r.get('resume_id')) for r in (cursor.fetchall() or [])]
                     if recent_unlinked:
-                        print(f'DEBUG: auto-linking recent unlinked resumes: {recent_unlinked}')
+                        log.debug('auto-linking recent unlinked resumes: %s', recent_unlinked)
                         all_ids = recent_unlinked
                 except Exception as _e:
-                    print(f'⚠️ Auto-link recent resumes failed: {_e}')
+                    log.warning('⚠️ Auto-link recent resumes failed: %s', _e)
 
             if all_ids:
-                # Precompute allowed set for attachments
-                allowed_raw = job.get('allowed_extensions') if job else None
-                if allowed_raw:
-                    allowed_set = {p.strip().lstrip('.').lower() for p in str(allowed_raw).split(',') if p.strip()}
-                else:
-                    allowed_set = set()
-
-                for rid in all_ids:
-                    try:
-                        rid_int = int(rid)
-                    except Exception:
-                        continue
-
-                    # Verify the resume belongs to this applicant and get file_name
-                    cursor.execute('SELECT resume_id, file_name, applicant_id FROM resumes WHERE resume_id = %s LIMIT 1', (rid_int,))
-                    rinfo = cursor.fetchone()
-                    if not rinfo:
-                        print(f'WARN: resume id {rid_int} not found when linking attachments')
-                        continue
-                    if rinfo.get('applicant_id') != applicant_id:
-                        print(f'WARN: resume id {rid_int} does not belong to applicant {applicant_id} - skipping')
-                        continue
+                # Form ids are strings: keep the numeric ones once each, in submission order
+                rid_ints = list(dict.fromkeys(
+                    int(rid) for rid in map(str, all_ids) if rid.strip().isdecimal()
+                ))
+
+                # Load every referenced resume owned by this applicant in one query instead of one per file
+                resumes_by_id = {}
+                if rid_ints:
+                    id_placeholders = ', '.join(['%s'] * len(rid_ints))
+                    cursor.execute(
+                        f'SELECT resume_id, file_name FROM resumes WHERE applicant_id = %s AND resume_id IN ({id_placeholders})',
+                        (applicant_id, *rid_ints),
+                    )
+                    resumes_by_id = {row.get('resume_id'): row.get('file_name') for row in (cursor.fetchall() or [])}
 
-                    # Check extension matches allowed set (if defined)
-                    fname = rinfo.get('file_name') or ''
-                    ext = fname.rsplit('.', 1)[-1].lower() if '.' in fname else ''
-                    if allowed_set and ext and ext not in allowed_set:
-                        print(f'WARN: resume id {rid_int} has disallowed extension for job {job_id} - skipping')
-                        continue
+                # Missing, foreign and disallowed-type resumes are all dropped in one pass
+                valid_ids = [
+                    rid_int for rid_int in rid_ints
+                    if rid_int in resumes_by_id and _extension_allowed(resumes_by_id[rid_int], allowed_set)
+                ]
+                if len(valid_ids) != len(rid_ints):
+                    log.debug(
+                        'skipped resume ids %s for application %s (missing, not owned by applicant %s, or disallowed for job %s)',
+                        [rid for rid in rid_ints if rid not in valid_ids], application_id, applicant_id, job_id,
+                    )
+                new_links = [(application_id, rid_int) for rid_int in valid_ids]
 
-                    # Avoid duplicate entries
-                    cursor.execute(
-                        'SELECT attachment_id FROM application_attachments WHERE application_id = %s AND resume_id = %s LIMIT 1',
-                        (application_id, rid_int),
+                if new_links:
+                    # Links that already exist are skipped by the uniq_app_resume key (one multi-row statement)
+                    cursor.executemany(
+                        'INSERT IGNORE INTO application_attachments (application_id, resume_id) VALUES (%s, %s)',
+                        new_links,
                     )
-                    if not cursor.fetchone():
-                        cursor.execute(
-                            'INSERT INTO application_attachments (application_id, resume_id) VALUES (%s, %s)',
-                            (application_id, rid_int),
-                        )
-                    else:
-                        print(f'INFO: attachment already exists for application {application_id}, resume {rid_int}')
-                print(f'✅ Linked {len(all_ids)} file(s) to application {application_id} via application_attachments')
-                # Debug: list attachments actually in DB for this application
-                try:
-                    cursor.execute('SELECT resume_id FROM application_attachments WHERE application_id = %s', (application_id,))
-                    linked = [r.get('resume_id') for r in cursor.fetchall()]
-                    print(f'DEBUG: linked resume_ids in DB for application {application_id}: {linked}')
-                except Exception as _e:
-                    print(f'⚠️ Could not query application_attachments: {_e}')
+                log.debug('✅ Linked %s file(s) to application %s via application_attachments', len(new_links), application_id)
+                # Debug: list attachments actually in DB for this application (extra query only at DEBUG level)
+                if log.isEnabledFor(logging.DEBUG):
+                    try:
+                        cursor.execute('SELECT resume_id FROM application_attachments WHERE application_id = %s', (application_id,))
+                        linked = [r.get('resume_id') for r in cursor.fetchall()]
+                        log.debug('linked resume_ids in DB for application %s: %s', application_id, linked)
+                    except Exception as _e:
+                        log.debug('⚠️ Could not query application_attachments: %s', _e)
         except Exception as attach_err:
-            print(f'⚠️ Could not save application attachments for application {application_id}: {attach_err}')        # AUTOMATIC: Notify applicant about successful submission
+            log.warning('⚠️ Could not save application attachments for application %s: %s', application_id, attach_err)
+
+        # AUTOMATIC: Notify applicant about successful submission
         if application_id:
-            # Get applicant and job info for email and HR notification
-            cursor.execute(
-                '''
-                SELECT ap.email, ap.full_name, ap.applicant_id,
-                       j.job_title AS job_title, j.branch_id,
-                       b.branch_name
-                FROM applicants ap
-                JOIN jobs j ON j.job_id = %s
-                LEFT JOIN branches b ON j.branch_id = b.branch_id
-                WHERE ap.applicant_id = %s
-                LIMIT 1
-                ''',
-                (job_id, applicant_id)
-            )
-            info = cursor.fetchone()
+            # Applicant identity comes from the session (set at login, refreshed on profile edits) and the
+            # job/branch details from the job row loaded above - no extra lookup before notifying
+            job_info = job or {}
             
             # Send email to applicant (but don't create notification - HR will see their own notification)
-            job_title = info.get('job_title') or info.get('job_title_alt') or 'the position'
-            applicant_email = info.get('email')
-            applicant_name = info.get('full_name') or 'Applicant'
+            job_title = job_info.get('job_title') or 'the position'
+            applicant_email = session.get('user_email')
+            applicant_name = session.get('user_name') or 'Applicant'
             
             if applicant_email:
                 email_subject = f'Application Submitted - {job_title}'
@@ -7938,81 +7877,55 @@ Your application has been successfully submitted. Our team will review your appl
 Best regards,
 J&T Express Recruitment Team
             """.strip()
-                import threading
-                try:
-                    threading.Thread(target=send_email, args=(applicant_email, email_subject, email_body), daemon=True).start()
-                except Exception:
-                    pass
+                send_email_async(applicant_email, email_subject, email_body)
             
             # AUTOMATIC: Notify HR about new application (system notification + email)
             # HR will see this notification when they view branch-scoped notifications
             try:
-                branch_id = info.get('branch_id')
-                branch_name = info.get('branch_name') or 'a branch'
+                branch_id = job_info.get('branch_id')
+                branch_name = job_info.get('branch_name') or 'a branch'
                 hr_notification_message = f'{applicant_name} applied for {job_title} at {branch_name}.'
                 
                 # Create HR notification linked to application (HR will see it through branch-scoped queries)
                 # HR notifications are fetched by joining notifications with applications and jobs by branch_id
-                notification_columns = set()
-                try:
-                    cursor.execute('SHOW COLUMNS FROM notifications')
-                    notification_columns = {row.get('Field') for row in (cursor.fetchall() or []) if row}
-                except Exception:
-                    pass
+                # (column set is cached per process; empty when the table is missing)
+                notification_columns = _table_columns(cursor, 'notifications')
                 
                 # Create notification linked to application for HR visibility
                 # HR will see this through branch-scoped queries (joining through applications -> jobs -> branch_id)
                 # Applicants won't see this notification because they only see notifications starting with "You applied"
                 # HR notifications use third-person format "{applicant_name} applied" which is filtered out in applicant queries
                 if 'application_id' in notification_columns and 'message' in notification_columns:
-                    # Check if notification already exists to prevent duplicates
-                    cursor.execute(
-                        '''
-                        SELECT notification_id FROM notifications
-                        WHERE application_id = %s AND message = %s
-                        LIMIT 1
-                        ''',
-                        (application_id, hr_notification_message)
-                    )
-                    existing_notification = cursor.fetchone()
-                    
-                    if not existing_notification:
-                        # Only create notification if it doesn't already exist
-                        if 'sent_at' in notification_columns:
-                            cursor.execute(
-                                '''
-                                INSERT INTO notifications (application_id, message, sent_at, is_read)
-                                VALUES (%s, %s, NOW(), 0)
-                                ''',
-                                (application_id, hr_notification_message)
-                            )
-                        else:
-                            cursor.execute(
-                                '''
-                                INSERT INTO notifications (application_id, message, is_read)
-                                VALUES (%s, %s, 0)
-                                ''',
-                                (application_id, hr_notification_message)
-                            )
-                        print(f'✅ HR system notification created for application {application_id}')
+                    # The (application_id, message_hash) unique key absorbs repeats, so no existence check is needed
+                    if 'sent_at' in notification_columns:
+                        cursor.execute(
+                            '''
+                            INSERT IGNORE INTO notifications (application_id, message, sent_at, is_read)
+                            VALUES (%s, %s, NOW(), 0)
+                            ''',
+                            (application_id, hr_notification_message)
+                        )
+                    else:
+                        cursor.execute(
+                            '''
+                            INSERT IGNORE INTO notifications (application_id, message, is_read)
+                            VALUES (%s, %s, 0)
+                            ''',
+                            (application_id, hr_notification_message)
+                        )
+                    if cursor.rowcount:
+                        log.debug('✅ HR system notification created for application %s', application_id)
                     else:
-                        print(f'⚠️ HR notification already exists for application {application_id} - skipping duplicate')
+                        log.debug('⚠️ HR notification already exists for application %s - skipping duplicate', application_id)
                 else:
-                    print(f'⚠️ Notifications table missing required columns')
+                    log.warning('⚠️ Notifications table missing required columns')
                 
                 # Send email to HR users managing this branch
                 try:
                     # HR accounts manage all branches (branch_id column removed from admins table)
-                    hr_query = '''
-                        SELECT DISTINCT u.email, a.full_name
-                        FROM users u
-                        JOIN admins a ON a.user_id = u.user_id
-                        WHERE u.user_type = 'hr' AND u.is_active = 1 AND a.is_active = 1
-                    '''
-                    cursor.execute(hr_query)
-                    hr_users = cursor.fetchall()
+                    hr_emails = _hr_recipients(cursor)
                     
-                    if hr_users:
+                    if hr_emails:
                         # Send email to each HR user
                         email_subject = f'New Application Received - {job_title}'
                         email_body = f"""Dear HR Team,
@@ -8030,25 +7943,16 @@ Best regards,
 J&T Express Recruitment System
                         """.strip()
                         
-                        for hr_user in hr_users:
-                            hr_email = hr_user.get('email')
-                            if hr_email:
-                                try:
-                                    threading.Thread(target=send_email, args=(hr_email, email_subject, email_body), daemon=True).start()
-                                except Exception:
-                                    pass
-                        print(f'✅ HR notification emails sent to {len(hr_users)} HR user(s) for application {application_id}')
+                        for hr_email in hr_emails:
+                            send_email_async(hr_email, email_subject, email_body)
+                        log.debug('✅ HR notification emails queued for %s HR user(s) for application %s', len(hr_emails), application_id)
                     else:
-                        print(f'⚠️ No HR users found for branch {branch_id} - no emails sent')
+                        log.debug('⚠️ No HR users found for branch %s - no emails sent', branch_id)
                 except Exception as hr_email_err:
-                    print(f'⚠️ Error sending HR notification emails: {hr_email_err}')
-                    import traceback
-                    traceback.print_exc()
+                    log.exception('⚠️ Error sending HR notification emails: %s', hr_email_err)
                     
             except Exception as hr_notify_err:
-                print(f'⚠️ Error creating HR notification: {hr_notify_err}')
-                import traceback
-                traceback.print_exc()
+                log.exception('⚠️ Error creating HR notification: %s', hr_notify_err)
             
             # AUTOMATIC: Notify Admin about new application (system notification)
             # NOTE: Admin notification is skipped since HR notification above already covers this
@@ -8061,51 +7965,16 @@ J&T Express Recruitment System
         return redirect(url_for('applicant_applications'))
     except Exception as exc:
         db.rollback()
-        log.exception('❌ Apply to job error: %s', exc)
+        try:
+            form_dump, file_names = dict(request.form.lists()), list(request.files.keys())
+        except Exception:
+            form_dump, file_names = {}, []
+        apply_log.exception('❌ Apply to job error: %s form=%s files=%s', exc, form_dump, file_names)
         try:
             log.debug('--- REQUEST DEBUG START ---')
             log.debug('Request method: %s, remote_addr: %s, applicant_session_user: %s', request.method, request.remote_addr, session.get('user_id'))
         except Exception:
             log.debug('Could not read request metadata for debug')
-        try:
-            for k in request.form.keys():
-                log.debug('FORM[%s] = %s', k, request.form.getlist(k))
-        except Exception as _e:
-            log.debug('Could not dump form keys: %s', _e)
-        try:
-            for fkey in request.files.keys():
-                f = request.files.get(fkey)
-                fname = getattr(f, 'filename', None)
-                log.debug('FILE[%s] -> filename=%s', fkey, fname)
-        except Exception as _e:
-            log.debug('Could not dump files: %s', _e)
-        # Also write debug information to a file under instance/ for later inspection
-        try:
-            log_dir = app.instance_path
-            os.makedirs(log_dir, exist_ok=True)
-            log_file = os.path.join(log_dir, 'apply_error.log')
-            with open(log_file, 'a', encoding='utf-8') as fh:
-                fh.write('\n--- APPLY ERROR ' + datetime.now().isoformat() + ' ---\n')
-                fh.write(f'Error: {str(exc)}\n')
-                fh.write('Traceback:\n')
-                fh.write(''.join(traceback.format_exception(None, exc, exc.__traceback__)))
-                fh.write('\nRequest form keys and values:\n')
-                try:
-                    for k in request.form.keys():
-                        fh.write(f'FORM[{k}] = {request.form.getlist(k)}\n')
-                except Exception:
-                    fh.write('Could not dump form keys\n')
-                fh.write('Request files:\n')
-                try:
-                    for fkey in request.files.keys():
-                        f = request.files.get(fkey)
-                        fname = getattr(f, 'filename', None)
-                        fh.write(f'FILE[{fkey}] -> filename={fname}\n')
-                except Exception:
-                    fh.write('Could not dump files\n')
-                fh.write('--- END APPLY ERROR ---\n')
-        except Exception as file_err:
-            log.exception('⚠️ Could not write apply error log: %s', file_err)
         
         # Check if it's a CSRF error
         error_str = str(exc).lower()
@@ -8141,56 +8010,32 @@ def delete_application(application_id):
     
     cursor = db.cursor(dictionary=True)
     try:
-        # Verify application belongs to applicant
-        cursor.execute(
-            '''
-            SELECT application_id, status, viewed_at, job_id
-            FROM applications
-            WHERE application_id = %s AND applicant_id = %s
-            LIMIT 1
-            ''',
-            (application_id, applicant_id),
-        )
-        application = cursor.fetchone()
-        
-        if not application:
-            flash('Application not found or you do not have permission to delete it.', 'error')
-            return immediate_redirect(url_for('applicant_applications', _external=True))
-        
-        # Check if application has been viewed by HR/Admin - warn but allow deletion
-        if application.get('viewed_at'):
-            # Still allow deletion but warn the user
-            pass
-        
-        # Delete related records first to avoid foreign key constraints
-        try:
-            # Delete interviews related to this application
-            cursor.execute('DELETE FROM interviews WHERE application_id = %s', (application_id,))
-            print(f'✅ Deleted interviews for application {application_id}')
-        except Exception as interview_error:
-            print(f'⚠️ Error deleting interviews: {interview_error}')
-            # Continue anyway
-        
-        try:
-            # Delete notifications related to this application
-            cursor.execute('DELETE FROM notifications WHERE application_id = %s', (application_id,))
-            print(f'✅ Deleted notifications for application {application_id}')
-        except Exception as notif_error:
-            print(f'⚠️ Error deleting notifications: {notif_error}')
-            # Continue anyway
-        
-        
-        # Finally, delete the application itself
-        cursor.execute('DELETE FROM applications WHERE application_id = %s AND applicant_id = %s', (application_id, applicant_id))
-        
-        deleted_count = cursor.rowcount
+        # One round trip: child rows are removed only through a join that proves ownership,
+        # then the application itself (its rowcount says whether anything was ours to delete)
+        statements = []
+        params = []
+        for child_table, alias in (('interviews', 'i'), ('notifications', 'n'), ('application_attachments', 'aa')):
+            if _table_exists(cursor, child_table):
+                statements.append(
+                    f'DELETE {alias} FROM {child_table} {alias} '
+                    f'JOIN applications a ON a.application_id = {alias}.application_id '
+                    'WHERE a.application_id = %s AND a.applicant_id = %s'
+                )
+                params.extend((application_id, applicant_id))
+        statements.append('DELETE FROM applications WHERE application_id = %s AND applicant_id = %s')
+        params.extend((application_id, applicant_id))
+
+        deleted_count = 0
+        for result in cursor.execute(';\n'.join(statements), tuple(params), multi=True):
+            deleted_count = result.rowcount
         if deleted_count > 0:
             db.commit()
+            _invalidate_archived_applicants_cache()
             flash('Application permanently deleted successfully.', 'success')
             print(f'✅ Application {application_id} deleted by applicant {applicant_id}')
         else:
             db.rollback()
-            flash('Failed to delete application. Please try again.', 'error')
+            flash('Application not found or you do not have permission to delete it.', 'error')
         
         return immediate_redirect(url_for('applicant_applications', _external=True))
     except Exception as exc:
@@ -8204,6 +8049,18 @@ def delete_application(application_id):
         cursor.close()
 
 
+def _execute_and_commit(cursor, sql, params):
+    """Run a single DML statement and its COMMIT in one round-trip; returns the statement's rowcount.
+
+    MySQL stops a multi-statement batch at the first error, so a failed statement never commits.
+    """
+    rowcount = None
+    for result in cursor.execute(f'{sql};\nCOMMIT', params, multi=True):
+        if rowcount is None:
+            rowcount = result.rowcount
+    return rowcount or 0
+
+
 @app.route('/applicant/jobs/<int:job_id>/save', methods=['POST'])
 @login_required('applicant')
 def save_job(job_id):   
@@ -8219,33 +8076,18 @@ def save_job(job_id):
     
     cursor = db.cursor(dictionary=True)
     try:
-        # Check if saved_jobs table exists, if not create it
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS saved_jobs (
-                saved_job_id INT AUTO_INCREMENT PRIMARY KEY,
-                applicant_id INT NOT NULL,
-                job_id INT NOT NULL,
-                saved_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
-                UNIQUE KEY unique_saved_job (applicant_id, job_id),
-                FOREIGN KEY (applicant_id) REFERENCES applicants(applicant_id) ON DELETE CASCADE,
-                FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE
-            )
-        """)
-        
-        # Check if already saved - use applicant_id and job_id instead of saved_job_id
-        cursor.execute(
-            'SELECT applicant_id FROM saved_jobs WHERE applicant_id = %s AND job_id = %s',
+        # saved_jobs is created by ensure_schema_compatibility() at startup
+        # unique_saved_job makes this idempotent: rowcount is 1 for a new save, 0 when it already existed
+        # (ON DUPLICATE KEY UPDATE rather than INSERT IGNORE so an unknown job_id still fails its foreign key)
+        saved = _execute_and_commit(
+            cursor,
+            'INSERT INTO saved_jobs (applicant_id, job_id) VALUES (%s, %s) ON DUPLICATE KEY UPDATE saved_at = saved_at',
             (applicant_id, job_id),
         )
-        if cursor.fetchone():
-            flash('Job already saved.', 'info')
-        else:
-            cursor.execute(
-                'INSERT INTO saved_jobs (applicant_id, job_id) VALUES (%s, %s)',
-                (applicant_id, job_id),
-            )
-            db.commit()
+        if saved:
             flash('Job saved successfully.', 'success')
+        else:
+            flash('Job already saved.', 'info')
         
         return redirect(url_for('saved_jobs', just_saved=job_id))
     except Exception as exc:
@@ -8269,11 +8111,11 @@ def unsave_job(job_id):
     
     cursor = db.cursor(dictionary=True)
     try:
-        cursor.execute(
+        _execute_and_commit(
+            cursor,
             'DELETE FROM saved_jobs WHERE applicant_id = %s AND job_id = %s',
             (applicant_id, job_id),
         )
-        db.commit()
         flash('Job removed from saved list.', 'success')
         return redirect(request.referrer or url_for('jobs'))
     except Exception as exc:
@@ -8301,12 +8143,36 @@ def archived_applicants():
         return redirect(url_for('hr_dashboard'))
 
 
+def _form_application_ids():
+    """Return the distinct numeric application_id values posted by a single-row or bulk form."""
+    return list(dict.fromkeys(
+        int(raw) for raw in request.form.getlist('application_id') if raw.strip().isdecimal()
+    ))
+
+
+def _applications_update_sql(assignments, count, branch_scoped=False):
+    """One UPDATE over `count` application ids; branch-scoped HR users only reach their branch's jobs."""
+    join = ' JOIN jobs j ON a.job_id = j.job_id' if branch_scoped else ''
+    scope = ' AND j.branch_id = %s' if branch_scoped else ''
+    return f"UPDATE applications a{join} SET {assignments} WHERE a.application_id IN ({', '.join(['%s'] * count)}){scope}"
+
+
+def _soft_archive_application_sql(cursor, count=1, branch_scoped=False):
+    """UPDATE setting applications' status, clearing archived_at and touching updated_at when those columns exist."""
+    assignments = ['a.status = %s']
+    if _has_column(cursor, 'applications', 'archived_at'):
+        assignments.append('a.archived_at = NULL')
+    if _has_column(cursor, 'applications', 'updated_at'):
+        assignments.append('a.updated_at = NOW()')
+    return _applications_update_sql(', '.join(assignments), count, branch_scoped)
+
+
 @app.route('/hr/archived-applicants/restore', methods=['POST'])
 @login_required('hr', 'admin')
 def restore_applicant():
-    """Restore an archived application back to pending status."""
-    application_id = request.form.get('application_id')
-    if not application_id:
+    """Restore archived applications (one or many application_id values) back to pending status."""
+    application_ids = _form_application_ids()
+    if not application_ids:
         flash('Invalid request.', 'error')
         return redirect(url_for('archived_applicants'))
 
@@ -8320,14 +8186,24 @@ def restore_applicant():
 
     cursor = db.cursor()
     try:
-        # Update status back to pending and clear archived_at if present
-        try:
-            cursor.execute("UPDATE applications SET status = 'pending', archived_at = NULL WHERE application_id = %s", (application_id,))
-        except Exception:
-            # Fallback if archived_at does not exist
-            cursor.execute("UPDATE applications SET status = 'pending' WHERE application_id = %s", (application_id,))
+        # Update status back to pending and clear archived_at if present, in one statement for every id
+        branch_id = get_branch_scope(user)
+        assignments = "a.status = 'pending'"
+        if _has_column(cursor, 'applications', 'archived_at'):
+            assignments += ', a.archived_at = NULL'
+        cursor.execute(
+            _applications_update_sql(assignments, len(application_ids), branch_scoped=bool(branch_id)),
+            (*application_ids, *((branch_id,) if branch_id else ())),
+        )
+        restored = cursor.rowcount
         db.commit()
-        flash('Application restored successfully.', 'success')
+        _invalidate_archived_applicants_cache()
+        if restored > 1:
+            flash(f'{restored} applications restored successfully.', 'success')
+        elif restored == 1:
+            flash('Application restored successfully.', 'success')
+        else:
+            flash('Application not found or you do not have permission to restore it.', 'error')
     except Exception as exc:
         db.rollback()
         print(f'❌ Restore applicant error: {exc}')
@@ -8339,11 +8215,8 @@ def restore_applicant():
 
     # Redirect to appropriate archived page depending on caller role/referrer
     ref = (request.referrer or '')
-    try:
-        # Prefer the already-fetched `user` object from earlier in this function
-        role = (user.get('role') if isinstance(user, dict) else None) or session.get('user_role') or (get_current_user() or {}).get('role')
-    except Exception:
-        role = None
+    # Reuse the `user` resolved at the top of this function instead of querying it again
+    role = (user or {}).get('role') or session.get('user_role')
 
     # If current user is HR, always send them to the HR archived list.
     if role and str(role).lower() == 'hr':
@@ -8362,9 +8235,9 @@ def restore_applicant():
 @app.route('/hr/archived-applicants/delete', methods=['POST'])
 @login_required('hr', 'admin')
 def delete_applicant_permanent():
-    """Permanently delete an archived application and related records."""
-    application_id = request.form.get('application_id')
-    if not application_id:
+    """Permanently delete archived applications (one or many application_id values) and related records."""
+    application_ids = _form_application_ids()
+    if not application_ids:
         flash('Invalid request.', 'error')
         return redirect(url_for('archived_applicants'))
 
@@ -8373,19 +8246,21 @@ def delete_applicant_permanent():
         flash('Database connection error.', 'error')
         return redirect(url_for('archived_applicants'))
 
+    user = get_current_user()
     cursor = db.cursor()
     try:
         # Instead of hard-deleting the application row, mark it as removed so the applicant's record remains
         try:
-            # Nullify archived_at (if present) and set status to 'archived'
-            try:
-                cursor.execute("UPDATE applications SET status = %s, archived_at = NULL, updated_at = NOW() WHERE application_id = %s", ('archived', application_id))
-            except Exception:
-                # Fallback if archived_at or updated_at doesn't exist
-                cursor.execute("UPDATE applications SET status = %s WHERE application_id = %s", ('archived', application_id))
+            # Nullify archived_at (if present) and set status to 'archived', in one statement for every id
+            branch_id = get_branch_scope(user)
+            cursor.execute(
+                _soft_archive_application_sql(cursor, len(application_ids), branch_scoped=bool(branch_id)),
+                ('archived', *application_ids, *((branch_id,) if branch_id else ())),
+            )
 
             if cursor.rowcount > 0:
                 db.commit()
+                _invalidate_archived_applicants_cache()
                 flash('Application archived (soft-archived).', 'success')
             else:
                 db.rollback()
@@ -8404,10 +8279,7 @@ def delete_applicant_permanent():
 
     # Redirect appropriately depending on admin vs hr
     ref = (request.referrer or '')
-    try:
-        role = session.get('user_role') or (get_current_user() or {}).get('role')
-    except Exception:
-        role = None
+    role = (user or {}).get('role') or session.get('user_role')
 
     if ref and '/admin/' in ref:
         return redirect(url_for('admin_archived_applicants'))
@@ -8416,12 +8288,26 @@ def delete_applicant_permanent():
     return redirect(url_for('archived_applicants'))
 
 
+def _archived_redirect_target(role, posted_redirect):
+    """Archived-list URL for `role`; a posted redirect is honoured only when it stays on that role's page.
+
+    Admins may only be sent to the admin archived page and HR to the HR one, so the
+    single url_for() result doubles as the allowed prefix.
+    """
+    target = url_for('admin_archived_applicants' if (role or '').lower() == 'admin' else 'archived_applicants')
+    if posted_redirect and posted_redirect.startswith(target):
+        return posted_redirect
+    return target
+
+
 @app.route('/hr/applicants/<int:application_id>/archive', methods=['POST'])
 @app.route('/admin/applicants/<int:application_id>/archive', methods=['POST'])
 @login_required('hr', 'admin')
 def archive_applicant(application_id):
     """Archive an application by setting status to 'archived' and archived_at timestamp."""
     user = get_current_user()
+    # Resolve the role once; every redirect decision below reuses it
+    role = (user or {}).get('role') or session.get('user_role')
     db = get_db()
     wants_json = (
         request.is_json
@@ -8441,133 +8327,74 @@ def archive_applicant(application_id):
         flash('Database connection error.', 'error')
         return redirect(url_for('applicants'))
     cursor = db.cursor(dictionary=True)
-    # Log context for debugging
-    try:
-        print(f"➡️ Archive request: user={user and user.get('id')}, role={user and user.get('role')}, application_id={application_id}")
+    # Log context for debugging (only formatted when DEBUG logging is on)
+    if log.isEnabledFor(logging.DEBUG):
         try:
-            print(f"   Session keys: {list(session.keys())}")
-            print(f"   session.user_role={session.get('user_role')}, session.user_id={session.get('user_id')}")
-            print(f"   Request cookies: {dict(request.cookies)}")
-            print(f"   X-Requested-With: {request.headers.get('X-Requested-With')}, is_json: {request.is_json}, Accept: {request.headers.get('Accept')}")
-            print(f"   posted_redirect initial: {posted_redirect}")
+            log.debug('➡️ Archive request: user=%s, role=%s, application_id=%s', user and user.get('id'), role, application_id)
+            log.debug('   Session keys: %s', list(session.keys()))
+            log.debug('   session.user_role=%s, session.user_id=%s', session.get('user_role'), session.get('user_id'))
+            log.debug('   Request cookies: %s', dict(request.cookies))
+            log.debug('   X-Requested-With: %s, is_json: %s, Accept: %s', request.headers.get('X-Requested-With'), request.is_json, request.headers.get('Accept'))
+            log.debug('   posted_redirect initial: %s', posted_redirect)
         except Exception:
             pass
-    except Exception:
-        pass
     try:
-        # Ensure schema compatibility for status enum
-        try:
-            ensure_schema_compatibility()
-        except Exception:
-            pass
-
-        # If HR, ensure the application belongs to their branch
+        # One UPDATE does the work; for branch-scoped HR users the JOIN on jobs doubles as the
+        # authorization check, so rowcount 0 means "not found or not in your branch"
         branch_id = get_branch_scope(user)
+        assignments = "a.status = 'archived'"
+        if _has_column(cursor, 'applications', 'archived_at'):
+            assignments += ', a.archived_at = NOW()'
         if branch_id:
-            try:
-                # Also fetch the application's job branch for better diagnostics
-                cursor.execute(
-                    '''
-                    SELECT j.branch_id AS job_branch_id
-                    FROM applications a
-                    JOIN jobs j ON a.job_id = j.job_id
-                    WHERE a.application_id = %s
-                    LIMIT 1
-                    ''',
-                    (application_id,)
-                )
-                app_branch_row = cursor.fetchone() or {}
-                app_branch_id = app_branch_row.get('job_branch_id') if isinstance(app_branch_row, dict) else None
-
-                cursor.execute(
-                    '''
-                    SELECT a.application_id
-                    FROM applications a
-                    JOIN jobs j ON a.job_id = j.job_id
-                    WHERE a.application_id = %s AND j.branch_id = %s
-                    LIMIT 1
-                    ''',
-                    (application_id, branch_id),
-                )
-                if not cursor.fetchone():
-                    # When called via AJAX, return a 403 JSON instead of redirecting
-                    try:
-                        print(f"⚠️ Branch scope check failed: user.branch_id={branch_id} app.job_branch_id={app_branch_id} application_id={application_id}")
-                    except Exception:
-                        pass
-                    if wants_json:
-                        return jsonify({'success': False, 'error': 'Not authorized', 'role': session.get('user_role'), 'user_branch_id': session.get('branch_id'), 'app_branch_id': app_branch_id}), 403
-                    flash('You do not have permission to archive this application.', 'error')
-                    return redirect(url_for('applicants'))
-            except Exception as e:
-                print(f'⚠️ Error checking branch scope for archive: {e}')
-        
-        # Check if `archived_at` column exists and choose update accordingly
-        try:
-            cursor.execute("SHOW COLUMNS FROM applications LIKE 'archived_at'")
-            has_archived_at = bool(cursor.fetchone())
-        except Exception:
-            has_archived_at = False
-
-        if has_archived_at:
-            sql = "UPDATE applications SET status = 'archived', archived_at = NOW() WHERE application_id = %s"
-            params = (application_id,)
+            sql = f'UPDATE applications a JOIN jobs j ON a.job_id = j.job_id SET {assignments} WHERE a.application_id = %s AND j.branch_id = %s'
+            params = (application_id, branch_id)
         else:
-            sql = "UPDATE applications SET status = 'archived' WHERE application_id = %s"
+            sql = f'UPDATE applications a SET {assignments} WHERE a.application_id = %s'
             params = (application_id,)
 
         try:
             cursor.execute(sql, params)
             if cursor.rowcount > 0:
                 db.commit()
-                # Double-check the status was updated
-                try:
-                    cursor.execute('SELECT status, archived_at FROM applications WHERE application_id = %s LIMIT 1', (application_id,))
-                    post = cursor.fetchone() or {}
-                    print(f"✅ Archive DB check: application_id={application_id}, status={post.get('status')}, archived_at={post.get('archived_at')}")
-                except Exception:
-                    pass
+                _invalidate_archived_applicants_cache()
+                # Double-check the status was updated (extra query only at DEBUG level)
+                if log.isEnabledFor(logging.DEBUG):
+                    try:
+                        cursor.execute('SELECT status, archived_at FROM applications WHERE application_id = %s LIMIT 1', (application_id,))
+                        post = cursor.fetchone() or {}
+                        log.debug('✅ Archive DB check: application_id=%s, status=%s, archived_at=%s', application_id, post.get('status'), post.get('archived_at'))
+                    except Exception:
+                        pass
                 flash('Application archived successfully.', 'success')
                 # Determine redirect target depending on caller (prefer explicit role over referrer)
                 ref_inner = (request.referrer or '')
+                role_inner = (role or '').lower()
+                # Choose redirect purely by role; a posted redirect may only narrow it to the same page
+                redirect_target = _archived_redirect_target(role_inner, posted_redirect)
                 try:
-                    role_inner = session.get('user_role') or (get_current_user() or {}).get('role')
-                except Exception:
-                    role_inner = None
-                role_inner = (role_inner or '').lower()
-                # Choose redirect purely by role to avoid unauthorized admin page access
-                if role_inner == 'admin':
-                    redirect_target = url_for('admin_archived_applicants', _external=False)
-                else:
-                    redirect_target = url_for('archived_applicants', _external=False)
-                try:
-                    print(f"➡️ Archive redirect decision: role_inner={role_inner}, ref_inner={ref_inner}, posted_redirect={posted_redirect}, redirect_target={redirect_target}")
+                    log.debug('➡️ Archive redirect decision: role_inner=%s, ref_inner=%s, posted_redirect=%s, redirect_target=%s', role_inner, ref_inner, posted_redirect, redirect_target)
                 except Exception:
                     pass
-                # Allow client to override redirect by posting a 'redirect' value, but keep role safety:
-                # - Admin can only override to admin archived page
-                # - HR can only override to HR archived page
-                if posted_redirect and (posted_redirect.startswith('/') or posted_redirect.startswith(url_for('archived_applicants')) or posted_redirect.startswith(url_for('admin_archived_applicants'))):
-                    if role_inner == 'admin' and posted_redirect.startswith(url_for('admin_archived_applicants')):
-                        redirect_target = posted_redirect
-                    elif role_inner != 'admin' and posted_redirect.startswith(url_for('archived_applicants')):
-                        redirect_target = posted_redirect
-                if (
-                    request.is_json
-                    or request.headers.get('X-Requested-With') == 'XMLHttpRequest'
-                    or request.accept_mimetypes.accept_json
-                    or ('application/json' in (request.headers.get('Accept') or '').lower())
-                ):
+                if wants_json:
                     return jsonify({'success': True, 'message': 'Application archived successfully.', 'redirect': redirect_target})
             else:
                 db.rollback()
+                if branch_id:
+                    # Failure path only: tell "outside your branch" apart from "no such application"
+                    cursor.execute(
+                        'SELECT j.branch_id AS job_branch_id FROM applications a JOIN jobs j ON a.job_id = j.job_id WHERE a.application_id = %s LIMIT 1',
+                        (application_id,),
+                    )
+                    app_branch_row = cursor.fetchone()
+                    app_branch_id = app_branch_row.get('job_branch_id') if app_branch_row else None
+                    if app_branch_row and str(app_branch_id) != str(branch_id):
+                        log.warning('⚠️ Branch scope check failed: user.branch_id=%s app.job_branch_id=%s application_id=%s', branch_id, app_branch_id, application_id)
+                        if wants_json:
+                            return jsonify({'success': False, 'error': 'Not authorized', 'role': session.get('user_role'), 'user_branch_id': session.get('branch_id'), 'app_branch_id': app_branch_id}), 403
+                        flash('You do not have permission to archive this application.', 'error')
+                        return redirect(url_for('applicants'))
                 flash('Application not found.', 'error')
-                if (
-                    request.is_json
-                    or request.headers.get('X-Requested-With') == 'XMLHttpRequest'
-                    or request.accept_mimetypes.accept_json
-                    or ('application/json' in (request.headers.get('Accept') or '').lower())
-                ):
+                if wants_json:
                     return jsonify({'success': False, 'error': 'Application not found.'}), 404
         except Exception as e:
             db.rollback()
@@ -8589,21 +8416,9 @@ def archive_applicant(application_id):
     # - Otherwise, if current user role is admin, go to admin archived page
     # - Else, go to HR archived page
     ref = (request.referrer or '')
-    try:
-        role = session.get('user_role') or (get_current_user() or {}).get('role')
-    except Exception:
-        role = None
 
-    # Honor posted redirect for non-AJAX flows as well (sanitized)
-    if posted_redirect and (posted_redirect.startswith('/') or posted_redirect.startswith(url_for('archived_applicants')) or posted_redirect.startswith(url_for('admin_archived_applicants'))):
-        if (role or '').lower() == 'admin' and posted_redirect.startswith(url_for('admin_archived_applicants')):
-            return redirect(posted_redirect)
-        if (role or '').lower() != 'admin' and posted_redirect.startswith(url_for('archived_applicants')):
-            return redirect(posted_redirect)
-    # Choose redirect purely by role to avoid unauthorized admin page access
-    if (role or '').lower() == 'admin':
-        return redirect(url_for('admin_archived_applicants'))
-    return redirect(url_for('archived_applicants'))
+    # Honor posted redirect for non-AJAX flows as well (sanitized), otherwise redirect purely by role
+    return redirect(_archived_redirect_target(role, posted_redirect))
 
 
 @app.route('/hr/applicants/<int:application_id>/delete', methods=['POST'])
@@ -8619,21 +8434,11 @@ def delete_applicant_now(application_id):
     cursor = db.cursor()
     try:
         # Soft-archive application so applicant's record remains intact.
-        try:
-            # Prefer setting archived_at to NULL when supported
-            cursor.execute(
-                "UPDATE applications SET status = %s, archived_at = NULL, updated_at = NOW() WHERE application_id = %s",
-                ('archived', application_id)
-            )
-        except Exception:
-            # Fallback for older schemas without archived_at
-            cursor.execute(
-                "UPDATE applications SET status = %s WHERE application_id = %s",
-                ('archived', application_id)
-            )
+        cursor.execute(_soft_archive_application_sql(cursor), ('archived', application_id))
 
         if cursor.rowcount > 0:
             db.commit()
+            _invalidate_archived_applicants_cache()
             flash('Application archived (soft-archived).', 'success')
         else:
             db.rollback()
@@ -8665,6 +8470,35 @@ def delete_applicant_now(application_id):
     return redirect(url_for('applicants'))
 
 
+SAVED_JOBS_PAGE_SIZE = 50
+
+
+@lru_cache(maxsize=8)
+def _saved_jobs_sql(job_columns):
+    """Build the saved-jobs page query for a jobs column set (filters and paging are bound parameters)."""
+    job_title_expr = job_column_expr('job_title', alternatives=['title'], default="'Untitled Job'")
+    job_description_expr = job_column_expr('job_description', alternatives=['description'], default='NULL')
+    status_expr = job_column_expr('status', default="'open'")
+    branch_id_expr = job_column_expr('branch_id', default='NULL')
+    position_id_expr = job_column_expr('position_id', default='NULL')
+    status_placeholders = ', '.join(['%s'] * len(PUBLISHABLE_JOB_STATUSES))
+    return f'''
+        SELECT j.job_id, {job_title_expr} AS job_title, LEFT({job_description_expr}, 200) AS summary,
+               {branch_id_expr} AS branch_id, {position_id_expr} AS position_id,
+               COALESCE(b.branch_name, 'Unassigned') AS branch_name, sj.saved_at
+        FROM saved_jobs sj
+        JOIN jobs j ON sj.job_id = j.job_id
+        LEFT JOIN branches b ON {branch_id_expr} = b.branch_id
+        WHERE sj.applicant_id = %s
+          AND {status_expr} IN ({status_placeholders})
+          AND (%s IS NULL OR {branch_id_expr} = %s)
+          AND (%s IS NULL OR {position_id_expr} = %s)
+          AND (%s IS NULL OR {job_title_expr} LIKE %s OR {job_description_expr} LIKE %s OR b.branch_name LIKE %s)
+        ORDER BY sj.saved_at DESC
+        LIMIT %s OFFSET %s
+    '''
+
+
 @app.route('/applicant/jobs/saved')
 @login_required('applicant')
 def saved_jobs():
@@ -8682,118 +8516,51 @@ def saved_jobs():
         flash('Database connection error.', 'error')
         return render_template('applicant/jobs.html', jobs=[], branches=[], positions=[], current_filters=filters, saved_mode=True)
     
-    cursor = db.cursor(dictionary=True)
+    cursor = db.cursor()
     try:
-        # Check if saved_jobs table exists
-        cursor.execute("SHOW TABLES LIKE 'saved_jobs'")
-        if not cursor.fetchone():
+        # Check if saved_jobs table exists (cached schema probe)
+        if not _table_exists(cursor, 'saved_jobs'):
             flash('No saved jobs found.', 'info')
             return render_template('applicant/jobs.html', jobs=[], branches=[], positions=[], current_filters=filters, saved_mode=True)
         
-        # Check the schema of saved_jobs table
-        cursor.execute("DESCRIBE saved_jobs")
-        saved_columns = [col['Field'] for col in cursor.fetchall()]
-        print(f"Saved jobs columns: {saved_columns}")  # Debug info
-        
-        # Ensure schema compatibility for jobs table
-        ensure_schema_compatibility()
-        
         # Fetch saved jobs - use dynamic column checking
-        _update_job_columns(cursor)
-        job_title_expr = job_column_expr('job_title', alternatives=['title'], default="'Untitled Job'")
-        salary_currency_expr = job_column_expr('salary_currency', default="'PHP'")
-        salary_min_expr = job_column_expr('salary_min', default='NULL')
-        salary_max_expr = job_column_expr('salary_max', default='NULL')
-        
-        job_location_expr = job_column_expr('job_location', alternatives=['location'], default='NULL')
-        
-        job_description_expr = job_column_expr('job_description', alternatives=['description'], default='NULL')
-        employment_type_expr = job_column_expr('employment_type', default='NULL')
-        work_arrangement_expr = job_column_expr('work_arrangement', default='NULL')
-        experience_level_expr = job_column_expr('experience_level', default='NULL')
-        application_deadline_expr = job_column_expr('application_deadline', default='NULL')
-        status_expr = job_column_expr('status', default="'open'")
-        branch_id_expr = job_column_expr('branch_id', default='NULL')
-        position_id_expr = job_column_expr('position_id', default='NULL')
-        
-        # Query for saved jobs - removed all references to saved_job_id
+        if not JOB_COLUMNS:
+            _update_job_columns(cursor)
+        keyword = filters.get('keyword')
+        like = f'%{keyword}%' if keyword else None
+        branch_filter = filters.get('branch_id')
+        position_filter = filters.get('position_id')
+        page = max(request.args.get('page', 1, type=int) or 1, 1)
+        # Filters run in SQL so LIMIT/OFFSET pages over the rows actually shown; one extra row flags a next page
         cursor.execute(
-            f'''
-            SELECT j.job_id, {job_title_expr} AS job_title, {job_description_expr} AS job_description, 
-                   {employment_type_expr} AS employment_type, 
-                   {work_arrangement_expr} AS work_arrangement,
-                   {experience_level_expr} AS experience_level, 
-                   {job_location_expr} AS job_location, 
-                   {salary_min_expr} AS salary_min, 
-                   {salary_max_expr} AS salary_max, 
-                   {salary_currency_expr} AS salary_currency,
-                   {application_deadline_expr} AS application_deadline, 
-                   {status_expr} AS status, 
-                   {branch_id_expr} AS branch_id,
-                   {position_id_expr} AS position_id,
-                   COALESCE(b.branch_name, 'Unassigned') AS branch_name,
-                   {job_title_expr} AS position_name,
-                   'General' AS department,
-                   sj.saved_at
-            FROM saved_jobs sj
-            JOIN jobs j ON sj.job_id = j.job_id
-            LEFT JOIN branches b ON {branch_id_expr} = b.branch_id
-            WHERE sj.applicant_id = %s
-            ORDER BY sj.saved_at DESC
-            ''',
-            (applicant_id,),
+            _saved_jobs_sql(frozenset(JOB_COLUMNS)),
+            (
+                applicant_id, *PUBLISHABLE_JOB_STATUSES,
+                branch_filter, branch_filter,
+                position_filter, position_filter,
+                like, like, like, like,
+                SAVED_JOBS_PAGE_SIZE + 1, (page - 1) * SAVED_JOBS_PAGE_SIZE,
+            ),
         )
-        saved_jobs_list = cursor.fetchall()
-        
-        # Format jobs similar to fetch_open_jobs
-        jobs = []
-        for job in saved_jobs_list:
-            jobs.append({
-                'job_id': job.get('job_id'),
-                'title': job.get('job_title'),
-                'job_title': job.get('job_title'),
-                'summary': (job.get('job_description') or '')[:200] if job.get('job_description') else '',
-                'description': job.get('job_description'),
-                'employment_type': job.get('employment_type'),
-                'work_arrangement': job.get('work_arrangement'),
-                'experience_level': job.get('experience_level'),
-                'location': job.get('job_location'),
-                'job_location': job.get('job_location'),
-                'salary_min': job.get('salary_min'),
-                'salary_max': job.get('salary_max'),
-                'salary_currency': job.get('salary_currency'),
-                'salary_display': format_salary_range(job.get('salary_currency'), job.get('salary_min'), job.get('salary_max')),
-                'application_deadline': job.get('application_deadline'),
-                'status': job.get('status'),
-                'branch_name': job.get('branch_name'),
-                'branch_id': job.get('branch_id'),
-                'position_name': job.get('position_name'),
-                'position_id': job.get('position_id'),
-                'department': job.get('department'),
-                'saved_at': job.get('saved_at'),
-                'is_saved': True,
-            })
-
-        def matches_filters(job_data):
-            if filters.get('keyword'):
-                keyword = filters['keyword'].lower()
-                haystacks = [
-                    (job_data.get('title') or '').lower(),
-                    (job_data.get('job_title') or '').lower(),
-                    (job_data.get('summary') or '').lower(),
-                    (job_data.get('description') or '').lower(),
-                    (job_data.get('branch_name') or '').lower(),
-                    (job_data.get('position_name') or '').lower(),
-                ]
-                if not any(keyword in text for text in haystacks):
-                    return False
-            if filters.get('branch_id') and str(filters['branch_id']) != str(job_data.get('branch_id') or ''):
-                return False
-            if filters.get('position_id') and str(filters['position_id']) != str(job_data.get('position_id') or ''):
-                return False
-            return job_data.get('status') in PUBLISHABLE_JOB_STATUSES
+        rows = cursor.fetchall()
+        has_next_page = len(rows) > SAVED_JOBS_PAGE_SIZE
 
-        jobs = [job for job in jobs if matches_filters(job)]
+        # Plain tuple rows map straight onto the fields the jobs template reads
+        jobs = [
+            {
+                'job_id': job_id,
+                'title': job_title,
+                'job_title': job_title,
+                'summary': summary or '',
+                'branch_id': branch_id,
+                'branch_name': branch_name,
+                'position_id': position_id,
+                'position_name': job_title,
+                'saved_at': saved_at,
+                'is_saved': True,
+            }
+            for job_id, job_title, summary, branch_id, position_id, branch_name, saved_at in rows[:SAVED_JOBS_PAGE_SIZE]
+        ]
         
         branches = fetch_branches()
         positions = fetch_positions()
@@ -8805,6 +8572,8 @@ def saved_jobs():
             positions=positions,
             current_filters=filters,
             saved_mode=True,
+            page=page,
+            has_next_page=has_next_page,
         )
     except Exception as exc:
         db.rollback()
@@ -8972,17 +8741,7 @@ def applicant_profile():
                             (applicant_id,)
                         )
                         # Insert new resume
-                        cursor.execute(
-                            '''
-                            INSERT INTO resumes (applicant_id, file_name, file_path)
-                            VALUES (%s, %s, %s)
-                            ''',
-                            (
-                                applicant_id,
-                                file_info['original_filename'],
-                                file_info.get('storage_path') or file_info.get('file_path', ''),
-                            ),
-                        )
+                        _insert_resume(cursor, applicant_id, file_info)
                         log_profile_change(
                             applicant_id,
                             'applicant',
@@ -9421,12 +9180,14 @@ J&T Express Recruitment Team
             )
         fresh_applicant_record = cursor.fetchone() or applicant_record
         
+        resume_size_expr = 'file_size_bytes' if _has_column(cursor, 'resumes', 'file_size_bytes') else 'NULL'
         cursor.execute(
-            '''
+            f'''
             SELECT resume_id,
                    file_name,
                    file_path,
-                   uploaded_at
+                   uploaded_at,
+                   {resume_size_expr} AS file_size_bytes
             FROM resumes
             WHERE applicant_id = %s
             ORDER BY uploaded_at DESC
@@ -9518,19 +9279,7 @@ J&T Express Recruitment Team
         for item in resumes:
             file_path = (item.get('file_path') or '').replace('\\', '/')
             file_name = item.get('file_name') or os.path.basename(file_path) or 'Resume'
-            # Compute file size from filesystem when possible
-            try:
-                if file_path:
-                    if os.path.isabs(file_path):
-                        abs_path = os.path.realpath(file_path)
-                    else:
-                        abs_path = os.path.realpath(os.path.join(app.instance_path, file_path))
-                else:
-                    abs_path = None
-                file_size_bytes = os.path.getsize(abs_path) if abs_path and os.path.exists(abs_path) else 0
-            except Exception:
-                file_size_bytes = 0
-            file_size = format_file_size(file_size_bytes)
+            file_size = format_file_size(_resume_file_size(item))
 
             resumes_context.append(
                 {
@@ -9651,6 +9400,41 @@ def admin_applicant_attachments(applicant_id):
         cursor.close()
 
 
+@app.route('/applicant/resumes/<int:resume_id>/size')
+@login_required('applicant')
+def resume_size(resume_id):
+    """Return one resume's size in bytes, recording it for rows uploaded before sizes were stored."""
+    applicant_id = session.get('user_id')
+    db = get_db()
+    if not db:
+        return json_response({'error': 'Database connection error'}, 500)
+    cursor = db.cursor(dictionary=True)
+    try:
+        has_size = _has_column(cursor, 'resumes', 'file_size_bytes')
+        size_expr = 'file_size_bytes' if has_size else 'NULL'
+        cursor.execute(
+            f'SELECT file_path, {size_expr} AS file_size_bytes FROM resumes WHERE resume_id = %s AND applicant_id = %s LIMIT 1',
+            (resume_id, applicant_id),
+        )
+        row = cursor.fetchone()
+        if not row:
+            return json_response({'error': 'Resume not found'}, 404)
+        size = _resume_file_size(row)
+        if has_size and row.get('file_size_bytes') is None and size:
+            cursor.execute(
+                'UPDATE resumes SET file_size_bytes = %s WHERE resume_id = %s AND file_size_bytes IS NULL',
+                (size, resume_id),
+            )
+            db.commit()
+        return json_response({'size': size})
+    except Exception as exc:
+        db.rollback()
+        log.exception('❌ Resume size lookup error: %s', exc)
+        return json_response({'error': 'Unable to read resume size'}, 500)
+    finally:
+        cursor.close()
+
+
 @app.route('/applicant/resumes/<int:resume_id>/view')
 @login_required('applicant')
 def preview_resume(resume_id):
@@ -13067,9 +12851,8 @@ def applicants():
         # Filter out other empty values but ALWAYS keep status (even if empty string)
         filters = {k: v for k, v in filters.items() if (v or k == 'status') and (v is not None or k != 'branch_id')}
         
-        # Debug: Print received status filter
-        print(f"🔍 Received status filter from request: '{status_param}' -> processed: '{filters.get('status', '')}'")
-        print(f"🔍 Status filter type: {type(filters.get('status'))}, value: '{filters.get('status')}', empty check: {not filters.get('status')}")
+        # Debug: log received status filter
+        log.debug("🔍 Received status filter from request: '%s' -> processed: '%s'", status_param, filters.get('status', ''))
         
         # Build WHERE clauses
         where_clauses = []
@@ -13108,12 +12891,7 @@ def applicants():
             params.extend([search_term, search_term, search_term])
 
         # Detect whether the applications table has an `archived_at` column
-        try:
-            cursor.execute('SHOW COLUMNS FROM applications')
-            _cols = {row.get('Field') for row in cursor.fetchall() or []}
-            has_archived_at = 'archived_at' in _cols
-        except Exception:
-            has_archived_at = False
+        has_archived_at = _has_column(cursor, 'applications', 'archived_at')
 
         # Exclude archived applicants; if `archived_at` is missing, avoid referencing it
         if has_archived_at:
@@ -13160,15 +12938,14 @@ def applicants():
         # Debug: Check status distribution in results
         status_filter_value = filters.get('status', '').strip().lower() if filters else ''
         db_status = status_filter_value
-        if status_filter_value and applications:
+        if status_filter_value and applications and log.isEnabledFor(logging.DEBUG):
             status_counts = {}
             for app in applications:
                 status = app.get('status', 'unknown')
                 status_counts[status] = status_counts.get(status, 0) + 1
-            print(f"🔍 Results status distribution: {status_counts}")
-            print(f"🔍 Expected status: '{db_status}', Found statuses: {list(status_counts.keys())}")
+            log.debug('🔍 Results status distribution: %s', status_counts)
             if db_status not in status_counts or status_counts.get(db_status, 0) != len(applications):
-                print(f"⚠️ WARNING: Filter mismatch! Expected all '{db_status}', but found: {status_counts}")
+                log.debug("⚠️ Filter mismatch! Expected all '%s', but found: %s", db_status, status_counts)
         
         # Calculate quick stats (without status filter for accurate counts)
         stats_where_clauses = []
@@ -13615,12 +13392,14 @@ def applications():
                                 
                                 if 'sent_at' in notification_columns:
                                     cursor.execute(
-                                        'INSERT INTO notifications (application_id, message, sent_at, is_read) VALUES (%s, %s, NOW(), 0)',
+                                        'INSERT INTO notifications (application_id, message, sent_at, is_read) VALUES (%s, %s, NOW(), 0) '
+                                        'ON DUPLICATE KEY UPDATE is_read = 0, sent_at = NOW()',
                                         (application_id, message)
                                     )
                                 else:
                                     cursor.execute(
-                                        'INSERT INTO notifications (application_id, message, is_read) VALUES (%s, %s, 0)',
+                                        'INSERT INTO notifications (application_id, message, is_read) VALUES (%s, %s, 0) '
+                                        'ON DUPLICATE KEY UPDATE is_read = 0',
                                         (application_id, message)
                                     )
                                 
@@ -13826,7 +13605,7 @@ J&T Express Recruitment Team
                 placeholders = ','.join(['%s'] * len(db_statuses))
                 where_clauses.append(f'a.status IN ({placeholders})')
                 params.extend(db_statuses)
-                print(f"🔍 Status filter applied: '{status_filter}' -> WHERE a.status IN {db_statuses}")
+                log.debug("🔍 Status filter applied: '%s' -> WHERE a.status IN %s", status_filter, db_statuses)
             else:
                 print(f"⚠️ Invalid status filter: '{status_filter}' - not in status_map")
         
@@ -14557,6 +14336,7 @@ J&T Express Recruitment Team
                                     '''
                                     INSERT INTO notifications (application_id, message, sent_at, is_read)
                                     VALUES (%s, %s, NOW(), 0)
+                                    ON DUPLICATE KEY UPDATE is_read = 0, sent_at = NOW()
                                     ''',
                                     (application_id, reschedule_message),
                                 )
@@ -14565,6 +14345,7 @@ J&T Express Recruitment Team
                                     '''
                                     INSERT INTO notifications (application_id, message, is_read)
                                     VALUES (%s, %s, 0)
+                                    ON DUPLICATE KEY UPDATE is_read = 0
                                     ''',
                                     (application_id, reschedule_message),
                                 )
@@ -14668,6 +14449,7 @@ J&T Express Recruitment Team
                                     '''
                                     INSERT INTO notifications (application_id, message, sent_at, is_read)
                                     VALUES (%s, %s, NOW(), 0)
+                                    ON DUPLICATE KEY UPDATE is_read = 0, sent_at = NOW()
                                     ''',
                                     (application_id, cancel_message),
                                 )
@@ -14676,6 +14458,7 @@ J&T Express Recruitment Team
                                     '''
                                     INSERT INTO notifications (application_id, message, is_read)
                                     VALUES (%s, %s, 0)
+                                    ON DUPLICATE KEY UPDATE is_read = 0
                                     ''',
                                     (application_id, cancel_message),
                                 )
@@ -18946,10 +18729,7 @@ def view_applicant(applicant_id):
     
     cursor = db.cursor(dictionary=True)
     # Log context for debugging
-    try:
-        print(f"➡️ View applicant request: user={user and user.get('id')}, role={user and user.get('role')}, applicant_id={applicant_id}")
-    except Exception:
-        pass
+    log.debug('➡️ View applicant request: user=%s, applicant_id=%s', user and user.get('id'), applicant_id)
     try:
         # Ensure schema compatibility before querying
         try:
@@ -19028,12 +18808,13 @@ def view_applicant(applicant_id):
             applications = []
             print(f'⚠️ Error fetching applications for applicant_id={applicant_id}: {e}')
         
-        # Get applicant's resumes
+        # Get applicant's resumes (sizes come from the stored column; only legacy rows are stat'ed)
+        resume_size_expr = 'r.file_size_bytes' if _has_column(cursor, 'resumes', 'file_size_bytes') else 'NULL'
         try:
             cursor.execute(
-                '''
-                SELECT resume_id, file_name, file_path, uploaded_at
-                FROM resumes
+                f'''
+                SELECT resume_id, file_name, file_path, uploaded_at, {resume_size_expr} AS file_size_bytes
+                FROM resumes r
                 WHERE applicant_id = %s
                 ORDER BY uploaded_at DESC
                 ''',
@@ -19050,8 +18831,9 @@ def view_applicant(applicant_id):
             table_exists = cursor.fetchone() is not None
             if table_exists:
                 cursor.execute(
-                    '''
-                    SELECT DISTINCT r.resume_id, r.file_name, r.file_path, r.uploaded_at, r.file_type
+                    f'''
+                    SELECT DISTINCT r.resume_id, r.file_name, r.file_path, r.uploaded_at, r.file_type,
+                           {resume_size_expr} AS file_size_bytes
                     FROM application_attachments aa
                     JOIN applications a ON aa.application_id = a.application_id
                     JOIN resumes r ON aa.resume_id = r.resume_id
@@ -19100,18 +18882,8 @@ def view_applicant(applicant_id):
         for resume in unique_resumes:
             file_path = (resume.get('file_path') or '').replace('\\', '/')
             file_name = resume.get('file_name') or os.path.basename(file_path) or 'Resume'
-            try:
-                if file_path:
-                    if os.path.isabs(file_path):
-                        abs_path = os.path.realpath(file_path)
-                    else:
-                        abs_path = os.path.realpath(os.path.join(app.instance_path, file_path))
-                else:
-                    abs_path = None
-                file_size_bytes = os.path.getsize(abs_path) if abs_path and os.path.exists(abs_path) else 0
-                file_size = format_file_size(file_size_bytes) if file_size_bytes else 'Unknown'
-            except Exception:
-                file_size = 'Unknown'
+            file_size_bytes = _resume_file_size(resume)
+            file_size = format_file_size(file_size_bytes) if file_size_bytes else 'Unknown'
 
             # Build safe view/download URLs. Prefer resume_id-based endpoints when available.
             try:
@@ -19151,8 +18923,9 @@ def view_applicant(applicant_id):
         attachments_seen_by_application = {}
         try:
             cursor.execute(
-                '''
-                SELECT aa.application_id, r.resume_id, r.file_name, r.file_path, r.uploaded_at, r.file_type
+                f'''
+                SELECT aa.application_id, r.resume_id, r.file_name, r.file_path, r.uploaded_at, r.file_type,
+                       {resume_size_expr} AS file_size_bytes
                 FROM application_attachments aa
                 JOIN resumes r ON aa.resume_id = r.resume_id
                 JOIN applications a ON aa.application_id = a.application_id
@@ -19181,18 +18954,8 @@ def view_applicant(applicant_id):
                 # format similar to formatted_resumes
                 file_path = (row.get('file_path') or '').replace('\\', '/')
                 file_name = row.get('file_name') or os.path.basename(file_path) or 'Document'
-                try:
-                    if file_path:
-                        if os.path.isabs(file_path):
-                            abs_path = os.path.realpath(file_path)
-                        else:
-                            abs_path = os.path.realpath(os.path.join(app.instance_path, file_path))
-                    else:
-                        abs_path = None
-                    file_size_bytes = os.path.getsize(abs_path) if abs_path and os.path.exists(abs_path) else 0
-                    file_size = format_file_size(file_size_bytes) if file_size_bytes else 'Unknown'
-                except Exception:
-                    file_size = 'Unknown'
+                file_size_bytes = _resume_file_size(row)
+                file_size = format_file_size(file_size_bytes) if file_size_bytes else 'Unknown'
 
                 try:
                     import base64
@@ -19348,6 +19111,25 @@ def add_hr_account():
     return redirect(url_for('hr_accounts'))
 
 
+@app.route('/admin/refresh-schema', methods=['POST'])
+@login_required('admin')
+def refresh_schema():
+    """Re-run the schema compatibility check and drop cached column probes after manual DDL changes."""
+    global _schema_checked
+    with _schema_lock:
+        _schema_checked = False
+    _invalidate_schema_cache()
+    JOB_COLUMNS.clear()
+    ensure_schema_compatibility()
+    if request.is_json or request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+        return jsonify({'success': _schema_checked})
+    if _schema_checked:
+        flash('Database schema re-checked.', 'success')
+    else:
+        flash('Schema check could not complete; see server logs.', 'error')
+    return redirect(url_for('admin_dashboard'))
+
+
 @app.route('/admin/reset-all-data', methods=['GET', 'POST'])
 @csrf.exempt
 @login_required('admin')
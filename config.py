@@ -12,6 +12,8 @@ class Config:
     MYSQL_USER = os.environ.get("MYSQL_USER") or "root"
     MYSQL_PASSWORD = os.environ.get("MYSQL_PASSWORD") or ""  # EMPTY is common for local XAMPP
     MYSQL_DB = os.environ.get("MYSQL_DB") or "recruitment_system"
+    MYSQL_POOL_NAME = os.environ.get("DB_POOL_NAME") or "recruit"
+    MYSQL_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE") or 10)
 
     PERMANENT_SESSION_LIFETIME = timedelta(days=1)
     # Use the instance directory for uploaded resumes by default (safer)
@@ -214,6 +214,7 @@ class DatabaseInitializer:
                 file_path VARCHAR(255) NOT NULL,
                 uploaded_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 file_type VARCHAR(50) DEFAULT 'resume',
+                file_size_bytes BIGINT NULL DEFAULT NULL,
                 PRIMARY KEY (resume_id),
                 FOREIGN KEY (applicant_id) REFERENCES applicants(applicant_id) ON DELETE CASCADE
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
@@ -227,11 +228,15 @@ class DatabaseInitializer:
                 resume_id INT(20) DEFAULT NULL,
                 applicant_id INT(20) NOT NULL,
                 status ENUM('pending', 'scheduled', 'interviewed', 'hired', 'rejected', 'withdrawn') DEFAULT 'pending',
+                display_status VARCHAR(20) AS (IF(status = 'withdrawn', 'rejected', status)) STORED,
                 archived_at DATETIME DEFAULT NULL,
                 applied_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 viewed_at DATETIME DEFAULT NULL,
                 updated_at DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
                 PRIMARY KEY (application_id),
+                INDEX idx_apps_applicant_status_date (applicant_id, status, applied_at),
+                INDEX idx_apps_applicant_display_status (applicant_id, display_status, applied_at),
+                UNIQUE KEY uq_applicant_job (applicant_id, job_id),
                 FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE,
                 FOREIGN KEY (applicant_id) REFERENCES applicants(applicant_id) ON DELETE CASCADE
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
@@ -245,6 +250,7 @@ class DatabaseInitializer:
                 resume_id INT(11) NOT NULL,
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 PRIMARY KEY (attachment_id),
+                UNIQUE KEY uniq_app_resume (application_id, resume_id),
                 FOREIGN KEY (application_id) REFERENCES applications(application_id),
                 FOREIGN KEY (resume_id) REFERENCES resumes(resume_id)
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
@@ -261,6 +267,7 @@ class DatabaseInitializer:
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 interview_mode VARCHAR(50) DEFAULT NULL,
                 PRIMARY KEY (interview_id),
+                INDEX idx_interviews_app_date (application_id, scheduled_date),
                 FOREIGN KEY (application_id) REFERENCES applications(application_id) ON DELETE CASCADE
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
             """)
@@ -273,6 +280,8 @@ class DatabaseInitializer:
                 job_id INT(20) NOT NULL,
                 saved_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 PRIMARY KEY (saved_job_id),
+                UNIQUE KEY unique_saved_job (applicant_id, job_id),
+                INDEX idx_saved_jobs_applicant_date (applicant_id, saved_at),
                 FOREIGN KEY (applicant_id) REFERENCES applicants(applicant_id) ON DELETE CASCADE,
                 FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
@@ -289,7 +298,17 @@ class DatabaseInitializer:
                 is_read TINYINT(1) DEFAULT 0,
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 sent_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                message_hash BINARY(16) AS (UNHEX(MD5(message))) STORED,
+                message_type TINYINT AS (CASE
+                    WHEN message LIKE 'You applied for%' THEN 1
+                    WHEN message LIKE 'Your application status%' THEN 2
+                    WHEN message LIKE 'Congratulations! You have been hired%' THEN 3
+                    ELSE 0 END) STORED,
                 PRIMARY KEY (notification_id),
+                UNIQUE KEY uniq_notifications_app_message (application_id, message_hash),
+                INDEX idx_notifications_app_type_sent (application_id, message_type, sent_at),
+                INDEX idx_notifications_app_read (application_id, is_read),
+                INDEX idx_notifications_applicant_read (applicant_id, is_read),
                 FOREIGN KEY (applicant_id) REFERENCES applicants(applicant_id) ON DELETE CASCADE,
                 FOREIGN KEY (admin_id) REFERENCES admins(admin_id) ON DELETE CASCADE
             ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci
@@ -1,17 +1,35 @@
-import pytest
-
-from tests.test_manage_integration import FakeDB
-
-
-@pytest.fixture
-def fake_db(monkeypatch):
-    db = FakeDB()
-    import utils.database as dbmod
-    import manage as mg
-
-    monkeypatch.setattr(dbmod, "get_db", lambda: db)
-    # Also patch the get_db used directly in manage module
-    monkeypatch.setattr(mg, "get_db", lambda: db)
-    # Avoid schema compatibility checks that expect Flask app context
-    monkeypatch.setattr(mg, "ensure_schema_compatibility", lambda: True)
-    return db
+import sys
+
+import pytest
+
+from tests.test_manage_integration import FakeDB
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    db = FakeDB()
+    import utils.database as dbmod
+    import manage as mg
+
+    monkeypatch.setattr(dbmod, "get_db", lambda: db)
+    # Also patch the get_db used directly in manage module
+    monkeypatch.setattr(mg, "get_db", lambda: db)
+    # Avoid schema compatibility checks that expect Flask app context
+    monkeypatch.setattr(mg, "ensure_schema_compatibility", lambda: True)
+    return db
+
+
+@pytest.fixture(autouse=True, scope="session")
+def apply_error_log_in_tmp(tmp_path_factory):
+    """Keep apply-error tracebacks from tests out of the repo's instance/apply_error.log."""
+    app_module = sys.modules.get("app")
+    if app_module is not None:
+        handler = app_module._apply_error_handler
+        handler.acquire()
+        try:
+            # delay=True: the next record reopens the stream at the new path
+            handler.close()
+            handler.baseFilename = str(tmp_path_factory.mktemp("instance") / "apply_error.log")
+        finally:
+            handler.release()
+    yield
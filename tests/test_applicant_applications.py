@@ -0,0 +1,104 @@
+import inspect
+import app
+
+
+def test_applicant_applications_query_has_one_row_per_application():
+    src = inspect.getsource(app.applicant_applications)
+    assert "seen_app_ids" not in src, "applications list should not dedupe rows in Python"
+    sql = app._applicant_applications_sql("", "j.job_title", True)
+    assert "DISTINCT" not in sql, "applications list should not need DISTINCT"
+    assert "JOIN interviews" not in sql, "joining interviews directly would duplicate application rows"
+
+
+def test_applicant_applications_sql_is_reused_across_requests():
+    status_sql, status_params = app.APPLICANT_STATUS_FILTERS["hired"]
+    first = app._applicant_applications_sql(status_sql, "j.job_title", False)
+    second = app._applicant_applications_sql(status_sql, "j.job_title", False)
+    assert first is second
+    assert first.count("%s") == 1 + len(status_params)
+    assert "INFORMATION_SCHEMA" not in first
+
+
+def test_applicant_status_filters_match_their_params():
+    for status_sql, status_params in app.APPLICANT_STATUS_FILTERS.values():
+        assert status_sql.count("%s") == len(status_params)
+        assert status_sql.startswith("{status} ")
+
+
+def test_withdrawn_is_folded_by_display_status_not_rewritten(monkeypatch):
+    schema_src = inspect.getsource(app.ensure_schema_compatibility)
+    assert "SET status = 'rejected'" not in schema_src
+    assert "'applications', 'idx_apps_applicant_display_status'" in schema_src
+    assert "IF(status = 'withdrawn', 'rejected', status)" in app.APPLICATION_DISPLAY_STATUS_DEFINITION
+    monkeypatch.setitem(app._SCHEMA_CACHE, 'applications', frozenset({'status', 'display_status'}))
+    assert app._application_status_expr(None) == 'a.display_status'
+    monkeypatch.setitem(app._SCHEMA_CACHE, 'applications', frozenset({'status'}))
+    assert app._application_status_expr(None) == "IF(a.status = 'withdrawn', 'rejected', a.status)"
+    sql = app._applicant_applications_sql("", "j.job_title", False, "a.display_status")
+    assert "a.display_status AS status" in sql
+
+
+class _DeleteBatchDb:
+    """Fake connection whose multi-statement execute yields one result per statement."""
+
+    def __init__(self, rowcounts):
+        self.rowcounts = rowcounts
+        self.commits = 0
+        self.rollbacks = 0
+        self.calls = []
+
+    def cursor(self, dictionary=False):
+        return self
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+    def execute(self, sql, params=(), multi=False):
+        self.calls.append((sql, params, multi))
+
+        class Result:
+            def __init__(self, rowcount):
+                self.rowcount = rowcount
+
+        return iter([Result(count) for count in self.rowcounts])
+
+
+def _delete_application(monkeypatch, rowcounts):
+    db = _DeleteBatchDb(rowcounts)
+    monkeypatch.setattr(app, 'get_db', lambda: db)
+    monkeypatch.setattr(app, '_table_exists', lambda cursor, table: True)
+    monkeypatch.setattr(app, '_archived_applicants_cache', {None: (float('inf'), ([], []))})
+    with app.app.test_request_context('/applicant/applications/11/delete', method='POST'):
+        app.session['user_id'] = 3
+        app.delete_application.__wrapped__(application_id=11)
+        flashes = app.session.get('_flashes', [])
+    return db, flashes
+
+
+def test_delete_application_runs_one_batched_round_trip(monkeypatch):
+    # Child DELETEs report rows, but only the final applications DELETE decides the outcome
+    db, flashes = _delete_application(monkeypatch, [2, 1, 0, 1])
+    (sql, params, multi), = db.calls
+    assert multi
+    statements = sql.split(';\n')
+    assert [s.split()[1] for s in statements] == ['i', 'n', 'aa', 'FROM']
+    for statement in statements[:-1]:
+        assert 'JOIN applications a ON a.application_id' in statement
+        assert 'AND a.applicant_id = %s' in statement
+    assert statements[-1] == 'DELETE FROM applications WHERE application_id = %s AND applicant_id = %s'
+    assert params == (11, 3) * 4
+    assert db.commits == 1 and db.rollbacks == 0
+    assert app._archived_applicants_cache == {}
+    assert ('success', 'Application permanently deleted successfully.') in flashes
+
+
+def test_delete_application_rolls_back_when_nothing_is_owned(monkeypatch):
+    db, flashes = _delete_application(monkeypatch, [1, 1, 1, 0])
+    assert db.commits == 0 and db.rollbacks == 1
+    assert ('error', 'Application not found or you do not have permission to delete it.') in flashes
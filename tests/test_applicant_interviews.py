@@ -0,0 +1,171 @@
+import inspect
+import app
+
+
+def test_interviews_view_joins_job_and_branch_in_one_query():
+    src = inspect.getsource(app.applicant_interviews)
+    assert "LEFT JOIN branches b ON j.branch_id = b.branch_id" in app._applicant_interviews_sql(True)
+    assert "jobs_data" not in src, "job/branch enrichment should come from the main query"
+
+
+def test_interviews_view_does_not_dedupe_rows():
+    src = inspect.getsource(app.applicant_interviews)
+    assert "SELECT DISTINCT" not in src
+    assert "DISTINCT" not in app._applicant_interviews_sql(True)
+    assert "seen_ids" not in src
+
+
+def test_interviews_view_buckets_by_sql_flag():
+    src = inspect.getsource(app.applicant_interviews)
+    for minimal in (False, True):
+        assert "(i.scheduled_date >= NOW()) AS is_upcoming" in app._applicant_interviews_sql(True, minimal=minimal)
+    assert "strptime" not in src
+
+
+def test_interview_actions_do_not_probe_for_existing_notifications():
+    src = inspect.getsource(app.applicant_interviews)
+    assert "existing_notification" not in src
+
+
+def test_interviews_sql_is_built_once_per_schema_variant():
+    for minimal in (False, True):
+        for has_location in (False, True):
+            sql = app._applicant_interviews_sql(has_location, minimal=minimal)
+            assert sql is app._applicant_interviews_sql(has_location, minimal=minimal)
+            assert sql.count("%s") == 1
+            assert "AS location AS" not in sql
+
+
+def test_interview_actions_trust_update_rowcount():
+    src = inspect.getsource(app.applicant_interviews)
+    assert "actual_status" not in src, "confirm/cancel should not re-SELECT the status after commit"
+
+
+def test_delete_all_interviews_does_not_preselect_rows():
+    src = inspect.getsource(app.applicant_interviews)
+    assert "interviews_to_delete" not in src
+
+
+def test_interview_actions_skip_unused_hr_lookups():
+    src = inspect.getsource(app.applicant_interviews)
+    assert "interview_details" not in src
+    assert "JOIN users u" not in src
+
+
+def test_interview_actions_build_the_back_url_once():
+    src = inspect.getsource(app.applicant_interviews)
+    assert src.count("url_for('applicant_interviews', _external=True)") == 1
+
+
+def test_interviews_view_runs_the_full_query_first():
+    src = inspect.getsource(app.applicant_interviews)
+    assert "cursor.execute(_applicant_interviews_sql(has_location), (applicant_id,))" in src
+    assert "_applicant_interviews_sql" not in inspect.getsource(app.inject_applicant_notifications)
+
+
+def test_interview_note_fallbacks_keep_the_status_and_date_guard():
+    src = inspect.getsource(app.applicant_interviews)
+    fallbacks = src.split("SET i.notes = CONCAT(")[1:]
+    assert len(fallbacks) == 2
+    for fallback in fallbacks:
+        statement = fallback.split("'''", 1)[0]
+        assert "COALESCE(i.status, 'scheduled') IN (" in statement
+        assert "i.scheduled_date >= NOW()" in statement
+
+
+class _InterviewDb:
+    """Fake connection scripting the claim SELECT, the status/notes UPDATEs and the diagnostic SELECT."""
+
+    def __init__(self, claimed=True, status_rows=1, status_error=False, notes_rows=0, current=None):
+        self.claimed = claimed
+        self.status_rows = status_rows
+        self.status_error = status_error
+        self.notes_rows = notes_rows
+        self.current = current or {'status': 'scheduled', 'scheduled_date': None}
+        self.commits = 0
+        self.rollbacks = 0
+        self.statements = []
+        self.events = []
+        self.rowcount = 0
+        self.row = None
+
+    def cursor(self, dictionary=False):
+        return self
+
+    def commit(self):
+        self.commits += 1
+        self.events.append('commit')
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.events.append('rollback')
+
+    def close(self):
+        pass
+
+    def execute(self, sql, params=()):
+        self.statements.append(sql)
+        self.events.append('execute')
+        self.row, self.rowcount = None, 0
+        if 'SKIP LOCKED' in sql:
+            self.row = {'interview_id': params[0]} if self.claimed else None
+        elif 'SET i.status' in sql:
+            if self.status_error:
+                raise RuntimeError('status enum rejected the value')
+            self.rowcount = self.status_rows
+        elif 'SET i.notes' in sql:
+            self.rowcount = self.notes_rows
+        elif 'SELECT i.status, i.scheduled_date' in sql:
+            self.row = self.current
+
+    def fetchone(self):
+        return self.row
+
+
+def _post_interview_action(monkeypatch, db, action='confirm_interview'):
+    monkeypatch.setattr(app, 'get_db', lambda: db)
+    monkeypatch.setattr(app, 'HAS_INTERVIEW_NOTES_COLUMN', True)
+    headers = {'Accept': 'application/json'}
+    form = {'action': action, 'interview_id': '4'}
+    with app.app.test_request_context('/applicant/interviews', method='POST', data=form, headers=headers):
+        app.session['user_id'] = 3
+        response = app.applicant_interviews.__wrapped__()
+    return response.status_code, response.get_json()
+
+
+def test_interview_claim_locks_only_the_interview_row(monkeypatch):
+    db = _InterviewDb()
+    status, payload = _post_interview_action(monkeypatch, db)
+    assert status == 200 and payload['success'] and payload['status'] == 'confirmed'
+    assert 'FOR UPDATE OF i SKIP LOCKED' in db.statements[0]
+    assert db.commits == 1 and db.rollbacks == 0
+
+
+def test_unclaimed_interview_reports_concurrent_request_and_releases(monkeypatch):
+    db = _InterviewDb(claimed=False)
+    status, payload = _post_interview_action(monkeypatch, db, 'cancel_interview')
+    assert not payload['success']
+    assert payload['message'] == 'Another request is processing this interview.'
+    assert not any('UPDATE interviews' in sql for sql in db.statements)
+    assert db.commits == 0 and db.rollbacks == 1
+
+
+def test_claimed_but_unchanged_interview_rolls_back_before_answering(monkeypatch):
+    db = _InterviewDb(status_rows=0, current={'status': 'cancelled', 'scheduled_date': None})
+    status, payload = _post_interview_action(monkeypatch, db)
+    assert not payload['success'] and 'cancelled interview' in payload['message']
+    assert db.commits == 0 and db.rollbacks == 1
+    # The lock is released before the diagnostic SELECT and the response
+    assert db.events[-2:] == ['rollback', 'execute']
+
+
+def test_notes_fallback_respects_the_guard(monkeypatch):
+    db = _InterviewDb(status_error=True, notes_rows=0, current={'status': 'completed', 'scheduled_date': None})
+    status, payload = _post_interview_action(monkeypatch, db)
+    assert not payload['success']
+    assert payload['message'] == 'Cannot modify the status of a completed interview.'
+    assert db.commits == 0 and db.rollbacks == 1
+
+    db = _InterviewDb(status_error=True, notes_rows=1)
+    status, payload = _post_interview_action(monkeypatch, db, 'cancel_interview')
+    assert payload['success'] and db.commits == 1
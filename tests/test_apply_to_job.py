@@ -0,0 +1,258 @@
+import inspect
+import logging
+
+import mysql.connector
+
+import app
+
+
+def test_apply_looks_up_known_job_directly():
+    src = inspect.getsource(app.apply_to_job)
+    assert "WHERE j.job_id = %s AND j.status IN" in src
+    assert "for j in all_jobs" not in src, "a known job_id should not scan the dropdown list"
+
+
+def test_apply_sizes_resumes_without_exists_probe():
+    src = inspect.getsource(app.apply_to_job)
+    assert "os.path.exists" not in src
+    assert "os.path.getsize" not in src
+
+
+def test_apply_flags_existing_application_in_job_query():
+    src = inspect.getsource(app.apply_to_job)
+    assert "AS already_applied" in src
+    # POST pre-check SELECT only runs while the uq_applicant_job key is missing
+    assert "not _has_index(cursor, 'applications', 'uq_applicant_job')" in src
+
+
+class _ApplyDb:
+    def __init__(self, insert_errno):
+        self.insert_errno = insert_errno
+        self.commits = 0
+        self.rollbacks = 0
+        self.statements = []
+
+    def cursor(self, dictionary=False):
+        return self
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+    def execute(self, sql, params=()):
+        self.statements.append(sql)
+        if 'INSERT INTO applications' in sql:
+            raise mysql.connector.errors.IntegrityError(msg='duplicate', errno=self.insert_errno)
+        if 'WHERE j.job_id = %s' in sql:
+            self.row = {'job_id': 5, 'allowed_extensions': None, 'max_file_size_mb': None, 'already_applied': 1}
+        elif 'FROM resumes WHERE resume_id' in sql:
+            self.row = {'resume_id': 9, 'file_name': 'cv.pdf'}
+        elif 'SELECT application_id FROM applications' in sql:
+            self.row = {'application_id': 1}
+        else:
+            self.row = None
+
+    def fetchone(self):
+        return self.row
+
+
+def _post_application(monkeypatch, insert_errno, has_unique_key=True):
+    db = _ApplyDb(insert_errno)
+    monkeypatch.setattr(app, 'get_db', lambda: db)
+    monkeypatch.setattr(app, 'JOB_COLUMNS', {'job_id', 'job_title', 'status'})
+    monkeypatch.setitem(app._SCHEMA_CACHE, 'resumes', frozenset({'resume_id'}))
+    monkeypatch.setitem(app._INDEX_CACHE, ('applications', 'uq_applicant_job'), has_unique_key)
+    form = {'resume_id': '9', 'job_id': '5'}
+    with app.app.test_request_context('/applicant/apply/5', method='POST', data=form):
+        app.session['user_id'] = 3
+        response = app.apply_to_job.__wrapped__(job_id=5)
+        flashes = app.session.get('_flashes', [])
+    return db, response, flashes
+
+
+def test_apply_duplicate_key_is_reported_as_already_applied(monkeypatch):
+    db, response, flashes = _post_application(monkeypatch, 1062)
+    assert db.commits == 1 and db.rollbacks == 0
+    assert ('warning', 'You have already applied for this position.') in flashes
+    assert response.status_code == 302 and response.location.endswith('/jobs')
+    assert not any('SELECT application_id FROM applications' in sql for sql in db.statements)
+
+
+def test_apply_other_insert_errors_are_reraised(monkeypatch):
+    db, response, flashes = _post_application(monkeypatch, 1452)
+    assert db.commits == 0 and db.rollbacks == 1
+    assert ('warning', 'You have already applied for this position.') not in flashes
+    assert ('error', 'Unable to submit application. Please try again.') in flashes
+
+
+def test_apply_keeps_precheck_until_unique_key_exists(monkeypatch):
+    db, response, flashes = _post_application(monkeypatch, 1062, has_unique_key=False)
+    assert ('warning', 'You have already applied for this position.') in flashes
+    assert any('SELECT application_id FROM applications' in sql for sql in db.statements)
+    assert not any('INSERT INTO applications' in sql for sql in db.statements)
+    assert db.commits == 0
+
+
+class _ResumeCursor:
+    def __init__(self):
+        self.statements = []
+        self.lastrowid = 41
+
+    def execute(self, sql, params=()):
+        self.statements.append(('execute', sql, params))
+
+    def executemany(self, sql, rows):
+        self.statements.append(('executemany', sql, rows))
+
+    def fetchall(self):
+        # Read-back order differs from upload order on purpose
+        return [{'resume_id': 8, 'file_path': 'b.pdf'}, {'resume_id': 7, 'file_path': 'a.pdf'}]
+
+
+def test_insert_resumes_batches_rows_and_maps_ids_by_path(monkeypatch):
+    monkeypatch.setattr(app, '_has_column', lambda cursor, table, column: True)
+    monkeypatch.setattr(app, '_autoinc_step', 0)
+    cursor = _ResumeCursor()
+    uploads = [
+        ({'original_filename': 'cv.pdf', 'storage_path': 'a.pdf', 'file_size': 10}, 'resume'),
+        ({'original_filename': 'letter.pdf', 'storage_path': 'b.pdf', 'file_size': 20}, 'letter'),
+    ]
+    assert app._insert_resumes(cursor, 3, uploads) == [7, 8]
+    kind, sql, rows = cursor.statements[0]
+    assert kind == 'executemany' and 'file_size_bytes' in sql
+    assert rows == [(3, 'cv.pdf', 'a.pdf', 'resume', 10), (3, 'letter.pdf', 'b.pdf', 'letter', 20)]
+
+
+def test_insert_resumes_derives_consecutive_ids_without_read_back(monkeypatch):
+    monkeypatch.setattr(app, '_has_column', lambda cursor, table, column: False)
+    monkeypatch.setattr(app, '_autoinc_step', 2)
+    cursor = _ResumeCursor()
+    cursor.rowcount = 3
+    uploads = [({'original_filename': f'{n}.pdf', 'storage_path': f'{n}.pdf'}, 'resume') for n in 'abc']
+    assert app._insert_resumes(cursor, 3, uploads) == [41, 43, 45]
+    assert [kind for kind, _, _ in cursor.statements] == ['executemany']
+
+
+def test_insert_resume_single_row_uses_lastrowid(monkeypatch):
+    monkeypatch.setattr(app, '_has_column', lambda cursor, table, column: False)
+    cursor = _ResumeCursor()
+    info = {'original_filename': 'cv.pdf', 'storage_path': 'a.pdf', 'file_size': 10}
+    assert app._insert_resume(cursor, 3, info) == 41
+    assert [kind for kind, _, _ in cursor.statements] == ['execute']
+
+
+def test_apply_and_upload_leave_schema_checks_to_startup():
+    for view in (app.apply_to_job, app.upload_resume_before_apply):
+        src = inspect.getsource(view)
+        assert 'ensure_schema_compatibility()' not in src
+        assert 'if not JOB_COLUMNS:' in src
+
+
+def test_apply_links_attachments_in_batches():
+    src = inspect.getsource(app.apply_to_job)
+    assert "FROM resumes WHERE applicant_id = %s AND resume_id IN ({id_placeholders})" in src
+    assert "WHERE resume_id = %s LIMIT 1', (rid_int,)" not in src
+    assert "cursor.executemany(\n                        'INSERT IGNORE INTO application_attachments" in src
+    assert "FROM application_attachments WHERE application_id = %s AND resume_id" not in src
+
+
+def test_apply_uses_cached_notification_columns():
+    src = inspect.getsource(app.apply_to_job)
+    assert "SHOW COLUMNS FROM notifications" not in src
+    assert "_table_columns(cursor, 'notifications')" in src
+
+
+def test_apply_notifications_reuse_loaded_job_and_session():
+    src = inspect.getsource(app.apply_to_job)
+    assert "JOIN jobs j ON j.job_id = %s" not in src
+    assert "session.get('user_email')" in src
+
+
+def test_send_email_async_runs_on_mail_pool(monkeypatch):
+    sent = []
+    monkeypatch.setattr(app, 'send_email', lambda *args: sent.append(args))
+    app.send_email_async('hr@example.com', 'Subject', 'Body').result(timeout=5)
+    assert sent == [('hr@example.com', 'Subject', 'Body', None)]
+    assert 'threading.Thread(target=send_email' not in inspect.getsource(app.apply_to_job)
+
+
+def test_apply_success_path_has_no_debug_prints():
+    src = inspect.getsource(app.apply_to_job)
+    assert "print(" not in src, "apply_to_job logs through log/apply_log, never print()"
+    assert "request.form.getlist(k)" not in src
+
+
+def test_apply_hr_notification_relies_on_unique_key():
+    src = inspect.getsource(app.apply_to_job)
+    assert "existing_notification" not in src
+    assert "INSERT IGNORE INTO notifications" in src
+
+
+def test_allowed_extension_set_is_parsed_once():
+    assert app._allowed_extension_set(' .PDF, docx ,') == frozenset({'pdf', 'docx'})
+    assert app._allowed_extension_set(None) == frozenset()
+    assert app._extension_allowed('cv.PDF', frozenset({'pdf'}))
+    assert app._extension_allowed('cv', frozenset({'pdf'}))
+    assert not app._extension_allowed('cv.exe', frozenset({'pdf'}))
+    assert "str(allowed_raw).split(',')" not in inspect.getsource(app.apply_to_job)
+
+
+def test_apply_parses_upload_rules_once_per_request():
+    src = inspect.getsource(app.apply_to_job)
+    assert src.count("_allowed_extension_set(") == 2
+    assert "allowed_extensions=allowed_set" in src
+    assert "allowed_exts = job.get('allowed_extensions')" not in src
+
+
+def test_apply_errors_go_through_rotating_handler():
+    handler = app._apply_error_handler
+    assert handler.maxBytes == 5_000_000 and handler.backupCount == 3
+    assert handler.filter(logging.LogRecord(app.apply_log.name, logging.ERROR, __file__, 1, 'x', None, None))
+    assert not handler.filter(logging.LogRecord(app.log.name, logging.ERROR, __file__, 1, 'x', None, None))
+    src = inspect.getsource(app.apply_to_job)
+    assert "open(log_file, 'a'" not in src
+    assert "apply_log.exception(" in src
+
+
+def test_apply_merges_attachment_ids_with_a_set():
+    src = inspect.getsource(app.apply_to_job)
+    assert "not in [str(x) for x in all_ids]" not in src
+    assert "seen_ids = {str(r) for r in all_ids}" in src
+
+
+def test_apply_edit_form_defers_legacy_file_sizes():
+    src = inspect.getsource(app.apply_to_job)
+    assert "_resume_file_size(" not in src
+    assert "url_for('resume_size'" in src
+    assert "_resume_file_size(row)" in inspect.getsource(app.resume_size)
+
+
+def test_hr_recipients_are_cached_for_ttl(monkeypatch):
+    class Cursor:
+        calls = 0
+
+        def execute(self, sql, params=None):
+            Cursor.calls += 1
+
+        def fetchall(self):
+            return [{'email': 'hr1@example.com'}, {'email': 'hr2@example.com'}]
+
+    monkeypatch.setattr(app, '_hr_recipients_cache', {'emails': (), 'expires': 0.0})
+    cursor = Cursor()
+    assert app._hr_recipients(cursor) == ('hr1@example.com', 'hr2@example.com')
+    assert app._hr_recipients(cursor) == ('hr1@example.com', 'hr2@example.com')
+    assert Cursor.calls == 1
+    app._hr_recipients_cache['expires'] = 0.0
+    app._hr_recipients(cursor)
+    assert Cursor.calls == 2
+
+
+def test_apply_filters_attachment_ids_without_per_id_try():
+    src = inspect.getsource(app.apply_to_job)
+    assert "rid_int = int(rid)" not in src
+    assert "if rid.strip().isdecimal()" in src
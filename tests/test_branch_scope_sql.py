@@ -13,3 +13,95 @@ def test_coalesce_branch_name_updated():
     # search for the display fallback in the app source
     src = open("c:\\xampp\\htdocs\\Recruitment System\\app.py", "r", encoding="utf-8").read()
     assert "COALESCE(b.branch_name, 'All Branches')" in src, "Branch display fallback should be 'All Branches'"
+
+
+def test_archive_applicant_scopes_the_update_itself():
+    src = inspect.getsource(app.archive_applicant)
+    assert "UPDATE applications a JOIN jobs j ON a.job_id = j.job_id SET" in src
+    assert "WHERE a.application_id = %s AND j.branch_id = %s" in src
+    assert "SELECT a.application_id\n" not in src, "authorization is folded into the UPDATE"
+
+
+def test_archive_and_restore_resolve_current_user_once():
+    for view in (app.restore_applicant, app.archive_applicant, app.delete_applicant_permanent):
+        src = inspect.getsource(view)
+        assert src.count("get_current_user()") == 1, view.__name__
+
+
+def test_archive_applicant_debug_context_is_lazy():
+    src = inspect.getsource(app.archive_applicant)
+    assert 'print(f"   Session keys' not in src
+    assert "if log.isEnabledFor(logging.DEBUG):" in src
+    assert "log.debug('   Request cookies: %s', dict(request.cookies))" in src
+
+
+def test_archived_redirect_target_keeps_role_safety():
+    with app.app.test_request_context():
+        hr_url = app.url_for('archived_applicants')
+        admin_url = app.url_for('admin_archived_applicants')
+        assert app._archived_redirect_target('Admin', None) == admin_url
+        assert app._archived_redirect_target('hr', admin_url) == hr_url
+        assert app._archived_redirect_target('hr', hr_url + '?page=2') == hr_url + '?page=2'
+        assert app._archived_redirect_target('admin', '/elsewhere') == admin_url
+    assert "url_for('archived_applicants')" not in inspect.getsource(app.archive_applicant)
+
+
+def test_archive_applicant_parses_accept_header_once():
+    assert inspect.getsource(app.archive_applicant).count("accept_mimetypes") == 1
+
+
+class _ArchiveDb:
+    """Fake connection: the scoped UPDATE matches nothing, the failure-path lookup returns `job_row`."""
+
+    def __init__(self, job_row):
+        self.job_row = job_row
+        self.rowcount = 0
+        self.commits = 0
+        self.rollbacks = 0
+        self.statements = []
+
+    def cursor(self, dictionary=False):
+        return self
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        pass
+
+    def execute(self, sql, params=()):
+        self.statements.append((sql, params))
+        self.rowcount = 0
+
+    def fetchone(self):
+        return self.job_row
+
+
+def _archive_as_branch_hr(monkeypatch, job_row):
+    db = _ArchiveDb(job_row)
+    monkeypatch.setattr(app, 'get_db', lambda: db)
+    monkeypatch.setattr(app, 'get_current_user', lambda: {'id': 1, 'role': 'hr', 'branch_id': 2})
+    monkeypatch.setattr(app, 'get_branch_scope', lambda user: 2)
+    monkeypatch.setitem(app._SCHEMA_CACHE, 'applications', frozenset({'status', 'archived_at'}))
+    headers = {'X-Requested-With': 'XMLHttpRequest'}
+    with app.app.test_request_context('/hr/applicants/11/archive', method='POST', headers=headers):
+        response, status = app.archive_applicant.__wrapped__(application_id=11)
+    return db, response.get_json(), status
+
+
+def test_archive_applicant_outside_branch_is_forbidden(monkeypatch):
+    db, payload, status = _archive_as_branch_hr(monkeypatch, {'job_branch_id': 7})
+    assert status == 403 and payload['error'] == 'Not authorized'
+    update_sql, update_params = db.statements[0]
+    assert update_sql.startswith('UPDATE applications a JOIN jobs j ON a.job_id = j.job_id SET')
+    assert update_params == (11, 2)
+    assert db.commits == 0 and db.rollbacks == 1
+
+
+def test_archive_applicant_missing_application_is_not_found(monkeypatch):
+    db, payload, status = _archive_as_branch_hr(monkeypatch, None)
+    assert status == 404 and payload['error'] == 'Application not found.'
+    assert db.commits == 0
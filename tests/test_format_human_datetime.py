@@ -0,0 +1,30 @@
+from datetime import date, datetime
+
+import app
+
+
+def test_format_human_datetime_accepts_driver_and_string_values():
+    expected = 'Mar 05, 2025 02:30 PM'
+    assert app.format_human_datetime(datetime(2025, 3, 5, 14, 30)) == expected
+    for value in ('2025-03-05 14:30:00', '2025-03-05 14:30:00.123456', '2025-03-05 14:30', '2025-03-05T14:30:00'):
+        assert app.format_human_datetime(value) == expected
+    assert app.format_human_datetime('2025-03-05') == 'Mar 05, 2025 12:00 AM'
+    assert app.format_human_datetime(date(2025, 3, 5)) == 'Mar 05, 2025 12:00 AM'
+
+
+def test_format_human_datetime_passes_through_unparseable_values():
+    assert app.format_human_datetime('TBD') == 'TBD'
+    assert app.format_human_datetime(None) == ''
+    assert app.format_human_datetime_filter('TBD') == 'TBD'
+
+
+def test_format_human_datetime_reuses_cached_results():
+    app._human_timestamp.cache_clear()
+    value = datetime(2025, 3, 5, 14, 30)
+    for _ in range(3):
+        app.format_human_datetime(value)
+        app.format_human_datetime_filter(value)
+    info = app._human_timestamp.cache_info()
+    assert info.misses == 1 and info.hits == 5
+    # A date and the matching midnight datetime are distinct cache keys with the same rendering
+    assert app.format_human_datetime(date(2025, 3, 6)) == app.format_human_datetime(datetime(2025, 3, 6))
@@ -0,0 +1,111 @@
+import inspect
+import app
+
+
+def test_mark_read_sql_drops_join_when_synced():
+    assert 'JOIN applications' not in app._notification_read_sql(True, False)
+    assert 'n.applicant_id = %s' in app._notification_read_sql(True, True)
+    assert 'a.applicant_id = %s' in app._notification_read_sql(False, True)
+    assert app._notification_read_sql(True, False) is app._notification_read_sql(True, False)
+
+
+def test_mark_read_handlers_negotiate_once():
+    for view in (app.mark_all_notifications_read, app.mark_notification_read):
+        src = inspect.getsource(view)
+        assert '_notification_read_sql(HAS_NOTIFICATION_APPLICANT_SYNC' in src
+        assert src.count('accept_mimetypes') == 1
+
+
+def test_notification_stats_sql_variants():
+    assert 'SUM(CASE' in app._notification_stats_sql(True, True)
+    assert '0 AS unread' in app._notification_stats_sql(False, True)
+    assert 'JOIN applications' in app._notification_stats_sql(True, False)
+    assert 'SHOW COLUMNS' not in inspect.getsource(app.applicant_account)
+
+
+def test_account_page_batches_its_queries():
+    src = inspect.getsource(app.applicant_account)
+    assert 'multi=True' in src
+    assert 'SELECT user_id FROM applicants WHERE applicant_id = %s LIMIT 1\',' not in src
+    assert 'COALESCE(%s, (SELECT user_id FROM applicants' in app._login_history_sql(frozenset({'login_time'}))
+
+
+def test_read_only_applicant_views_skip_rollback():
+    for view in (app.applicant_account, app.applicant_notifications):
+        assert 'rollback()' not in inspect.getsource(view)
+
+
+class _AccountDb:
+    """Fake connection: the batch fails on its second result set; per-section reruns fail for `broken`."""
+
+    def __init__(self, broken):
+        self.broken = broken
+        self.single_statements = []
+
+    def cursor(self, dictionary=False):
+        return self
+
+    def close(self):
+        pass
+
+    def _rows_for(self, sql):
+        if 'FROM applicants WHERE applicant_id' in sql:
+            return [{'full_name': 'Ada', 'email': 'ada@example.com', 'user_id': 5}]
+        if 'FROM auth_sessions' in sql:
+            return [{'login_time': None, 'logout_time': None, 'is_active': 1}]
+        return [{'total': 4, 'unread': 1}]
+
+    def execute(self, sql, params=(), multi=False):
+        if multi:
+            return self._batch(sql)
+        self.single_statements.append(sql)
+        if self.broken in sql:
+            raise RuntimeError(f'{self.broken} is broken')
+        self.rows = self._rows_for(sql)
+
+    def _batch(self, sql):
+        class Result:
+            with_rows = True
+
+            def __init__(self, rows):
+                self.rows = rows
+
+            def fetchall(self):
+                return self.rows
+
+        statements = sql.split(';\n')
+        yield Result(self._rows_for(statements[0]))
+        raise RuntimeError('second result set failed')
+
+    def fetchall(self):
+        return self.rows
+
+
+def _render_account(monkeypatch, broken):
+    db = _AccountDb(broken)
+    rendered = {}
+    monkeypatch.setattr(app, 'get_db', lambda: db)
+    monkeypatch.setattr(app, 'render_template', lambda template, **context: rendered.update(context) or template)
+    monkeypatch.setitem(app._SCHEMA_CACHE, 'auth_sessions', frozenset({'user_id', 'login_time', 'is_active'}))
+    monkeypatch.setitem(app._SCHEMA_CACHE, 'notifications', frozenset({'application_id', 'is_read'}))
+    with app.app.test_request_context('/applicant/account'):
+        app.session['user_id'] = 3
+        app.applicant_account.__wrapped__()
+        flashes = app.session.get('_flashes', [])
+    return db, rendered, flashes
+
+
+def test_account_page_degrades_a_failing_optional_section(monkeypatch):
+    db, rendered, flashes = _render_account(monkeypatch, 'FROM auth_sessions')
+    assert not flashes, "a failing login history must not replace the page with an error"
+    account = rendered['account']
+    assert account['full_name'] == 'Ada'
+    assert account['login_history'] == [] and account['active_sessions'] == 0
+    assert account['communications'] == {'total': 4, 'unread': 1}
+    assert len(db.single_statements) == 3
+
+
+def test_account_page_still_fails_without_the_profile(monkeypatch):
+    db, rendered, flashes = _render_account(monkeypatch, 'FROM applicants WHERE applicant_id')
+    assert rendered['account'] == {}
+    assert flashes and flashes[0][0] == 'error'
@@ -0,0 +1,19 @@
+import inspect
+
+import app
+
+
+def test_resume_listings_use_stored_sizes():
+    for view in (app.applicant_profile, app.view_applicant):
+        src = inspect.getsource(view)
+        assert "os.path.getsize" not in src
+        assert "{resume_size_expr} AS file_size_bytes" in src
+        assert "_resume_file_size(" in src
+
+
+def test_resume_file_size_prefers_stored_value(tmp_path, monkeypatch):
+    assert app._resume_file_size({'file_size_bytes': 42, 'file_path': 'missing.pdf'}) == 42
+    monkeypatch.setattr(app.app, 'instance_path', str(tmp_path))
+    (tmp_path / 'cv.pdf').write_bytes(b'12345')
+    assert app._resume_file_size({'file_size_bytes': None, 'file_path': 'cv.pdf'}) == 5
+    assert app._resume_file_size({'file_size_bytes': None, 'file_path': 'gone.pdf'}) == 0
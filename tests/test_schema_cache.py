@@ -0,0 +1,122 @@
+import inspect
+
+import app
+
+
+class _Missing(Exception):
+    errno = 1146
+
+
+class FakeCursor:
+    def __init__(self, tables):
+        self.tables = tables
+        self.queries = []
+        self._rows = []
+
+    def execute(self, sql, params=None):
+        self.queries.append(sql)
+        table = sql.split('`')[1]
+        if table not in self.tables:
+            raise _Missing(table)
+        self._rows = [{'Field': name} for name in self.tables[table]]
+
+    def fetchall(self):
+        return self._rows
+
+
+def test_schema_probe_runs_once_per_table():
+    app._invalidate_schema_cache()
+    cursor = FakeCursor({'interviews': ['interview_id', 'location']})
+    assert app._table_exists(cursor, 'interviews')
+    assert app._has_column(cursor, 'interviews', 'location')
+    assert not app._has_column(cursor, 'interviews', 'notes')
+    assert len(cursor.queries) == 1
+
+
+def test_missing_table_is_cached_until_invalidated():
+    app._invalidate_schema_cache()
+    cursor = FakeCursor({})
+    assert not app._table_exists(cursor, 'notifications')
+    assert not app._table_exists(cursor, 'notifications')
+    assert len(cursor.queries) == 1
+
+    app._invalidate_schema_cache('notifications', _Missing())
+    cursor.tables['notifications'] = ['notification_id']
+    assert app._table_exists(cursor, 'notifications')
+    app._invalidate_schema_cache()
+
+
+def test_saved_jobs_views_skip_ddl_and_schema_probes():
+    save_src = inspect.getsource(app.save_job)
+    assert "CREATE TABLE" not in save_src
+    assert "SELECT applicant_id FROM saved_jobs" not in save_src
+    assert "ON DUPLICATE KEY UPDATE saved_at = saved_at" in save_src
+    src = inspect.getsource(app.saved_jobs)
+    assert "DESCRIBE saved_jobs" not in src
+    assert "SHOW TABLES LIKE 'saved_jobs'" not in src
+    assert "ensure_schema_compatibility()" not in src
+    schema_src = inspect.getsource(app.ensure_schema_compatibility)
+    assert "saved_jobs_sql" in schema_src
+    assert "'saved_jobs', 'unique_saved_job', ('applicant_id', 'job_id'), unique=True" in schema_src
+
+
+def test_archive_actions_use_cached_archived_at_probe():
+    for view in (app.archive_applicant, app.applicants, app.restore_applicant):
+        src = inspect.getsource(view)
+        assert "SHOW COLUMNS FROM applications" not in src
+        assert "_has_column(cursor, 'applications', 'archived_at')" in src
+
+
+def test_soft_archive_sql_follows_cached_columns(monkeypatch):
+    monkeypatch.setitem(app._SCHEMA_CACHE, 'applications', frozenset({'status', 'archived_at'}))
+    sql = app._soft_archive_application_sql(FakeCursor({}))
+    assert sql == "UPDATE applications a SET a.status = %s, a.archived_at = NULL WHERE a.application_id IN (%s)"
+
+
+def test_bulk_archive_sql_binds_every_id_and_branch_scope(monkeypatch):
+    monkeypatch.setitem(app._SCHEMA_CACHE, 'applications', frozenset({'status'}))
+    sql = app._soft_archive_application_sql(FakeCursor({}), 3, branch_scoped=True)
+    assert sql == (
+        "UPDATE applications a JOIN jobs j ON a.job_id = j.job_id SET a.status = %s "
+        "WHERE a.application_id IN (%s, %s, %s) AND j.branch_id = %s"
+    )
+    for view in (app.restore_applicant, app.delete_applicant_permanent):
+        assert "_form_application_ids()" in inspect.getsource(view)
+
+
+def test_saved_jobs_sql_binds_filters_and_paging(monkeypatch):
+    columns = frozenset({'job_id', 'job_title', 'job_description', 'status', 'branch_id'})
+    monkeypatch.setattr(app, 'JOB_COLUMNS', set(columns))
+    sql = app._saved_jobs_sql(columns)
+    assert sql is app._saved_jobs_sql(columns)
+    # applicant, statuses, branch x2, position x2, keyword x4, limit, offset
+    assert sql.count('%s') == 1 + len(app.PUBLISHABLE_JOB_STATUSES) + 2 + 2 + 4 + 2
+    assert 'LIMIT %s OFFSET %s' in sql and 'LEFT(j.job_description, 200)' in sql
+
+
+def test_archived_applicants_cache_short_circuits_and_invalidates(monkeypatch):
+    monkeypatch.setattr(app, 'get_current_user', lambda: None)
+    monkeypatch.setattr(app, '_archived_applicants_cache', {None: (float('inf'), (['row'], ['branch']))})
+    monkeypatch.setattr(app, 'get_db', lambda: (_ for _ in ()).throw(AssertionError('cache hit must not touch the DB')))
+    assert app.fetch_archived_applicants_data() == (['row'], ['branch'])
+    app._invalidate_archived_applicants_cache()
+    assert app._archived_applicants_cache == {}
+    for view in (app.archive_applicant, app.restore_applicant, app.delete_applicant_permanent, app.delete_applicant_now):
+        assert "_invalidate_archived_applicants_cache()" in inspect.getsource(view)
+
+
+def test_execute_and_commit_sends_statement_and_commit_together():
+    class Result:
+        def __init__(self, rowcount):
+            self.rowcount = rowcount
+
+    class MultiCursor:
+        def execute(self, sql, params, multi=False):
+            self.sql, self.params, self.multi = sql, params, multi
+            return iter((Result(1), Result(0)))
+
+    cursor = MultiCursor()
+    assert app._execute_and_commit(cursor, 'DELETE FROM saved_jobs WHERE job_id = %s', (7,)) == 1
+    assert cursor.multi and cursor.sql == 'DELETE FROM saved_jobs WHERE job_id = %s;\nCOMMIT'
+    for view in (app.save_job, app.unsave_job):
+        assert "db.commit()" not in inspect.getsource(view)
@@ -0,0 +1,27 @@
+import tempfile
+
+from utils.helpers import _stream_fileno, _write_upload
+
+
+def _spooled(payload, max_size):
+    stream = tempfile.SpooledTemporaryFile(max_size=max_size, mode="rb+")
+    stream.write(payload)
+    stream.seek(0)
+    return stream
+
+
+def test_in_memory_upload_is_copied_without_rollover(tmp_path):
+    payload = b"%PDF-1.4 small"
+    stream = _spooled(payload, max_size=1024)
+    assert _stream_fileno(stream) is None
+    _write_upload(stream, tmp_path / "small.pdf", len(payload))
+    assert (tmp_path / "small.pdf").read_bytes() == payload
+    assert stream._rolled is False
+
+
+def test_disk_backed_upload_is_written_in_full(tmp_path):
+    payload = b"x" * (3 * 1024 * 1024 + 17)
+    stream = _spooled(payload, max_size=1024)
+    assert _stream_fileno(stream) is not None
+    _write_upload(stream, tmp_path / "large.pdf", len(payload))
+    assert (tmp_path / "large.pdf").read_bytes() == payload
@@ -1,31 +1,62 @@
+import threading
+
 import mysql.connector
-from mysql.connector import Error
+from mysql.connector import Error, PoolError, pooling
 from flask import g, current_app
 
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _connection_config():
+    return dict(
+        host=current_app.config["MYSQL_HOST"],
+        user=current_app.config["MYSQL_USER"],
+        password=current_app.config["MYSQL_PASSWORD"],
+        database=current_app.config["MYSQL_DB"],
+        autocommit=False,
+        connect_timeout=3,  # Fast timeout - fail quickly if MySQL not running
+        raise_on_warnings=False,
+        use_unicode=True,
+        charset="utf8mb4",
+        connection_timeout=3,
+        buffered=True,
+    )
+
+
+def _get_pool():
+    """Create the process-wide connection pool on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = pooling.MySQLConnectionPool(
+                    pool_name=current_app.config.get("MYSQL_POOL_NAME", "recruit"),
+                    # mysql-connector refuses pools larger than CNX_POOL_MAXSIZE (32)
+                    pool_size=max(1, min(current_app.config.get("MYSQL_POOL_SIZE", 10), pooling.CNX_POOL_MAXSIZE)),
+                    pool_reset_session=True,
+                    **_connection_config(),
+                )
+    return _pool
+
 
 def get_db():
     if "db" not in g:
         try:
-            # Use connection pooling and faster timeout
-            g.db = mysql.connector.connect(
-                host=current_app.config["MYSQL_HOST"],
-                user=current_app.config["MYSQL_USER"],
-                password=current_app.config["MYSQL_PASSWORD"],
-                database=current_app.config["MYSQL_DB"],
-                autocommit=False,
-                connect_timeout=3,  # Fast timeout - fail quickly if MySQL not running
-                raise_on_warnings=False,
-                use_unicode=True,
-                charset="utf8mb4",
-                connection_timeout=3,
-                buffered=True,
-            )
-            # Test connection immediately
-            g.db.ping(reconnect=False, attempts=1, delay=0)
+            try:
+                # Reuse a pooled connection; close() hands it back instead of disconnecting
+                g.db = _get_pool().get_connection()
+            except PoolError:
+                # Pool exhausted under load - fall back to a dedicated connection for this request
+                g.db = mysql.connector.connect(**_connection_config())
+            # Pooled connections may have idled past MySQL's wait_timeout; reconnect once if so
+            g.db.ping(reconnect=True, attempts=1, delay=0)
         except Error as e:
+            g.pop("db", None)
             print(f"⚠️ Database connection error: {e}")
             return None
         except Exception as e:
+            g.pop("db", None)
             print(f"⚠️ Unexpected database error: {e}")
             return None
     return g.db
@@ -1,5 +1,6 @@
 import mimetypes
 import os
+import shutil
 import uuid
 import stat
 from werkzeug.utils import secure_filename
@@ -8,6 +9,9 @@ from flask import current_app
 # Keep reasonable file size limit for uploads (default)
 DEFAULT_MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
+# Copy buffer for uploads that are still held in memory
+UPLOAD_COPY_CHUNK = 1024 * 1024
+
 # Allowed MIME types for common document files
 ALLOWED_MIMETYPES = {
     "application/pdf",
@@ -21,7 +25,7 @@ def _normalize_allowed_exts(allowed):
     """Normalize allowed extensions input into a set of lowercase extensions without dots."""
     if not allowed:
         return set(current_app.config.get("ALLOWED_EXTENSIONS", set()))
-    if isinstance(allowed, (list, set, tuple)):
+    if isinstance(allowed, (list, set, frozenset, tuple)):
         parts = allowed
     else:
         parts = [p.strip() for p in str(allowed).split(",") if p.strip()]
@@ -98,6 +102,42 @@ def scan_file_for_viruses(file_path: str, max_size_bytes: int = None) -> bool:
         return False
 
 
+def _stream_fileno(stream):
+    """Return the OS file descriptor behind an upload stream, or None while it is still in memory."""
+    if getattr(stream, "_rolled", True) is False:
+        # SpooledTemporaryFile.fileno() would force an in-memory upload onto disk first
+        return None
+    try:
+        return stream.fileno()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _write_upload(stream, file_path, file_size):
+    """Write an upload to file_path with os.sendfile when it is disk-backed, else one buffered copy."""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(file_path, flags, stat.S_IRUSR | stat.S_IWUSR)
+    with os.fdopen(fd, "wb", buffering=0) as dst:
+        src_fd = _stream_fileno(stream)
+        if src_fd is not None and hasattr(os, "sendfile"):
+            offset = 0
+            try:
+                while offset < file_size:
+                    sent = os.sendfile(dst.fileno(), src_fd, offset, file_size - offset)
+                    if not sent:
+                        break
+                    offset += sent
+            except OSError:
+                pass
+            if offset == file_size:
+                return
+            # Kernel copy unavailable or short: start over with a plain copy
+            dst.seek(0)
+            dst.truncate()
+        stream.seek(0)
+        shutil.copyfileobj(stream, dst, UPLOAD_COPY_CHUNK)
+
+
 def save_uploaded_file(file, applicant_id, allowed_extensions=None, max_file_size_mb=None):
     if not file or not file.filename:
         return None, "No file provided."
@@ -136,7 +176,7 @@ def save_uploaded_file(file, applicant_id, allowed_extensions=None, max_file_siz
 
     file_path = os.path.join(upload_folder, unique_filename)
     try:
-        file.save(file_path)
+        _write_upload(file.stream, file_path, file_size)
     except Exception as e:
         return None, f"Failed to save file: {str(e)}"
 